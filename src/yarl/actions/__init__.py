@@ -8,12 +8,13 @@ Similarly, [`TakeStairsAction`][yarl.actions.TakeStairsAction] can be used by an
 to trigger the generation of a new floor in the game.
 """
 
-from .base_action import Action
+from .base_action import Action, ActionStatus
 from .bump_action import BumpAction
 from .consume_item_action import ConsumeItemAction
 from .consume_targeted_item_action import ConsumeTargetedItemAction
 from .directed_action import DirectedAction
 from .drop_item_from_inventory_action import DropItemFromInventoryAction
+from .level_up_action import LevelUpAction
 from .melee_action import MeleeAction
 from .movement_action import MovementAction
 from .pickup_action import PickupAction
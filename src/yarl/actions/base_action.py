@@ -1,13 +1,35 @@
 from __future__ import annotations
 
+from enum import Enum, auto
 from typing import TYPE_CHECKING
 
+from yarl.exceptions import ImpossibleActionException
+
 if TYPE_CHECKING:
     from yarl.engine import Engine
     from yarl.entity import Entity
     from yarl.map import GameMap
 
 
+class ActionStatus(Enum):
+    """Outcomes of performing an action via [`Action.try_perform()`][yarl.actions.Action.try_perform]."""
+
+    PERFORMED = auto()
+    """The action was performed."""
+
+    WAITING = auto()
+    """The invoking entity is waiting to move or attack, so nothing was done."""
+
+    BLOCKED = auto()
+    """The destination of the action is blocked, so nothing was done."""
+
+    NO_TARGET = auto()
+    """There is no target for the action, so nothing was done."""
+
+    IMPOSSIBLE = auto()
+    """The action is not possible."""
+
+
 class Action:
     """Base class for actions.
 
@@ -51,3 +73,24 @@ class Action:
         By default, it raises `NotImplementedError`.
         """
         raise NotImplementedError()
+
+    def try_perform(self) -> ActionStatus:
+        """Method to perform the action and report its outcome instead of raising.
+
+        It is meant for hot paths like AIs, where failing actions are common
+        and the cost of raising and catching exceptions adds up. Player-facing
+        code should use `perform()` so that failures can be shown as messages.
+
+        By default, it calls `perform()` and converts an `ImpossibleActionException`
+        into `ActionStatus.IMPOSSIBLE`. Subclasses can override it to avoid
+        raising in the first place.
+
+        Returns:
+            Outcome of the action.
+        """
+        try:
+            self.perform()
+        except ImpossibleActionException:
+            return ActionStatus.IMPOSSIBLE
+
+        return ActionStatus.PERFORMED
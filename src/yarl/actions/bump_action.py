@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from .base_action import ActionStatus
 from .directed_action import DirectedAction
 from .melee_action import MeleeAction
 from .movement_action import MovementAction
@@ -19,14 +20,14 @@ class BumpAction(DirectedAction):
         dy (int): Deviation in the y-direction from the invoking entity's current location.
     """
 
-    def perform(self) -> None:
-        """Method which either attacks the target or moves the invoking entity.
+    def get_action(self) -> MeleeAction | MovementAction:
+        """Method to obtain the action that should be performed.
 
-        Raises:
-            ImpossibleActionException: If there is no target and moving the invoking entity
-                to the destination is not possible.
+        Returns:
+            `MeleeAction` if there is a blocking entity at the destination
+                and `MovementAction` otherwise.
         """
-        action = (
+        return (
             MeleeAction(engine=self.engine, entity=self.entity, dx=self.dx, dy=self.dy)
             if self.blocking_entity is not None
             and self.blocking_entity is not self.entity
@@ -35,4 +36,20 @@ class BumpAction(DirectedAction):
             )
         )
 
-        action.perform()
+    def try_perform(self) -> ActionStatus:
+        """Method which either attacks the target or moves the invoking entity
+        without raising when the destination is blocked.
+
+        Returns:
+            Outcome of the attack or the movement.
+        """
+        return self.get_action().try_perform()
+
+    def perform(self) -> None:
+        """Method which either attacks the target or moves the invoking entity.
+
+        Raises:
+            ImpossibleActionException: If there is no target and moving the invoking entity
+                to the destination is not possible.
+        """
+        self.get_action().perform()
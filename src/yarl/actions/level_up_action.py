@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from yarl.exceptions import ImpossibleActionException
+
+from .base_action import Action
+
+if TYPE_CHECKING:
+    from yarl.engine import Engine
+    from yarl.entity import ActiveEntity
+
+
+class LevelUpAction(Action):
+    """Action which levels up the invoking entity, optionally boosting one of its stats.
+
+    Attributes:
+        engine (Engine): Engine representing the current game.
+
+        entity (ActiveEntity): Entity that invoked this action.
+
+        boost (str | None): Stat to boost. It should be one of `'max_hp'`, `'power'`,
+            `'defense'` or `None` to level up without a boost.
+
+        amount (int): Amount the stat should be boosted by.
+    """
+
+    def __init__(
+        self,
+        engine: Engine,
+        entity: ActiveEntity,
+        boost: str | None = None,
+        amount: int = 0,
+    ) -> None:
+        """Create a level up action.
+
+        Args:
+            engine: Engine representing the current game.
+
+            entity: Entity that invoked this action.
+
+            boost: Stat to boost. It should be one of `'max_hp'`, `'power'`,
+                `'defense'` or `None` to level up without a boost. Defaults to `None`.
+
+            amount: Amount the stat should be boosted by. Defaults to 0.
+        """
+        super().__init__(engine=engine, entity=entity)
+        self.entity: ActiveEntity
+        self.boost = boost
+        self.amount = amount
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(boost={self.boost!r}, amount={self.amount})"
+
+    def __str__(self) -> str:
+        return self.__repr__()
+
+    def perform(self) -> None:
+        """Method to level up the invoking entity.
+
+        Raises:
+            ImpossibleActionException: If the invoking entity cannot level up.
+        """
+        level = self.entity.level
+
+        if not level.can_level_up:
+            raise ImpossibleActionException("You cannot level up yet.")
+
+        if self.boost is None:
+            level.level_up()
+        else:
+            level.level_up_with_boost(boost=self.boost, amount=self.amount)
+
+        self.engine.add_to_message_log(
+            text=f"You advanced to level {level.current_level}"
+        )
@@ -2,8 +2,9 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
-from yarl.interface.color import COLORS
+from yarl.events import DamageEvent, DamageSource, DeathEvent, XPEvent
 
+from .base_action import ActionStatus
 from .directed_action import DirectedAction
 
 if TYPE_CHECKING:
@@ -30,43 +31,65 @@ class MeleeAction(DirectedAction):
         x, y = self.destination
         return self.game_map.get_active_entity(x=x, y=y)
 
-    def perform(self) -> None:
+    def try_perform(self) -> ActionStatus:
         """Method to attack the target at the destination associated with the action
         via the invoking entity's `fighter` instance.
+
+        Returns:
+            `ActionStatus.WAITING` if the invoking entity is waiting to attack,
+                `ActionStatus.NO_TARGET` if there is no target at the destination,
+                and `ActionStatus.PERFORMED` otherwise.
         """
-        entity, target = self.entity, self.target
+        entity = self.entity
 
-        if entity.fighter.is_waiting_to_attack or not target:
-            return
+        if entity.fighter.is_waiting_to_attack:
+            return ActionStatus.WAITING
 
-        target_alive, damage = entity.fighter.attack(target)
+        target = self.target
 
-        attack_desc = f"{entity.name.capitalize()} attacks {target.name}"
-        attack_color = (
-            COLORS["gray88"] if entity is self.engine.player else COLORS["snow1"]
-        )
+        if not target:
+            return ActionStatus.NO_TARGET
 
-        msg = (
-            f"{attack_desc} but does no damage."
-            if damage <= 0
-            else f"{attack_desc} for {damage} hit points."
-        )
+        target_alive, damage = entity.fighter.attack(target)
 
-        self.engine.add_to_message_log(text=msg, fg=attack_color)
+        event_bus = self.engine.event_bus
+        event_bus.publish(
+            DamageEvent(
+                source=DamageSource.MELEE,
+                attacker=entity,
+                attacker_name=entity.name,
+                target=target,
+                target_name=target.name,
+                damage=damage,
+            )
+        )
 
         if target_alive:
-            return
-
-        msg, fg = (
-            ("You died!", COLORS["indianred"])
-            if target is self.engine.player
-            else (f"{target.name} is dead!", COLORS["coral"])
+            return ActionStatus.PERFORMED
+
+        event_bus.publish(
+            DeathEvent(
+                source=DamageSource.MELEE,
+                entity=target,
+                name=target.name,
+                killer=entity,
+                killer_name=entity.name,
+            )
         )
-
-        self.engine.add_to_message_log(text=msg, fg=fg)
         target.name = f"remains of {target.name}"
 
         if entity is self.engine.player:
             xp = target.level.xp_given
             entity.level.add_xp(xp=xp)
-            self.engine.add_to_message_log(text=f"You gain {xp} experience points.")
+            event_bus.publish(XPEvent(entity=entity, xp=xp))
+
+        return ActionStatus.PERFORMED
+
+    def perform(self) -> None:
+        """Method to attack the target at the destination associated with the action
+        via the invoking entity's `fighter` instance.
+
+        Nothing is done if the invoking entity is waiting to attack
+        or there is no target.
+        """
+        self.try_perform()
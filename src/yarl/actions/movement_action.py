@@ -1,7 +1,8 @@
 from __future__ import annotations
 
-from yarl.exceptions import CollisionWithEntityException, ImpossibleActionException
+from yarl.exceptions import ImpossibleActionException
 
+from .base_action import ActionStatus
 from .directed_action import DirectedAction
 
 
@@ -18,18 +19,38 @@ class MovementAction(DirectedAction):
         dy (int): Deviation in the y-direction from the invoking entity's current location.
     """
 
-    def perform(self) -> None:
-        """Method to move the invoking entity to the destination associated with the action.
+    def try_perform(self) -> ActionStatus:
+        """Method to move the invoking entity to the destination associated with the action
+        without raising when the destination is blocked.
 
-        Raises:
-            ImpossibleActionException: If the destination is blocked in some way.
+        Returns:
+            `ActionStatus.WAITING` if the invoking entity is waiting to move,
+                `ActionStatus.BLOCKED` if the destination is out of bounds, not walkable
+                or has a blocking entity, and `ActionStatus.PERFORMED` otherwise.
         """
         if self.entity.is_waiting_to_move:
-            return
+            return ActionStatus.WAITING
 
         dest_x, dest_y = self.destination
+        game_map = self.game_map
+
+        if (
+            not game_map.in_bounds(x=dest_x, y=dest_y)
+            or not game_map.tiles["walkable"][dest_x, dest_y]
+            or game_map.get_blocking_entity(x=dest_x, y=dest_y) is not None
+        ):
+            return ActionStatus.BLOCKED
+
+        game_map.move_entity(
+            entity=self.entity, x=dest_x, y=dest_y, check_blocking=False
+        )
+        return ActionStatus.PERFORMED
 
-        try:
-            self.game_map.move_entity(entity=self.entity, x=dest_x, y=dest_y)
-        except (CollisionWithEntityException, IndexError):
+    def perform(self) -> None:
+        """Method to move the invoking entity to the destination associated with the action.
+
+        Raises:
+            ImpossibleActionException: If the destination is blocked in some way.
+        """
+        if self.try_perform() is ActionStatus.BLOCKED:
             raise ImpossibleActionException("That way is blocked.")
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
+from yarl.events import PickupEvent
 from yarl.exceptions import ImpossibleActionException
 
 from .base_action import Action
@@ -118,6 +119,6 @@ class PickupAction(Action):
             self.game_map.remove_entity(entity=item)
 
             if equipped is False:
-                self.engine.add_to_message_log(
-                    text=f"You picked up the item {item.name}."
+                self.engine.event_bus.publish(
+                    PickupEvent(entity=self.entity, item=item, item_name=item.name)
                 )
@@ -0,0 +1,147 @@
+"""This module defines the class that is used to run enemy turns within a time budget."""
+
+from __future__ import annotations
+
+import time
+from collections import deque
+from typing import TYPE_CHECKING
+
+from yarl.exceptions import ImpossibleActionException
+from yarl.map.movement_batch import MovementBatch
+
+if TYPE_CHECKING:
+    from yarl.engine import Engine
+    from yarl.entity import ActiveEntity
+
+
+class AIExecutor:
+    """Class to run the AIs of the enemies on the current floor, one turn at a time.
+
+    A turn is started with `start_turn()`, which takes a snapshot of the enemies that
+    should act in the turn, in scheduler order. The turn is then advanced with `run()`,
+    which performs the AIs one after the other until all enemies have acted or the
+    time budget has been used up. In the latter case, the next call to `run()` resumes
+    the turn from the next enemy, which allows a turn to be spread over multiple frames.
+
+    The scheduler order is the order of the locations of the enemies at the start
+    of the turn, from top to bottom and left to right.
+
+    The moves of the enemies are collected in a movement batch while the turn is
+    in progress and applied simultaneously once all enemies have acted, with
+    earlier enemies in scheduler order taking precedence in conflicts.
+
+    If the engine has a recorder attached, each turn is recorded once it is complete.
+
+    Attributes:
+        engine (Engine): Engine representing the current game.
+
+        queue (deque[ActiveEntity]): Enemies which are yet to act in the current turn.
+
+        movement_batch (MovementBatch | None): Moves submitted in the current turn.
+            It is `None` when no turn is in progress.
+    """
+
+    def __init__(self, engine: Engine) -> None:
+        """Create an AI executor.
+
+        Args:
+            engine: Engine representing the current game.
+        """
+        self.engine = engine
+        self.queue: deque[ActiveEntity] = deque()
+        self.movement_batch: MovementBatch | None = None
+        self._turn_active = False
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(in_progress={self.in_progress})"
+
+    def __str__(self) -> str:
+        return self.__repr__()
+
+    @property
+    def in_progress(self) -> bool:
+        """Indicates whether a turn has been started but not completed yet."""
+        return self._turn_active
+
+    def start_turn(self) -> None:
+        """Method to start a new turn for all enemies on the current floor.
+
+        Any enemies which have not acted in the previous turn are discarded,
+        but the moves submitted by those that did act are applied.
+        """
+        if self.movement_batch is not None:
+            self.movement_batch.resolve()
+
+        player = self.engine.player
+
+        enemies = (
+            entity
+            for entity in self.engine.game_map.active_entities
+            if entity is not player and entity.ai_cls is not None
+        )
+
+        self.queue = deque(sorted(enemies, key=lambda entity: (entity.y, entity.x)))
+        self.movement_batch = MovementBatch(game_map=self.engine.game_map)
+        self._turn_active = True
+
+    def perform(self, entity: ActiveEntity) -> None:
+        """Method to perform the AI of a single enemy.
+
+        The AI is initialized from the enemy's `ai_cls` if it has not been
+        initialized yet. Enemies which have died or lost their AI since the
+        start of the turn are skipped.
+
+        Args:
+            entity: Enemy whose AI should be performed.
+        """
+        if entity.ai_cls is None or not entity.is_alive:
+            return
+
+        if entity.ai is None:
+            entity.ai = entity.ai_cls(engine=self.engine, entity=entity)
+
+        try:
+            entity.ai.perform()
+        except ImpossibleActionException:
+            pass
+
+    def run(self, time_budget: float | None = None) -> bool:
+        """Method to advance the current turn.
+
+        At least one enemy is performed per call so that a turn always makes
+        progress, even with a very small budget.
+
+        Args:
+            time_budget: Maximum amount of time (in seconds) that should be spent
+                performing AIs. When set to `None`, the turn is run to completion.
+
+        Returns:
+            `True` if the turn is complete (or no turn was in progress),
+                `False` if there are enemies left to act.
+        """
+        queue = self.queue
+
+        deadline = None if time_budget is None else time.perf_counter() + time_budget
+
+        while queue:
+            self.perform(entity=queue.popleft())
+
+            if deadline is not None and time.perf_counter() >= deadline:
+                break
+
+        if queue:
+            return False
+
+        if self.movement_batch is not None:
+            self.movement_batch.resolve()
+            self.movement_batch = None
+
+        if self._turn_active and self.engine.recorder is not None:
+            self.engine.recorder.record_enemy_turn()
+
+        self._turn_active = False
+        return True
+
+    def finish(self) -> None:
+        """Method to run the current turn, if any, to completion."""
+        self.run(time_budget=None)
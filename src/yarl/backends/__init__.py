@@ -0,0 +1,9 @@
+"""Package for the ways a game can be shown and played, like a window or a terminal.
+
+The terminal backend is in [`yarl.backends.ansi`][yarl.backends.ansi] and is not
+imported here, since it relies on modules that only exist on POSIX systems.
+"""
+
+
+from .base import Backend
+from .tcod_backend import TcodBackend
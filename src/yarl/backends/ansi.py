@@ -0,0 +1,359 @@
+"""This module defines the backend that shows the game in a terminal with ANSI
+escape sequences, so that it can be played over SSH or without a display.
+
+The terminal is put in raw mode with `termios`, so the module can only be
+imported on POSIX systems.
+
+Examples:
+
+    Playing in the terminal:
+
+    ```pycon
+    >>> from tcod.console import Console
+    >>> from yarl.backends.ansi import AnsiBackend
+    >>> from yarl.game import Game
+    >>> with AnsiBackend() as backend:
+    ...     console = Console(width=100, height=50, order="F")
+    ...     Game(map_width=80, map_height=43).run(console=console, backend=backend)
+    ```
+"""
+
+from __future__ import annotations
+
+import os
+import select
+import sys
+import termios
+import tty
+from typing import TYPE_CHECKING, BinaryIO
+
+import numpy as np
+import tcod.event
+from tcod.event import KeySym, Modifier
+
+from .base import Backend
+
+if TYPE_CHECKING:
+    from tcod.console import Console
+    from tcod.event import Event
+
+
+ESCAPE_SEQUENCES: dict[bytes, KeySym] = {
+    b"\x1b[A": KeySym.UP,
+    b"\x1b[B": KeySym.DOWN,
+    b"\x1b[C": KeySym.RIGHT,
+    b"\x1b[D": KeySym.LEFT,
+    b"\x1bOA": KeySym.UP,
+    b"\x1bOB": KeySym.DOWN,
+    b"\x1bOC": KeySym.RIGHT,
+    b"\x1bOD": KeySym.LEFT,
+    b"\x1b[H": KeySym.HOME,
+    b"\x1b[F": KeySym.END,
+    b"\x1bOH": KeySym.HOME,
+    b"\x1bOF": KeySym.END,
+    b"\x1b[1~": KeySym.HOME,
+    b"\x1b[4~": KeySym.END,
+    b"\x1b[5~": KeySym.PAGEUP,
+    b"\x1b[6~": KeySym.PAGEDOWN,
+    b"\x1b[3~": KeySym.DELETE,
+    b"\x1b[21~": KeySym.F10,
+    b"\x1b[23~": KeySym.F11,
+}
+"""Keys sent by terminals as escape sequences."""
+
+CONTROL_KEYS: dict[int, KeySym] = {
+    0x08: KeySym.BACKSPACE,
+    0x09: KeySym.TAB,
+    0x0A: KeySym.RETURN,
+    0x0D: KeySym.RETURN,
+    0x1B: KeySym.ESCAPE,
+    0x7F: KeySym.BACKSPACE,
+}
+"""Keys sent by terminals as control characters."""
+
+SHIFTED_KEYS: dict[str, str] = dict(
+    zip('~!@#$%^&*()_+{}|:"<>?', "`1234567890-=[]\\;',./")
+)
+"""Characters typed with shift, by the key they are typed with on a US keyboard."""
+
+
+def parse_input(data: bytes) -> list[Event]:
+    """Function to turn the bytes read from a terminal into key presses.
+
+    Ctrl+C is turned into a quit event, since signals are disabled in raw mode.
+    Unknown escape sequences are skipped.
+
+    Args:
+        data: Bytes read from the terminal.
+
+    Returns:
+        Events for the keys pressed, in order.
+    """
+    events: list[Event] = []
+    i = 0
+
+    while i < len(data):
+        byte = data[i]
+
+        if byte == 0x1B and i + 1 < len(data) and data[i + 1] in b"[O":
+            end = i + 2
+
+            # Sequences end with a byte in the range @ to ~
+            while end < len(data) and not 0x40 <= data[end] <= 0x7E:
+                end += 1
+
+            sym = ESCAPE_SEQUENCES.get(data[i : end + 1])
+            i = end + 1
+
+            if sym is not None:
+                events.append(_key(sym=sym))
+
+            continue
+
+        i += 1
+
+        if byte == 0x03:
+            events.append(tcod.event.Quit())
+        elif byte in CONTROL_KEYS:
+            events.append(_key(sym=CONTROL_KEYS[byte]))
+        elif 0x20 <= byte < 0x7F:
+            char = chr(byte)
+            mod = Modifier.NONE
+
+            if char.isupper():
+                char, mod = char.lower(), Modifier.LSHIFT
+            elif char in SHIFTED_KEYS:
+                char, mod = SHIFTED_KEYS[char], Modifier.LSHIFT
+
+            events.append(_key(sym=KeySym(ord(char)), mod=mod))
+
+    return events
+
+
+def _split_incomplete(data: bytes) -> tuple[bytes, bytes]:
+    # A read can end in the middle of an escape sequence, whose rest comes with
+    # the next read. A lone escape is the escape key, so it is not held back.
+    start = data.rfind(b"\x1b")
+
+    if start == -1 or start + 1 == len(data) or data[start + 1] not in b"[O":
+        return data, b""
+
+    if any(0x40 <= byte <= 0x7E for byte in data[start + 2 :]):
+        return data, b""
+
+    return data[:start], data[start:]
+
+
+def _key(sym: KeySym, mod: Modifier = Modifier.NONE) -> tcod.event.KeyDown:
+    return tcod.event.KeyDown(scancode=0, sym=sym, mod=mod)
+
+
+class AnsiRenderer:
+    """Class to turn consoles into ANSI escape sequences for a terminal.
+
+    Each console is compared to the previous one cell by cell and only the cells
+    that changed are written, so the output scales with what changed rather than
+    with the size of the console. Changed cells on the same row that are close
+    to each other are written in a single run, since moving the cursor costs
+    more than rewriting a few cells. Colors are only written when they differ
+    from the previous cell written. Colors are written as 24-bit colors.
+
+    Attributes:
+        max_gap (int): Maximum number of unchanged cells that are rewritten to
+            join two runs of changed cells.
+
+        changed_cells (int): Number of cells that changed in the last frame.
+    """
+
+    def __init__(self, max_gap: int = 4) -> None:
+        """Create a renderer.
+
+        Args:
+            max_gap: Maximum number of unchanged cells that should be rewritten
+                to join two runs of changed cells. Defaults to 4.
+        """
+        self.max_gap = max_gap
+        self.changed_cells = 0
+        self._previous: np.ndarray | None = None
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(max_gap={self.max_gap})"
+
+    def __str__(self) -> str:
+        return self.__repr__()
+
+    def reset(self) -> None:
+        """Method to forget the previous frame, so that the next one is written in full.
+
+        It should be used when the terminal has been cleared or resized.
+        """
+        self._previous = None
+
+    def render(self, console: Console) -> str:
+        """Method to obtain the output that updates the terminal to show a console.
+
+        Args:
+            console: Console to show.
+
+        Returns:
+            Escape sequences and characters to write to the terminal. It is empty
+                if nothing has changed.
+        """
+        # Rows first, so that cells of a row are next to each other. It must be
+        # a copy, since the console is drawn to again for the next frame.
+        tiles = console.rgba.T.copy(order="C")
+        previous = self._previous
+        height, width = tiles.shape
+
+        out: list[str] = []
+
+        if previous is None or previous.shape != tiles.shape:
+            changed = np.ones((height, width), dtype=bool)
+            out.append("\x1b[0m\x1b[2J")
+        else:
+            raw = tiles.view(np.uint8).reshape(height, width, -1)
+            changed = (raw != previous.view(np.uint8).reshape(height, width, -1)).any(
+                axis=2
+            )
+
+        self._previous = tiles
+        self.changed_cells = int(changed.sum())
+
+        if not self.changed_cells:
+            return ""
+
+        fg_state: list[int] | None = None
+        bg_state: list[int] | None = None
+
+        for y in np.flatnonzero(changed.any(axis=1)).tolist():
+            xs = np.flatnonzero(changed[y])
+
+            # Split the changed cells where the gap is too large to rewrite
+            splits = np.flatnonzero(np.diff(xs) > self.max_gap + 1) + 1
+            starts = np.concatenate(([xs[0]], xs[splits])).tolist()
+            ends = np.concatenate((xs[splits - 1], [xs[-1]])).tolist()
+
+            row = tiles[y]
+            chars = row["ch"].tolist()
+            fgs = row["fg"][:, :3].tolist()
+            bgs = row["bg"][:, :3].tolist()
+
+            for start, end in zip(starts, ends):
+                out.append(f"\x1b[{y + 1};{start + 1}H")
+
+                for x in range(start, end + 1):
+                    fg, bg = fgs[x], bgs[x]
+
+                    if fg != fg_state and bg != bg_state:
+                        out.append("\x1b[38;2;{};{};{};48;2;{};{};{}m".format(*fg, *bg))
+                    elif fg != fg_state:
+                        out.append("\x1b[38;2;{};{};{}m".format(*fg))
+                    elif bg != bg_state:
+                        out.append("\x1b[48;2;{};{};{}m".format(*bg))
+
+                    fg_state, bg_state = fg, bg
+
+                    ch = chars[x]
+                    out.append(chr(ch) if ch >= 0x20 else " ")
+
+        return "".join(out)
+
+
+class AnsiBackend(Backend):
+    """Backend to show the game in a terminal.
+
+    The terminal is switched to its alternate screen with the cursor hidden and
+    its input is read in raw mode, so that each key press is received as it
+    happens. Both are restored when the backend is closed. The terminal should
+    be at least as large as the console and support 24-bit colors. Escape
+    sequences that are split across reads are held back until they are complete.
+
+    Mouse input is not supported.
+
+    Attributes:
+        renderer (AnsiRenderer): Renderer used to produce the output.
+
+        bytes_written (int): Total number of bytes written to the terminal.
+    """
+
+    def __init__(
+        self,
+        stdin: BinaryIO | None = None,
+        stdout: BinaryIO | None = None,
+        renderer: AnsiRenderer | None = None,
+    ) -> None:
+        """Create a backend and set up the terminal.
+
+        Args:
+            stdin: Stream to read input from. If set to `None`, it falls back to
+                using the standard input.
+
+            stdout: Stream to write output to. If set to `None`, it falls back to
+                using the standard output.
+
+            renderer: Renderer used to produce the output. If set to `None`, one
+                with the default settings is used.
+        """
+        self.renderer = renderer or AnsiRenderer()
+        self.bytes_written = 0
+
+        self._stdin = stdin or sys.stdin.buffer
+        self._stdout = stdout or sys.stdout.buffer
+        self._terminal_size: os.terminal_size | None = None
+        self._attributes: list | None = None
+        self._pending = b""
+        self._closed = False
+
+        if os.isatty(self._stdin.fileno()):
+            fd = self._stdin.fileno()
+            self._attributes = termios.tcgetattr(fd)
+            tty.setraw(fd)
+
+        self._write("\x1b[?1049h\x1b[?25l")
+
+    def _write(self, text: str) -> None:
+        data = text.encode()
+        self._stdout.write(data)
+        self._stdout.flush()
+        self.bytes_written += len(data)
+
+    def present(self, console: Console) -> None:
+        if os.isatty(self._stdout.fileno()):
+            size = os.get_terminal_size(self._stdout.fileno())
+
+            # The terminal may have reflowed or cleared the screen
+            if size != self._terminal_size:
+                self._terminal_size = size
+                self.renderer.reset()
+
+        output = self.renderer.render(console)
+
+        if output:
+            self._write(output)
+
+    def wait(self, timeout: float | None) -> list[Event]:
+        fd = self._stdin.fileno()
+        readable, _, _ = select.select([fd], [], [], timeout)
+
+        if not readable:
+            return []
+
+        data = os.read(fd, 4096)
+
+        # End of input, for example when the terminal is closed
+        if not data:
+            return [tcod.event.Quit()]
+
+        data, self._pending = _split_incomplete(self._pending + data)
+        return parse_input(data)
+
+    def close(self) -> None:
+        if self._closed:
+            return
+
+        self._closed = True
+        self._write("\x1b[0m\x1b[?25h\x1b[?1049l")
+
+        if self._attributes is not None:
+            termios.tcsetattr(self._stdin.fileno(), termios.TCSADRAIN, self._attributes)
+            self._attributes = None
@@ -0,0 +1,65 @@
+"""This module defines the class that all backends derive from."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Iterable
+
+if TYPE_CHECKING:
+    from tcod.console import Console
+    from tcod.event import Event
+
+
+class Backend:
+    """Base class for the ways a game can be shown and played.
+
+    A backend presents the consoles rendered by the event handlers and
+    supplies the events they handle. It can be used as a context manager,
+    which closes it on exit.
+    """
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}()"
+
+    def __str__(self) -> str:
+        return self.__repr__()
+
+    def __enter__(self) -> Backend:
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+    def present(self, console: Console) -> None:
+        """Method to show a console.
+
+        Args:
+            console: Console to show.
+        """
+        raise NotImplementedError()
+
+    def wait(self, timeout: float | None) -> Iterable[Event]:
+        """Method to wait for events.
+
+        Args:
+            timeout: Maximum time (in seconds) to wait for. If set to `None`,
+                it waits until there is an event.
+
+        Returns:
+            Events received, which can be empty if the timeout expired.
+        """
+        raise NotImplementedError()
+
+    def convert_event(self, event: Event) -> None:
+        """Method to convert the coordinates of mouse events to tiles, in place.
+
+        It does nothing by default.
+
+        Args:
+            event: Event to convert.
+        """
+
+    def close(self) -> None:
+        """Method to release the resources of the backend.
+
+        It does nothing by default.
+        """
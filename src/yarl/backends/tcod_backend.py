@@ -0,0 +1,42 @@
+"""This module defines the backend that shows the game in a tcod window."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Iterable
+
+import tcod
+
+from .base import Backend
+
+if TYPE_CHECKING:
+    from tcod.console import Console
+    from tcod.context import Context
+    from tcod.event import Event
+
+
+class TcodBackend(Backend):
+    """Backend to show the game in a window created with tcod.
+
+    Attributes:
+        context (Context): Context of the window.
+    """
+
+    def __init__(self, context: Context) -> None:
+        """Create a backend for a window.
+
+        Args:
+            context: Context of the window. It is closed with the backend.
+        """
+        self.context = context
+
+    def present(self, console: Console) -> None:
+        self.context.present(console)
+
+    def wait(self, timeout: float | None) -> Iterable[Event]:
+        return tcod.event.wait(timeout=timeout)
+
+    def convert_event(self, event: Event) -> None:
+        self.context.convert_event(event)
+
+    def close(self) -> None:
+        self.context.close()
@@ -1,14 +1,10 @@
 from __future__ import annotations
 
-import math
 import random
 from collections import deque
 from typing import TYPE_CHECKING
 
-import numpy as np
-import tcod
-from yarl.actions import Action, BumpAction, MeleeAction, MovementAction
-from yarl.engine import Engine
+from yarl.actions import Action, ActionStatus, BumpAction, MeleeAction, MovementAction
 from yarl.entity import ActiveEntity
 
 if TYPE_CHECKING:
@@ -46,9 +42,12 @@ class BaseAI(Action):
         return self.__repr__()
 
     def get_path_to(self, dest_x: int, dest_y: int) -> deque[tuple[int, int]]:
-        """Method to get an A* path from the invoking entity's current location
+        """Method to get the shortest path from the invoking entity's current location
         to `(dest_x, dest_y)`.
 
+        The path is obtained from the pathfinding service of the game map, so
+        entities heading to the same destination share a single search.
+
         Args:
             dest_x: x-coordinate of the target location.
 
@@ -57,26 +56,34 @@ class BaseAI(Action):
         Returns:
             Path to `(dest_x, dest_y)`.
         """
-        engine = self.engine
-
-        game_map = engine.game_map
+        path = self.game_map.pathfinding.get_path(
+            start=(self.entity.x, self.entity.y), goal=(dest_x, dest_y)
+        )
 
-        cost = np.array(game_map.tiles["walkable"], dtype=np.int8)
+        return deque(path)
 
-        for entity in game_map.entities:
-            if entity.blocking is False or cost[entity.x, entity.y] == 0:
-                continue
+    def move(self, dx: int, dy: int) -> None:
+        """Method to move the invoking entity.
 
-            cost[entity.x, entity.y] += 10
+        If an enemy turn is in progress, the move is submitted to the
+        turn's movement batch and applied once all enemies have acted.
+        Otherwise, the entity is moved immediately.
 
-        graph = tcod.path.SimpleGraph(cost=cost, cardinal=2, diagonal=3)
-        pathfinder = tcod.path.Pathfinder(graph=graph)
+        Args:
+            dx: Deviation in the x-direction from the entity's current location.
 
-        pathfinder.add_root(index=(self.entity.x, self.entity.y))
+            dy: Deviation in the y-direction from the entity's current location.
+        """
+        batch = self.engine.ai_executor.movement_batch
 
-        path: list[list[int]] = pathfinder.path_to(index=(dest_x, dest_y))[1:].tolist()
+        if batch is None:
+            action = MovementAction(
+                engine=self.engine, entity=self.entity, dx=dx, dy=dy
+            )
+            action.try_perform()
+            return
 
-        return deque((x, y) for x, y in path)
+        batch.submit(entity=self.entity, dx=dx, dy=dy)
 
 
 class AttackingAI(BaseAI):
@@ -90,6 +97,10 @@ class AttackingAI(BaseAI):
         path (deque[tuple[int, int]]): Path to the player.
     """
 
+    max_path_length: int = 25
+    """Maximum length of the A* paths the AI follows. Longer paths are
+    obtained from the room graph of the map instead."""
+
     def __init__(self, engine: Engine, entity: ActiveEntity) -> None:
         """Create an attacking AI.
 
@@ -106,7 +117,9 @@ class AttackingAI(BaseAI):
         """Method which performs the AI behavior for the invoking entity.
 
         It essentially attacks the player if the entity is close enough
-        or moves towards the player via the A* path.
+        or moves towards the player via the A* path. When the player is
+        too far away for an A* path, the path is obtained from the room
+        graph of the map instead.
         """
         engine, entity = self.engine, self.entity
 
@@ -115,29 +128,44 @@ class AttackingAI(BaseAI):
         dx = target.x - entity.x
         dy = target.y - entity.y
 
-        distance = float(max(abs(dx), abs(dy)))
+        distance = max(abs(dx), abs(dy))
 
         game_map = self.game_map
 
         if game_map.visible[entity.x, entity.y]:
             if distance <= 1 and not entity.fighter.is_waiting_to_attack:
-                return MeleeAction(engine=engine, entity=entity, dx=dx, dy=dy).perform()
+                action = MeleeAction(engine=engine, entity=entity, dx=dx, dy=dy)
+                action.try_perform()
+                return
+
+            # No path can be shorter than the distance to the target
+            if distance <= self.max_path_length:
+                path = self.get_path_to(target.x, target.y)
+                self.path = path if len(path) <= self.max_path_length else deque()
+
+        # Drop the steps that have already been taken
+        while self.path and self.path[0] == (entity.x, entity.y):
+            self.path.popleft()
+
+        if not self.path:
+            self.path = deque(
+                game_map.room_graph.get_path(
+                    start=(entity.x, entity.y), goal=(target.x, target.y)
+                )
+            )
+
+        if not self.path:
+            return
 
-            self.path = self.get_path_to(target.x, target.y)
+        dest_x, dest_y = self.path[0]
+        dx, dy = dest_x - entity.x, dest_y - entity.y
 
-        # Even if there is no path or the path is too long
-        # The entity should try to move towards the target
-        # By taking a normalized step
-        if not self.path or len(self.path) > 25:
-            distance = math.sqrt(dx**2 + dy**2)
-            dx, dy = int(dx // distance), int(dy // distance)
-            return MovementAction(engine=engine, entity=entity, dx=dx, dy=dy).perform()
+        # The path is stale if it does not continue from the current location
+        if max(abs(dx), abs(dy)) != 1:
+            self.path.clear()
+            return
 
-        dest_x, dest_y = self.path.popleft()
-        action = MovementAction(
-            engine=engine, entity=entity, dx=dest_x - entity.x, dy=dest_y - entity.y
-        )
-        action.perform()
+        self.move(dx=dx, dy=dy)
 
 
 class ConfusionAI(BaseAI):
@@ -221,9 +249,8 @@ class ConfusionAI(BaseAI):
         dx, dy = random.choice(self.DIRECTIONS)
 
         action = BumpAction(engine=self.engine, entity=entity, dx=dx, dy=dy)
-        action.perform()
 
-        if entity.is_waiting_to_move or entity.fighter.is_waiting_to_attack:
+        if action.try_perform() is not ActionStatus.PERFORMED:
             return
 
         self.turns_remaining = max(0, self.turns_remaining - 1)
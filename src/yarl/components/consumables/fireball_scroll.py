@@ -4,6 +4,7 @@ import math
 from typing import TYPE_CHECKING, overload
 
 from yarl.event_handlers import SelectTargetAreaEventHandler
+from yarl.events import DamageEvent, DamageSource, DeathEvent, XPEvent
 from yarl.exceptions import ImpossibleActionException
 
 from .base_consumable import Consumable
@@ -206,20 +207,35 @@ class FireballScroll(Consumable):
                 continue
 
             target.fighter.take_damage(damage=damage)
-            engine.add_to_message_log(
-                f"{target.name} is engulfed in a fiery explosion, taking {damage} damage!"
+            engine.event_bus.publish(
+                DamageEvent(
+                    source=DamageSource.FIREBALL,
+                    attacker=consumer,
+                    attacker_name=consumer.name,
+                    target=target,
+                    target_name=target.name,
+                    damage=damage,
+                )
             )
 
             if target.is_alive:
                 continue
 
-            engine.add_to_message_log(text=f"{target.name} is dead!")
+            engine.event_bus.publish(
+                DeathEvent(
+                    source=DamageSource.FIREBALL,
+                    entity=target,
+                    name=target.name,
+                    killer=consumer,
+                    killer_name=consumer.name,
+                )
+            )
             target.name = f"remains of {target.name}"
 
             xp += target.level.xp_given
 
         if consumer is engine.player:
             consumer.level.add_xp(xp=xp)
-            engine.message_log.add_message(f"You gain {xp} experience points.")
+            engine.event_bus.publish(XPEvent(entity=consumer, xp=xp))
 
         self.consume(consumer=consumer)
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING, overload
 
+from yarl.events import DamageEvent, DamageSource, DeathEvent, XPEvent
 from yarl.exceptions import ImpossibleActionException
 
 from .base_consumable import Consumable
@@ -144,18 +145,34 @@ class LightningScroll(Consumable):
 
         target.fighter.take_damage(damage=damage)
 
-        text = f"A lighting bolt strikes {target.name} with a loud thunder, for {damage} hit points!"
-        engine.add_to_message_log(text=text)
+        engine.event_bus.publish(
+            DamageEvent(
+                source=DamageSource.LIGHTNING,
+                attacker=consumer,
+                attacker_name=consumer.name,
+                target=target,
+                target_name=target.name,
+                damage=damage,
+            )
+        )
 
         self.consume(consumer=consumer)
 
         if target.is_alive:
             return
 
-        engine.add_to_message_log(text=f"{target.name} is dead!")
+        engine.event_bus.publish(
+            DeathEvent(
+                source=DamageSource.LIGHTNING,
+                entity=target,
+                name=target.name,
+                killer=consumer,
+                killer_name=consumer.name,
+            )
+        )
         target.name = f"remains of {target.name}"
 
         if consumer is engine.player:
             xp = target.level.xp_given
             consumer.level.add_xp(xp=xp)
-            engine.message_log.add_message(f"You gain {xp} experience points.")
+            engine.event_bus.publish(XPEvent(entity=consumer, xp=xp))
@@ -2,16 +2,32 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any, Hashable
 
+from yarl.ai_executor import AIExecutor
+from yarl.events import DeathEvent, EventBus
+from yarl.exceptions import ImpossibleActionException
 from yarl.interface.color import COLORS
+from yarl.interface.compositor import Compositor, Layer
+from yarl.interface.event_messages import EventMessages
 from yarl.interface.message_log import MessageLog
+from yarl.interface.minimap import Minimap
 from yarl.interface.renderer import render_fraction_bar, render_text_at_location
 
 if TYPE_CHECKING:
     from tcod.console import Console
+    from yarl.actions import Action
     from yarl.entity import ActiveEntity
     from yarl.map import GameMap, GameWorld
+    from yarl.recording import ActionRecorder
+
+
+HUD_REGION = (0, 45, 61, 5)
+"""Region of the console covered by the HUD, as `(x, y, width, height)`."""
+
+MINIMAP_REGION = (80, 0, 20, 12)
+"""Region of the console covered by the minimap and its frame, as
+`(x, y, width, height)`."""
 
 
 class Engine:
@@ -32,7 +48,24 @@ class Engine:
         message_log (MessageLog): Internal message log used to show messages on the
             interface.
 
+        event_bus (EventBus): [`EventBus`][yarl.events.EventBus] instance the
+            events of the game are published to.
+
+        event_messages (EventMessages): Subscriber that adds messages describing
+            the events to `message_log`.
+
         mouse_location (tuple[int, int]): Current location of the mouse cursor.
+
+        ai_executor (AIExecutor): [`AIExecutor`][yarl.ai_executor.AIExecutor] instance
+            used to run the turns of the enemies.
+
+        recorder (ActionRecorder | None): [`ActionRecorder`][yarl.recording.ActionRecorder]
+            instance the player actions and enemy turns are recorded to, if any.
+            It is not saved with the game.
+
+    The engine also keeps track of whether the state shown on the interface has
+    changed since it was last rendered, so that unchanged frames can be skipped.
+    See [`Engine.is_dirty`][yarl.engine.Engine.is_dirty].
     """
 
     def __init__(
@@ -48,8 +81,19 @@ class Engine:
             player: Game player.
         """
         self.player = player
-        self.mouse_location: tuple[int, int] = (0, 0)
+        self._version = 0
+        self._rendered_version: tuple[int, int, int] | None = None
+        self._mouse_location = (0, 0)
         self.message_log = MessageLog()
+        self.event_bus = EventBus()
+        self.event_messages = EventMessages(message_log=self.message_log, player=player)
+        self.event_messages.subscribe(event_bus=self.event_bus)
+        self.event_bus.subscribe(DeathEvent, self._on_death)
+        self.ai_executor = AIExecutor(engine=self)
+        self.recorder: ActionRecorder | None = None
+        self._hover_names: tuple[tuple, str] | None = None
+        self._compositor: Compositor | None = None
+        self._minimap: Minimap | None = None
 
         self.game_world = game_world
         self.game_map: GameMap = self.game_world.generate_floor(player=player)
@@ -61,6 +105,55 @@ class Engine:
     def __str__(self) -> str:
         return self.__repr__()
 
+    def __getstate__(self) -> dict[str, Any]:
+        # Open files cannot be pickled and a loaded game cannot be replayed from its seed
+        state = self.__dict__.copy()
+        state["recorder"] = None
+        state["_compositor"] = None
+        state["_minimap"] = None
+        return state
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._compositor = None
+        self._minimap = None
+
+    def _on_death(self, event: DeathEvent) -> None:
+        # Dead entities are rendered as corpses
+        self.game_map.version += 1
+
+    @property
+    def mouse_location(self) -> tuple[int, int]:
+        """Current location of the mouse cursor."""
+        return self._mouse_location
+
+    @mouse_location.setter
+    def mouse_location(self, location: tuple[int, int]) -> None:
+        if location != self._mouse_location:
+            self._mouse_location = location
+            self._version += 1
+
+    @property
+    def version(self) -> tuple[int, int, int]:
+        """Counters that change whenever the state shown on the interface changes.
+
+        It combines the engine's own counter (mouse location, floor changes)
+        with [`GameMap.version`][yarl.map.gamemap.GameMap] and
+        [`MessageLog.version`][yarl.interface.message_log.MessageLog].
+        Every attack, pickup, etc. adds a message, so changes to the player's
+        stats are captured by the message log.
+        """
+        return self._version, self.game_map.version, self.message_log.version
+
+    @property
+    def is_dirty(self) -> bool:
+        """Indicates whether the state has changed since `mark_clean()` was last called."""
+        return self.version != self._rendered_version
+
+    def mark_clean(self) -> None:
+        """Method to record that the current state has been rendered."""
+        self._rendered_version = self.version
+
     def new_floor(self):
         """Method to generate a new floor.
 
@@ -68,6 +161,7 @@ class Engine:
         when events happen, for example.
         """
         self.game_map = self.game_world.generate_floor(player=self.player)
+        self._version += 1
 
     def add_to_message_log(
         self, text: str, fg: tuple[int, int, int] = COLORS["white1"]
@@ -80,26 +174,156 @@ class Engine:
         """
         self.message_log.add_message(text=text, fg=fg)
 
+    def handle_player_action(self, action: Action) -> bool:
+        """Method to perform an action on behalf of the player.
+
+        If the action is not possible, the reason is added to the message log.
+        If a recorder is attached, the action is recorded whether it is possible or not.
+
+        Args:
+            action: Action to perform.
+
+        Returns:
+            `True` if the action was performed, `False` otherwise.
+        """
+        if self.recorder is not None:
+            self.recorder.record_action(action=action)
+
+        try:
+            action.perform()
+        except ImpossibleActionException as e:
+            self.add_to_message_log(text=e.args[0], fg=COLORS["gray"])
+            return False
+
+        return True
+
+    def handle_enemy_turns(self) -> None:
+        """Method to run a complete turn for all enemies on the current floor."""
+        self.ai_executor.start_turn()
+        self.ai_executor.finish()
+
+    def step(self, action: Action | None = None) -> bool:
+        """Method to advance the game by one turn.
+
+        The player's action is performed first, followed by a complete turn for
+        all enemies and an update of the FOV. Nothing is rendered and nothing waits
+        for input or time to pass, which makes it suitable for running the game
+        without a window.
+
+        Like in the game loop, the enemies act even if the player's action is not
+        possible. The enemies do not act if the player is dead.
+
+        Args:
+            action: Action the player takes in the turn. When set to `None`,
+                the player does nothing. Defaults to `None`.
+
+        Returns:
+            `True` if the player's action was performed, `False` otherwise.
+        """
+        performed = action is not None and self.handle_player_action(action=action)
+
+        if self.player.is_alive:
+            self.handle_enemy_turns()
+
+        self.update_fov()
+
+        return performed
+
     def update_fov(self) -> None:
         """Method to update the field-of-view (FOV) of the game map
         based on the player's position.
 
         This should be used by other components to update the FOV
-        when events happen, for example.
+        when events happen, for example. It is cheap to call repeatedly,
+        since the FOV is only computed when it is next read (see
+        [`GameMap.update_fov()`][yarl.map.gamemap.GameMap.update_fov]).
         """
         self.game_map.update_fov(pov=(self.player.x, self.player.y))
 
     def render(self, console: Console) -> None:
         """Method to render all game components to the console.
 
-        This renders the game map, the messages, health bar, level bar
-        and also the names of entities at the current mouse location.
+        This renders the game map, the messages, health bar, level bar, the
+        minimap and also the names of entities at the current mouse location.
+
+        The components are rendered through a
+        [`Compositor`][yarl.interface.compositor.Compositor] with a layer for
+        the terrain, the entities, the HUD, the minimap and the names under the
+        mouse cursor.
+        Each layer is only redrawn when what it shows changes, and a frame where
+        nothing has changed is copied as is. This also makes it cheap for handlers
+        that pause the game to draw over it.
 
         Args:
             console: Console to render to.
         """
-        self.game_map.render(console=console)
+        if self._compositor is None:
+            self._compositor = Compositor(
+                layers=[
+                    Layer(
+                        name="terrain",
+                        draw=self._render_terrain,
+                        get_key=self._get_terrain_key,
+                        opaque=True,
+                    ),
+                    Layer(
+                        name="entities",
+                        draw=self._render_entities,
+                        get_key=self._get_entities_key,
+                    ),
+                    Layer(
+                        name="hud",
+                        draw=self._render_hud,
+                        get_key=self._get_hud_key,
+                        opaque=True,
+                        region=HUD_REGION,
+                    ),
+                    Layer(
+                        name="minimap",
+                        draw=self._render_minimap,
+                        get_key=self._get_minimap_key,
+                        opaque=True,
+                        region=MINIMAP_REGION,
+                    ),
+                    Layer(
+                        name="tooltip",
+                        draw=self._render_tooltip,
+                        get_key=self._get_tooltip_key,
+                    ),
+                ]
+            )
+
+        self._compositor.render(console=console)
+
+    def _get_terrain_key(self) -> Hashable:
+        game_map = self.game_map
+        game_map.refresh_fov()
+        return id(game_map), game_map.fov_version
+
+    def _render_terrain(self, console: Console) -> None:
+        self.game_map.render_tiles(console=console)
+
+    def _get_entities_key(self) -> Hashable:
+        game_map = self.game_map
+        return id(game_map), game_map.version, game_map.fov_version
+
+    def _render_entities(self, console: Console) -> None:
+        self.game_map.render_entities(console=console)
+
+    def _get_hud_key(self) -> Hashable:
+        fighter, level = self.player.fighter, self.player.level
+
+        return (
+            self.message_log.version,
+            fighter.hp,
+            fighter.max_hp,
+            level.current_xp,
+            level.xp_to_next_level,
+            level.current_level,
+            self.game_world.current_floor,
+        )
 
+    def _render_hud(self, console: Console) -> None:
         self.message_log.render(console=console, x=21, y=45, width=40, height=5)
 
         render_fraction_bar(
@@ -131,6 +355,57 @@ class Engine:
             y=49,
         )
 
+    def _get_minimap_key(self) -> Hashable:
+        game_map = self.game_map
+        game_map.refresh_fov()
+
+        return (
+            id(game_map),
+            game_map.explored_version,
+            game_map.fov_version,
+            self.player.x,
+            self.player.y,
+        )
+
+    def _render_minimap(self, console: Console) -> None:
+        x, y, width, height = MINIMAP_REGION
+
+        if self._minimap is None:
+            self._minimap = Minimap(width=width - 2, height=height - 2)
+
+        console.draw_frame(x=x, y=y, width=width, height=height, title="Map")
+
+        self._minimap.render(
+            console=console,
+            game_map=self.game_map,
+            player=(self.player.x, self.player.y),
+            x=x + 1,
+            y=y + 1,
+        )
+
+    def _get_tooltip_key(self) -> Hashable:
+        return self.mouse_location, self.get_hover_names()
+
+    def _render_tooltip(self, console: Console) -> None:
         x, y = self.mouse_location
-        names = self.game_map.get_names_at_location(x=x, y=y)
-        console.print(x=x, y=y, string=names)
+        console.print(x=x, y=y, string=self.get_hover_names())
+
+    def get_hover_names(self) -> str:
+        """Method to obtain the names of the entities under the mouse cursor.
+
+        The names are cached until the state of the engine or the FOV changes.
+
+        Returns:
+            Comma-separated string with the names.
+        """
+        game_map = self.game_map
+        game_map.refresh_fov()
+
+        key = (self.version, id(game_map), game_map.fov_version)
+
+        if self._hover_names is None or self._hover_names[0] != key:
+            x, y = self.mouse_location
+            names = game_map.get_names_at_location(x=x, y=y)
+            self._hover_names = key, names
+
+        return self._hover_names[1]
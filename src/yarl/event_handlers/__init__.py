@@ -1,4 +1,5 @@
 from .base_event_handler import ActionOrHandlerType, BaseEventHandler
+from .event_coalescer import EventCoalescer, KeyRepeatPolicy
 from .event_handler import EventHandler
 from .game_over import GameOverEventHandler
 from .main_game import MainGameEventHandler
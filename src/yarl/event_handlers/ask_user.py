@@ -5,13 +5,10 @@ from typing import TYPE_CHECKING
 import tcod
 from tcod.event import Event, KeyDown, MouseButtonDown
 from yarl.event_handlers.base_event_handler import BaseEventHandler
-from yarl.exceptions import ImpossibleActionException
-from yarl.interface.color import COLORS
 
 from .event_handler import EventHandler
 
 if TYPE_CHECKING:
-    from yarl.actions import Action
     from yarl.engine import Engine
 
     from .base_event_handler import ActionOrHandlerType, BaseEventHandler
@@ -36,12 +33,6 @@ class AskUserEventHandler(EventHandler):
     def on_exit(self) -> ActionOrHandlerType | None:
         return self.old_event_handler or self
 
-    def handle_action(self, action: Action) -> None:
-        try:
-            super().handle_action(action=action)
-        except ImpossibleActionException as e:
-            self.engine.add_to_message_log(text=e.args[0], fg=COLORS["gray"])
-
     def handle_event(self, event: Event) -> BaseEventHandler:
         action_or_handler = self.dispatch(event=event)
 
@@ -1,23 +1,34 @@
 from __future__ import annotations
 
-from typing import Union
+from typing import TYPE_CHECKING, Union
 
 import tcod
 from tcod.console import Console
-from tcod.context import Context
 from tcod.event import Event, Quit
 from yarl.actions import Action
 
+if TYPE_CHECKING:
+    from yarl.backends import Backend
+
 ActionOrHandlerType = Union[Action, "BaseEventHandler"]
 
 
 class BaseEventHandler(tcod.event.EventDispatch[ActionOrHandlerType]):
     """Base event handler class for all event handlers."""
 
-    def post_events(self, context: Context) -> BaseEventHandler:
+    def post_events(self, backend: Backend) -> BaseEventHandler:
         """Method which can be used to do things after all events have been processed."""
         return self
 
+    def time_until_next_tick(self) -> float | None:
+        """Method to obtain the time (in seconds) until `post_events()` has something to do
+        without any events.
+
+        The game loop waits for events for at most this long. By default, it returns
+        `None`, which means the loop can wait for events indefinitely.
+        """
+        return None
+
     def handle_event(self, event: Event) -> BaseEventHandler:
         action_or_handler = self.dispatch(event=event)
 
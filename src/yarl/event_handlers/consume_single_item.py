@@ -3,14 +3,11 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 
 from tcod.event import Event
-from yarl.exceptions import ImpossibleActionException
-from yarl.interface.color import COLORS
 
 from .base_event_handler import BaseEventHandler
 from .event_handler import EventHandler
 
 if TYPE_CHECKING:
-    from yarl.actions import Action
     from yarl.engine import Engine
     from yarl.entity import Item
 
@@ -26,12 +23,6 @@ class ConsumeSingleItemEventHandler(EventHandler):
         self.old_event_handler = old_event_handler
         self.item = item
 
-    def handle_action(self, action: Action) -> None:
-        try:
-            action.perform()
-        except ImpossibleActionException as e:
-            self.engine.add_to_message_log(text=e.args[0], fg=COLORS["gray"])
-
     def handle_event(self, event: Event) -> BaseEventHandler:
         item = self.item
 
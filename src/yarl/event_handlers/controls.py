@@ -50,3 +50,14 @@ HISTORY_SCROLL_KEYS = {
     tcod.event.K_PAGEUP: -10,
     tcod.event.K_PAGEDOWN: 10,
 }
+
+
+FRAME_RATE_CAPS: tuple[float | None, ...] = (30, 60, 120, None)
+"""Frame rate caps that can be cycled through while the game is running. `None`
+means the frame rate is not capped."""
+
+FRAME_RATE_KEY = tcod.event.K_F10
+"""Key that cycles through the frame rate caps while the game is running."""
+
+FRAME_STATS_KEY = tcod.event.K_F11
+"""Key that shows or hides the measured frame rate while the game is running."""
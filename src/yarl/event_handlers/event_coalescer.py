@@ -0,0 +1,99 @@
+"""This module defines the class that is used to drop redundant events before they are dispatched."""
+
+from __future__ import annotations
+
+from enum import Enum
+from typing import Iterable
+
+import tcod.event
+from tcod.event import Event
+
+
+class KeyRepeatPolicy(Enum):
+    """Policies for the key presses generated by holding a key down."""
+
+    KEEP_ALL = "keep_all"
+    """Every repeated key press is dispatched."""
+
+    ONE_PER_FRAME = "one_per_frame"
+    """At most one repeated key press per key is dispatched per frame."""
+
+    DROP = "drop"
+    """Repeated key presses are never dispatched."""
+
+
+class EventCoalescer:
+    """Class to drop redundant events from the batch of events received in a frame.
+
+    Mouse motion only matters for where the mouse ends up, so only the last motion
+    before a mouse button event (or the end of the batch) is kept. Holding a key
+    generates repeated key presses at the rate set by the OS, which can queue up
+    several turns per frame; these are filtered according to a `KeyRepeatPolicy`.
+    All other events are kept, and kept events are never reordered.
+
+    Attributes:
+        key_repeat_policy (KeyRepeatPolicy): Policy for repeated key presses.
+
+        dropped_mouse_motions (int): Total number of mouse motion events dropped.
+
+        dropped_key_repeats (int): Total number of repeated key presses dropped.
+    """
+
+    def __init__(
+        self, key_repeat_policy: KeyRepeatPolicy = KeyRepeatPolicy.ONE_PER_FRAME
+    ) -> None:
+        """Create an event coalescer.
+
+        Args:
+            key_repeat_policy: Policy for repeated key presses.
+                Defaults to `KeyRepeatPolicy.ONE_PER_FRAME`.
+        """
+        self.key_repeat_policy = key_repeat_policy
+        self.dropped_mouse_motions = 0
+        self.dropped_key_repeats = 0
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(key_repeat_policy={self.key_repeat_policy})"
+
+    def __str__(self) -> str:
+        return self.__repr__()
+
+    def coalesce(self, events: Iterable[Event]) -> list[Event]:
+        """Method to drop the redundant events from a batch.
+
+        Args:
+            events: Events received in a frame, in order.
+
+        Returns:
+            Events that should be dispatched, in order.
+        """
+        policy = self.key_repeat_policy
+
+        kept: list[Event | None] = []
+        last_motion: int | None = None
+        repeated_keys: set[int] = set()
+
+        for event in events:
+            if isinstance(event, tcod.event.MouseMotion):
+                if last_motion is not None:
+                    kept[last_motion] = None
+                    self.dropped_mouse_motions += 1
+
+                last_motion = len(kept)
+            elif isinstance(event, tcod.event.MouseButtonEvent):
+                # Clicks must see the motion that happened before them
+                last_motion = None
+            elif (
+                isinstance(event, tcod.event.KeyDown)
+                and event.repeat
+                and policy is not KeyRepeatPolicy.KEEP_ALL
+            ):
+                if policy is KeyRepeatPolicy.DROP or event.sym in repeated_keys:
+                    self.dropped_key_repeats += 1
+                    continue
+
+                repeated_keys.add(event.sym)
+
+            kept.append(event)
+
+        return [event for event in kept if event is not None]
@@ -8,8 +8,6 @@ from tcod.console import Console
 from tcod.event import Event, Quit
 from yarl.actions import Action
 from yarl.event_handlers import ActionOrHandlerType, BaseEventHandler
-from yarl.exceptions import ImpossibleActionException
-from yarl.interface.color import COLORS
 
 from .base_event_handler import BaseEventHandler
 
@@ -38,10 +36,7 @@ class EventHandler(BaseEventHandler):
         self.engine.render(console=console)
 
     def handle_action(self, action: Action) -> None:
-        try:
-            action.perform()
-        except ImpossibleActionException as e:
-            self.engine.add_to_message_log(text=e.args[0], fg=COLORS["gray"])
+        self.engine.handle_player_action(action=action)
 
     def handle_event(self, event: Event) -> BaseEventHandler:
         action_or_handler = self.dispatch(event=event)
@@ -4,6 +4,7 @@ from typing import TYPE_CHECKING
 
 import tcod
 from tcod.event import KeyDown
+from yarl.interface.renderer import render_text_at_location
 
 from .controls import HISTORY_SCROLL_KEYS
 from .event_handler import EventHandler
@@ -15,39 +16,79 @@ if TYPE_CHECKING:
 
 
 class HistoryEventHandler(EventHandler):
-    """Print the history on a larger window which can be navigated."""
+    """Print the history on a larger window which can be navigated.
+
+    The window is drawn on a console that is allocated once and reused for
+    every frame. Messages cache the lines they are wrapped to (see
+    [`Message.wrap()`][yarl.interface.message_log.Message.wrap]), so scrolling
+    only prints the lines that fit in the window instead of laying out the
+    whole log again. Archived messages are only read when they are scrolled to.
+    """
 
     def __init__(
         self, engine: Engine, old_event_handler: EventHandler | None = None
     ) -> None:
         super().__init__(engine=engine)
-        self.log_length = len(engine.message_log.messages)
+        self.log_length = len(engine.message_log)
         self.cursor = self.log_length - 1
         self.old_event_handler = old_event_handler
 
+        self._log_console: tcod.Console | None = None
+        self._rendered: tuple[int, int] | None = None
+
+    def _get_log_console(self, console: tcod.Console) -> tcod.Console:
+        log_console = self._log_console
+        width, height = console.width - 6, console.height - 6
+
+        if log_console is None or (log_console.width, log_console.height) != (
+            width,
+            height,
+        ):
+            log_console = self._log_console = tcod.Console(width, height)
+
+            # Draw a frame with a custom banner title.
+            log_console.draw_frame(0, 0, width, height)
+            log_console.print_box(
+                0, 0, width, 1, "┤Message history├", alignment=tcod.CENTER
+            )
+
+            self._rendered = None
+
+        return log_console
+
     def on_render(self, console: tcod.Console) -> None:
         super().on_render(console)  # Draw the main state as the background.
 
-        log_console = tcod.Console(console.width - 6, console.height - 6)
+        log_console = self._get_log_console(console=console)
+        rendered = self.cursor, self.engine.message_log.version
 
-        # Draw a frame with a custom banner title.
-        log_console.draw_frame(0, 0, log_console.width, log_console.height)
-        log_console.print_box(
-            0, 0, log_console.width, 1, "┤Message history├", alignment=tcod.CENTER
-        )
-
-        # Render the message log using the cursor parameter.
-        self.engine.message_log.render(
-            console=log_console,
-            x=1,
-            y=1,
-            width=log_console.width - 2,
-            height=log_console.height - 2,
-            limit=self.cursor + 1,
-        )
+        if self._rendered != rendered:
+            self._rendered = rendered
+            self._render_log(log_console=log_console)
 
         log_console.blit(console, 3, 3)
 
+    def _render_log(self, log_console: tcod.Console) -> None:
+        width, height = log_console.width - 2, log_console.height - 2
+
+        log_console.draw_rect(1, 1, width, height, ch=ord(" "), bg=(0, 0, 0))
+
+        message_log = self.engine.message_log
+        y = height
+
+        # Render the messages up to the cursor, from the bottom up.
+        for index in range(self.cursor, -1, -1):
+            message = message_log.get_message(index)
+
+            for line in reversed(message.wrap(width=width)):
+                render_text_at_location(
+                    console=log_console, text=line, x=1, y=y, fg=message.fg
+                )
+                y -= 1
+
+                if y <= 0:
+                    return
+
     def ev_keydown(self, event: KeyDown) -> ActionOrHandlerType | None:
         # Fancy conditional movement to make it feel right.
         if event.sym in HISTORY_SCROLL_KEYS:
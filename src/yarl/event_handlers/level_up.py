@@ -5,6 +5,7 @@ from typing import TYPE_CHECKING, Callable
 import tcod
 from tcod.console import Console
 from tcod.event import KeyDown, MouseButtonDown
+from yarl.actions import LevelUpAction
 from yarl.interface.color import COLORS
 
 from .ask_user import AskUserEventHandler
@@ -69,10 +70,8 @@ class LevelUpEventHandler(AskUserEventHandler):
         index = key - tcod.event.K_a
 
         if index == 3:
-            self.engine.player.level.level_up()
-            self.engine.add_to_message_log(
-                text=f"You advanced to level {player.level.current_level}"
-            )
+            action = LevelUpAction(engine=self.engine, entity=player)
+            self.engine.handle_player_action(action=action)
             return super().ev_keydown(event=event)
 
         boost, amount = self.get_booster(index=index)
@@ -81,10 +80,10 @@ class LevelUpEventHandler(AskUserEventHandler):
             self.engine.add_to_message_log(text="Invalid entry", fg=COLORS["yellow1"])
             return None
 
-        self.engine.player.level.level_up_with_boost(boost=boost, amount=amount)
-        self.engine.add_to_message_log(
-            text=f"You advanced to level {player.level.current_level}"
+        action = LevelUpAction(
+            engine=self.engine, entity=player, boost=boost, amount=amount
         )
+        self.engine.handle_player_action(action=action)
 
         return super().ev_keydown(event=event)
 
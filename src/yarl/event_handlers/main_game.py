@@ -1,18 +1,25 @@
 from __future__ import annotations
 
 import time
+from collections import deque
 from typing import TYPE_CHECKING
 
 import tcod
-from tcod.context import Context
+from tcod.console import Console
 from tcod.event import Event, KeyDown, KeySym, Modifier
 from yarl.actions import BumpAction, PickupAction, TakeStairsAction, WaitAction
 from yarl.event_handlers.base_event_handler import BaseEventHandler
-from yarl.exceptions import ImpossibleActionException
 from yarl.logger import logger
+from yarl.timing import FixedTimestep
 
 from .consume_single_item import ConsumeSingleItemEventHandler
-from .controls import MOVE_KEYS, WAIT_KEYS
+from .controls import (
+    FRAME_RATE_CAPS,
+    FRAME_RATE_KEY,
+    FRAME_STATS_KEY,
+    MOVE_KEYS,
+    WAIT_KEYS,
+)
 from .event_handler import EventHandler
 from .game_over import GameOverEventHandler
 from .history import HistoryEventHandler
@@ -26,16 +33,32 @@ from .select_item_to_pick_up import SelectItemToPickupEventHandler
 
 if TYPE_CHECKING:
     from yarl.actions import Action
+    from yarl.backends import Backend
     from yarl.engine import Engine
+    from yarl.timing import FramePacer
 
     from .base_event_handler import ActionOrHandlerType
 
 
 class MainGameEventHandler(EventHandler):
-    def __init__(self, engine: Engine, turn_interval: float = 0.5) -> None:
+    def __init__(
+        self,
+        engine: Engine,
+        turn_interval: float | None = 0.5,
+        ai_time_budget: float | None = 0.005,
+        frame_pacer: FramePacer | None = None,
+    ) -> None:
         super().__init__(engine=engine)
         self.turn_interval = turn_interval
-        self.last_turn_time = time.monotonic()
+        self.ai_time_budget = ai_time_budget
+        self.frame_pacer = frame_pacer
+        self.show_frame_stats = False
+        self.timestep = (
+            FixedTimestep(interval=turn_interval) if turn_interval is not None else None
+        )
+        self.pending_ticks = 0
+        self.paused = False
+        self.queued_actions: deque[Action] = deque()
 
     def process_key(self, key: KeySym, mod: Modifier) -> ActionOrHandlerType | None:
         engine, entity = self.engine, self.engine.player
@@ -49,6 +72,14 @@ class MainGameEventHandler(EventHandler):
         if key in WAIT_KEYS:
             return WaitAction(engine=engine, entity=entity)
 
+        if key == FRAME_RATE_KEY:
+            self.cycle_frame_rate()
+            return None
+
+        if key == FRAME_STATS_KEY:
+            self.show_frame_stats = not self.show_frame_stats
+            return None
+
         match key:
             case tcod.event.K_ESCAPE:
                 logger.info("Game exited.")
@@ -97,62 +128,135 @@ class MainGameEventHandler(EventHandler):
 
         return None
 
+    def cycle_frame_rate(self) -> None:
+        pacer = self.frame_pacer
+
+        if pacer is None:
+            return
+
+        caps = FRAME_RATE_CAPS
+        index = caps.index(pacer.max_fps) if pacer.max_fps in caps else -1
+
+        pacer.max_fps = caps[(index + 1) % len(caps)]
+        logger.info(f"Frame rate cap set to {pacer.max_fps}.")
+
+    def on_render(self, console: Console) -> None:
+        super().on_render(console=console)
+
+        if self.show_frame_stats and self.frame_pacer is not None:
+            console.print(x=0, y=0, string=self.frame_pacer.stats.summary())
+
     def handle_enemy_turns(self) -> None:
-        game_map = self.engine.game_map
-        player = self.engine.player
+        self.engine.handle_enemy_turns()
+
+    def start_enemy_turn(self) -> None:
+        self.engine.ai_executor.start_turn()
 
-        for entity in set(game_map.active_entities) - {player}:
-            if entity.ai_cls is None:
-                continue
+        # The player's turn replaces any ticks that were due
+        self.pending_ticks = 0
 
-            if entity.ai is None:
-                entity.ai = entity.ai_cls(engine=self.engine, entity=entity)
+        if self.timestep is not None:
+            self.timestep.reset()
 
-            try:
-                entity.ai.perform()
-            except ImpossibleActionException as e:
-                pass
+    def check_player_state(self) -> BaseEventHandler:
+        if not self.engine.player.is_alive:
+            logger.info("Player is dead. Switching to game over state.")
+            return GameOverEventHandler(self.engine)
 
-    def post_events(self, context: Context) -> BaseEventHandler:
-        current_time = time.monotonic()
+        if self.engine.player.level.can_level_up:
+            logger.info("Player has leveled up.")
+            return LevelUpEventHandler(engine=self.engine, old_event_handler=self)
+
+        return self
+
+    def time_until_next_tick(self) -> float | None:
+        if self.engine.ai_executor.in_progress or self.pending_ticks > 0:
+            return 0.0
+
+        if self.timestep is None:
+            return None
+
+        return self.timestep.time_until_next_tick()
+
+    def post_events(self, backend: Backend) -> BaseEventHandler:
+        executor = self.engine.ai_executor
+
+        if self.timestep is not None:
+            if self.paused:
+                # Time spent in other handlers (menus, etc.) does not count
+                self.paused = False
+                self.timestep.reset()
+
+            # Ticks pile up while a slow turn is spread over frames, so they are
+            # capped like the ticks of a single update
+            self.pending_ticks = min(
+                self.pending_ticks + self.timestep.update(),
+                self.timestep.max_catch_up_ticks,
+            )
+
+        budget = self.ai_time_budget
+        deadline = None if budget is None else time.perf_counter() + budget
+
+        # Run as many due ticks as fit in the budget without rendering in between
+        while True:
+            if not executor.in_progress:
+                if self.pending_ticks == 0:
+                    return self
+
+                self.pending_ticks -= 1
+                executor.start_turn()
+
+            remaining = (
+                None if deadline is None else max(0.0, deadline - time.perf_counter())
+            )
+
+            # Spread the enemy turn over multiple frames when it doesn't fit the budget
+            if not executor.run(time_budget=remaining):
+                return self
 
-        if current_time - self.last_turn_time > self.turn_interval:
-            self.handle_enemy_turns()
             self.engine.update_fov()
-            self.last_turn_time = current_time
 
             if not self.engine.player.is_alive:
                 logger.info("Player is dead. Switching to game over state.")
                 return GameOverEventHandler(self.engine)
 
-        return self
+            if self.queued_actions:
+                self.handle_action(action=self.queued_actions.popleft())
+                return self.check_player_state()
+
+            if deadline is not None and time.perf_counter() >= deadline:
+                return self
 
     def handle_event(self, event: Event) -> BaseEventHandler:
         action_or_state = self.dispatch(event)
+        in_progress = self.engine.ai_executor.in_progress
 
         if isinstance(action_or_state, BaseEventHandler):
+            if in_progress and action_or_state is not self:
+                # Enemies must finish their turn before the game is paused, and
+                # actions queued before the pause should not happen after it
+                self.engine.ai_executor.finish()
+                self.engine.update_fov()
+                self.queued_actions.clear()
+
+            self.paused = action_or_state is not self
             return action_or_state
 
-        if action_or_state is not None:
-            self.handle_action(action=action_or_state)
-
-            if not self.engine.player.is_alive:
-                logger.info("Player is dead. Switching to game over state.")
-                return GameOverEventHandler(self.engine)
+        if action_or_state is None:
+            return self
 
-            if self.engine.player.level.can_level_up:
-                logger.info("Player has leveled up.")
-                return LevelUpEventHandler(engine=self.engine, old_event_handler=self)
+        if in_progress:
+            # The player acts again only once all enemies have acted, so actions
+            # are queued and performed one per turn, in the order they were given
+            self.queued_actions.append(action_or_state)
+            return self
 
-        return self
+        self.handle_action(action=action_or_state)
+        return self.check_player_state()
 
     def handle_action(self, action: Action) -> None:
         super().handle_action(action=action)
-
-        self.handle_enemy_turns()
-        self.last_turn_time = time.monotonic()
-
-        self.engine.update_fov()
+        self.start_enemy_turn()
 
     def ev_keydown(self, event: KeyDown) -> ActionOrHandlerType | None:
         key = event.sym
@@ -1,7 +1,11 @@
 from __future__ import annotations
 
+import hashlib
+import io
+import os
 from typing import TYPE_CHECKING
 
+import numpy as np
 import tcod
 from PIL import Image
 from tcod.event import KeyDown
@@ -10,35 +14,70 @@ from yarl.event_handlers import (
     BaseEventHandler,
     MainGameEventHandler,
 )
+from yarl.exceptions import IncompatibleSaveException
 from yarl.interface.color import COLORS
-from yarl.utils import load_game
+from yarl.utils import get_cache_path, load_game
 
 from .popup_message import PopupMessageEventHandler
 
 if TYPE_CHECKING:
     from yarl.engine import Engine
+    from yarl.timing import FramePacer
 
 
 class MainMenuEventHandler(BaseEventHandler):
-    def __init__(self, engine: Engine, background_image_path: str = "") -> None:
+    def __init__(
+        self,
+        engine: Engine,
+        background_image_path: str = "",
+        turn_interval: float | None = 0.5,
+        frame_pacer: FramePacer | None = None,
+    ) -> None:
         super().__init__()
 
         self.engine = engine
+        self.turn_interval = turn_interval
+        self.frame_pacer = frame_pacer
+        self.background_image_path = background_image_path
 
-        self.background_image: Image.Image | None
+        # The image is only decoded when the menu is first rendered
+        self._background: tcod.Console | None = None
 
-        if background_image_path:
-            img = Image.open(background_image_path)
-            img = img.convert("RGB")
-            self.background_image = img
-        else:
-            self.background_image = None
+    def get_background(self, width: int, height: int) -> tcod.Console | None:
+        """Method to obtain the background image rendered with semigraphics.
+
+        It is rendered once per console size and cached on disk, keyed by the
+        hash of the image and the size, so later runs do not decode the image.
+
+        Args:
+            width: Width of the console the menu is rendered on.
+
+            height: Height of the console the menu is rendered on.
+
+        Returns:
+            Console with the background, or `None` if there is no background image.
+        """
+        if not self.background_image_path:
+            return None
+
+        background = self._background
+
+        if background is None or (background.width, background.height) != (
+            width,
+            height,
+        ):
+            background = self._background = load_background(
+                path=self.background_image_path, width=width, height=height
+            )
+
+        return background
 
     def on_render(self, console: tcod.Console) -> None:
         """Render the main menu."""
+        background = self.get_background(width=console.width, height=console.height)
 
-        if self.background_image is not None:
-            console.draw_semigraphics(pixels=self.background_image, x=0, y=0)
+        if background is not None:
+            background.blit(console)
 
         console.print(
             console.width // 2,
@@ -78,12 +117,65 @@ class MainMenuEventHandler(BaseEventHandler):
         if key == tcod.event.K_c:
             try:
                 engine = load_game()
-                return MainGameEventHandler(engine=engine)
+                return MainGameEventHandler(
+                    engine=engine,
+                    turn_interval=self.turn_interval,
+                    frame_pacer=self.frame_pacer,
+                )
             except FileNotFoundError:
                 msg = "No saved game to load."
                 return PopupMessageEventHandler(parent_handler=self, message=msg)
+            except IncompatibleSaveException:
+                msg = "The saved game is from another version and cannot be loaded."
+                return PopupMessageEventHandler(parent_handler=self, message=msg)
 
         if key == tcod.event.K_n:
-            return MainGameEventHandler(engine=self.engine)
+            return MainGameEventHandler(
+                engine=self.engine,
+                turn_interval=self.turn_interval,
+                frame_pacer=self.frame_pacer,
+            )
 
         return None
+
+
+def load_background(path: str, width: int, height: int) -> tcod.Console:
+    """Function to render an image with semigraphics on a console of a given size.
+
+    The result is cached in [`get_cache_path()`][yarl.utils.get_cache_path].
+
+    Args:
+        path: Path to the image.
+
+        width: Width of the console.
+
+        height: Height of the console.
+
+    Returns:
+        Console with the image drawn from its top-left corner.
+    """
+    background = tcod.Console(width, height)
+
+    with open(path, "rb") as f:
+        data = f.read()
+
+    digest = hashlib.sha256(data).hexdigest()[:16]
+    cache_path = os.path.join(get_cache_path(), f"{digest}_{width}x{height}.npy")
+
+    try:
+        background.rgb[...] = np.load(cache_path)
+        return background
+    except (OSError, ValueError):
+        pass
+
+    img = Image.open(io.BytesIO(data)).convert("RGB")
+    background.draw_semigraphics(pixels=img, x=0, y=0)
+
+    try:
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        np.save(cache_path, background.rgb)
+    except OSError:
+        # The cache is an optimization, so the menu works without it
+        pass
+
+    return background
@@ -6,14 +6,12 @@ import tcod
 from tcod.console import Console
 from tcod.event import KeyDown
 from yarl.event_handlers.base_event_handler import ActionOrHandlerType
-from yarl.exceptions import ImpossibleActionException
 from yarl.interface.color import COLORS
 
 from .ask_user import AskUserEventHandler
 from .controls import MOVE_KEYS
 
 if TYPE_CHECKING:
-    from yarl.actions import Action
     from yarl.engine import Engine
 
     from .base_event_handler import BaseEventHandler
@@ -45,12 +43,6 @@ class SelectIndexEventHandler(AskUserEventHandler):
         console.tiles_rgb["bg"][x, y] = COLORS["white1"]
         console.tiles_rgb["fg"][x, y] = COLORS["black"]
 
-    def handle_action(self, action: Action) -> None:
-        try:
-            action.perform()
-        except ImpossibleActionException as e:
-            self.engine.add_to_message_log(text=e.args[0], fg=COLORS["gray"])
-
     def ev_keydown(self, event: KeyDown) -> ActionOrHandlerType | None:
         key = event.sym
 
@@ -0,0 +1,235 @@
+"""This module defines the events that are published while the game is played and
+the bus that is used to deliver them to subscribers.
+
+Game rules publish what happened (an entity took damage, died, etc.) instead
+of describing it, and subscribers decide what to do with it. For example, the
+messages shown on the interface are produced by
+[`EventMessages`][yarl.interface.event_messages.EventMessages] and the
+statistics of simulations are collected by subscribing to the same events.
+
+Names are captured when an event is published since entities are renamed
+when they die.
+
+Examples:
+
+    Counting the kills of the player:
+
+    ```pycon
+    >>> from yarl.events import DeathEvent
+    >>> kills = []
+    >>> def on_death(event):
+    ...     if event.killer is engine.player:
+    ...         kills.append(event.name)
+    >>> engine.event_bus.subscribe(DeathEvent, on_death)
+    ```
+"""
+
+from __future__ import annotations
+
+from collections import defaultdict
+from dataclasses import dataclass
+from enum import Enum, auto
+from typing import TYPE_CHECKING, Any, Callable, TypeVar
+
+if TYPE_CHECKING:
+    from yarl.entity import ActiveEntity, Item
+
+
+class DamageSource(Enum):
+    """Sources of damage."""
+
+    MELEE = auto()
+    """A melee attack."""
+
+    FIREBALL = auto()
+    """A fireball scroll."""
+
+    LIGHTNING = auto()
+    """A lightning scroll."""
+
+
+@dataclass
+class GameEvent:
+    """Dataclass which all events derive from."""
+
+
+@dataclass
+class DamageEvent(GameEvent):
+    """Dataclass to represent an entity being attacked.
+
+    Attributes:
+        source (DamageSource): Source of the damage.
+
+        attacker (ActiveEntity): Entity that attacked.
+
+        attacker_name (str): Name of the attacker.
+
+        target (ActiveEntity): Entity that was attacked.
+
+        target_name (str): Name of the target.
+
+        damage (int): Damage dealt. It can be 0.
+    """
+
+    source: DamageSource
+    attacker: ActiveEntity
+    attacker_name: str
+    target: ActiveEntity
+    target_name: str
+    damage: int
+
+
+@dataclass
+class DeathEvent(GameEvent):
+    """Dataclass to represent an entity dying.
+
+    Attributes:
+        source (DamageSource): Source of the damage that killed the entity.
+
+        entity (ActiveEntity): Entity that died.
+
+        name (str): Name of the entity before it died.
+
+        killer (ActiveEntity): Entity that killed the entity.
+
+        killer_name (str): Name of the killer.
+    """
+
+    source: DamageSource
+    entity: ActiveEntity
+    name: str
+    killer: ActiveEntity
+    killer_name: str
+
+
+@dataclass
+class XPEvent(GameEvent):
+    """Dataclass to represent an entity gaining experience points.
+
+    Attributes:
+        entity (ActiveEntity): Entity that gained experience points.
+
+        xp (int): Experience points gained.
+    """
+
+    entity: ActiveEntity
+    xp: int
+
+
+@dataclass
+class PickupEvent(GameEvent):
+    """Dataclass to represent an entity picking up an item without equipping it.
+
+    Attributes:
+        entity (ActiveEntity): Entity that picked up the item.
+
+        item (Item): Item that was picked up.
+
+        item_name (str): Name of the item.
+    """
+
+    entity: ActiveEntity
+    item: Item
+    item_name: str
+
+
+E = TypeVar("E", bound=GameEvent)
+
+
+class EventBus:
+    """Class to deliver events to the subscribers of their type.
+
+    Subscribers of a type receive the events of its subclasses too, so subscribing
+    to [`GameEvent`][yarl.events.GameEvent] receives every event. Subscribers of
+    more general types are called first, and subscribers of the same type are called
+    in the order they subscribed.
+
+    Subscribers are saved with the game, so they should be functions or methods of
+    objects that can be pickled.
+    """
+
+    def __init__(self) -> None:
+        """Create an event bus without subscribers."""
+        self._subscribers: defaultdict[type, list[Callable[[Any], None]]] = defaultdict(
+            list
+        )
+        self._dispatch: dict[type, list[Callable[[Any], None]]] = {}
+
+    def __repr__(self) -> str:
+        count = sum(len(callbacks) for callbacks in self._subscribers.values())
+        return f"{self.__class__.__name__}(subscribers={count})"
+
+    def __str__(self) -> str:
+        return self.__repr__()
+
+    def subscribe(self, event_type: type[E], callback: Callable[[E], None]) -> None:
+        """Method to call a function whenever an event of a type is published.
+
+        Args:
+            event_type: Type of events to receive.
+
+            callback: Function that receives the events.
+        """
+        self._subscribers[event_type].append(callback)
+        self._dispatch.clear()
+
+    def unsubscribe(self, event_type: type[E], callback: Callable[[E], None]) -> None:
+        """Method to stop calling a function for the events of a type.
+
+        It does nothing if the function is not subscribed.
+
+        Args:
+            event_type: Type of events the function receives.
+
+            callback: Function that receives the events.
+        """
+        callbacks = self._subscribers.get(event_type, [])
+
+        if callback in callbacks:
+            callbacks.remove(callback)
+            self._dispatch.clear()
+
+    def get_subscribers(
+        self, event_type: type[GameEvent]
+    ) -> list[Callable[[Any], None]]:
+        """Method to obtain the functions that receive the events of a type.
+
+        Args:
+            event_type: Type of events.
+
+        Returns:
+            Functions that receive the events of `event_type`.
+        """
+        callbacks = self._dispatch.get(event_type)
+
+        if callbacks is None:
+            callbacks = [
+                callback
+                for cls in reversed(event_type.__mro__)
+                for callback in self._subscribers.get(cls, ())
+            ]
+            self._dispatch[event_type] = callbacks
+
+        return callbacks
+
+    def has_subscribers(self, event_type: type[GameEvent]) -> bool:
+        """Method to check whether any function receives the events of a type.
+
+        It can be used to avoid creating events that nobody receives.
+
+        Args:
+            event_type: Type of events.
+
+        Returns:
+            `True` if the events of `event_type` have subscribers, `False` otherwise.
+        """
+        return bool(self.get_subscribers(event_type))
+
+    def publish(self, event: GameEvent) -> None:
+        """Method to deliver an event to its subscribers.
+
+        Args:
+            event: Event to deliver.
+        """
+        for callback in self.get_subscribers(type(event)):
+            callback(event)
@@ -11,3 +11,7 @@ class ImpossibleActionException(Exception):
 
 class QuitWithoutSavingException(SystemExit):
     """The game is quit without saving."""
+
+
+class IncompatibleSaveException(Exception):
+    """Saved game was written in a format that can no longer be loaded."""
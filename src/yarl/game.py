@@ -2,21 +2,26 @@
 
 from __future__ import annotations
 
+import random
 from typing import TYPE_CHECKING, Any
 
 import tcod
 from tcod.console import Console
-from tcod.context import Context
 from yarl.engine import Engine
-from yarl.event_handlers import MainMenuEventHandler
+from yarl.event_handlers import EventCoalescer, MainMenuEventHandler
 from yarl.exceptions import QuitWithoutSavingException
 from yarl.factories import player_factory
 from yarl.interface.color import COLORS
+from yarl.logger import logger
 from yarl.map import GameWorld
+from yarl.recording import ActionRecorder
+from yarl.timing import FramePacer
 from yarl.utils import save_game
 
 if TYPE_CHECKING:
+    from yarl.backends import Backend
     from yarl.event_handlers import BaseEventHandler
+    from yarl.server import SpectatorPublisher
 
 
 class Game:
@@ -40,8 +45,26 @@ class Game:
         player_attack_delay (int): Attack delay for the player.
 
         player_inventory_capacity (int): Inventory capacity of the player.
+
+        turn_interval (float | None): Time (in seconds) after which the enemies act
+            if the player does nothing. When set to `None`, the game is purely
+            turn-based and the enemies only act after the player.
     """
 
+    PARAMS: tuple[str, ...] = (
+        "map_width",
+        "map_height",
+        "room_min_size",
+        "player_max_hp",
+        "player_defense",
+        "player_power",
+        "player_movement_delay",
+        "player_attack_delay",
+        "player_inventory_capacity",
+        "turn_interval",
+    )
+    """Names of the parameters of a game."""
+
     def __init__(
         self,
         map_width: int,
@@ -53,6 +76,7 @@ class Game:
         player_movement_delay: int = 0,
         player_attack_delay: int = 8,
         player_inventory_capacity: int = 26,
+        turn_interval: float | None = 0.5,
     ) -> None:
         """Create a game.
 
@@ -74,6 +98,10 @@ class Game:
             player_attack_delay: Attack delay for the player.
 
             player_inventory_capacity: Inventory capacity of the player.
+
+            turn_interval: Time (in seconds) after which the enemies act if the player
+                does nothing. When set to `None`, the game is purely turn-based and the
+                enemies only act after the player. Defaults to 0.5.
         """
         self.map_width = map_width
         self.map_height = map_height
@@ -84,9 +112,10 @@ class Game:
         self.player_movement_delay = player_movement_delay
         self.player_attack_delay = player_attack_delay
         self.player_inventory_capacity = player_inventory_capacity
+        self.turn_interval = turn_interval
 
     @classmethod
-    def fromdict(cls, params: dict[str, int]) -> Game:
+    def fromdict(cls, params: dict[str, Any]) -> Game:
         """Method to create a game from a dictionary.
 
         Args:
@@ -94,23 +123,21 @@ class Game:
                 `map_width` and `map_height`. All other parameters are optional.
         """
 
-        expected = {
-            "map_width",
-            "map_height",
-            "room_min_size",
-            "player_max_hp",
-            "player_defense",
-            "player_power",
-            "player_movement_delay",
-            "player_attack_delay",
-            "player_inventory_capacity",
-        }
+        expected = set(cls.PARAMS)
 
         params = {key: value for key, value in params.items() if key in expected}
 
         return cls(**params)
 
-    def get_engine(self) -> Engine:
+    def todict(self) -> dict[str, Any]:
+        """Method to obtain the parameters of the game as a dictionary.
+
+        Returns:
+            Parameters that can be passed to `fromdict()` to create an identical game.
+        """
+        return {key: getattr(self, key) for key in self.PARAMS}
+
+    def get_engine(self, seed: int | None = None) -> Engine:
         """Method to initialize an [Engine][yarl.engine.Engine] instance that can be used
         for the game.
 
@@ -119,9 +146,16 @@ class Game:
         that will be used for floor generation, and then creates the engine with the
         player and the game world.
 
+        Args:
+            seed: Seed for the `random` module, which drives map generation and
+                the enemies. If set to `None`, the generator is left as is.
+
         Returns:
             Engine that can be used for the game.
         """
+        if seed is not None:
+            random.seed(seed)
+
         player = player_factory(
             max_hp=self.player_max_hp,
             base_defense=self.player_defense,
@@ -147,35 +181,141 @@ class Game:
         return engine
 
     def run(
-        self, console: Console, context: Context, main_menu_background_path: str = ""
+        self,
+        console: Console,
+        backend: Backend,
+        main_menu_background_path: str = "",
+        recording_path: str | None = None,
+        event_coalescer: EventCoalescer | None = None,
+        spectators: SpectatorPublisher | None = None,
+        frame_pacer: FramePacer | None = None,
     ) -> None:
         """Game loop.
 
+        A frame is only rendered when the event handler has changed, an event other
+        than mouse motion has been handled or the state of the engine is dirty (see
+        [`Engine.is_dirty`][yarl.engine.Engine.is_dirty]).
+
+        Between frames, the loop blocks until an event arrives or the event handler
+        has something to do on its own (see
+        [`BaseEventHandler.time_until_next_tick()`][yarl.event_handlers.BaseEventHandler.time_until_next_tick]),
+        so no CPU is used while the game is idle.
+
+        Frames are also paced by a [`FramePacer`][yarl.timing.FramePacer]: when a
+        frame is due before the pacer allows it, the loop keeps waiting for events
+        and handling them until it does. This caps the frame rate when vsync is not
+        available, without slowing down input or the enemies. Every iteration of
+        the loop is recorded as a frame in the stats of the pacer, whether or not
+        it was rendered. The pacer is passed on to the main game, where
+        `FRAME_RATE_KEY` cycles through its caps and `FRAME_STATS_KEY` toggles an
+        overlay with the measured frame rate (see
+        [`controls`][yarl.event_handlers.controls]).
+
+        The events received between frames are passed through an
+        [`EventCoalescer`][yarl.event_handlers.EventCoalescer] before being dispatched,
+        which drops redundant mouse motion and repeated key presses.
+
         Args:
             console: Console that will be used throughout the loop for rendering.
 
-            context: Context that will be used throughout the loop.
+            backend: Backend that will be used throughout the loop to present
+                frames and receive events, like a window or a terminal.
 
             main_menu_background_path: Optional path to the image that should be used as
                 the background of the main menu.
+
+            recording_path: Optional path of the file a new game should be recorded to,
+                so that it can be replayed with [`Replay`][yarl.sim.replay.Replay].
+                A game that is continued from a save is not recorded.
+
+            event_coalescer: Coalescer the events are passed through. Its counters
+                can be inspected once the loop exits. If set to `None`, one with the
+                default policy is used.
+
+            spectators: Publisher every frame rendered should be streamed to, so that
+                the game can be watched live. It should already be started.
+
+            frame_pacer: Pacer the frames are rendered with. Its stats can be
+                inspected once the loop exits. If set to `None`, one with the
+                default cap is used.
         """
-        engine = self.get_engine()
+        coalescer = event_coalescer or EventCoalescer()
+        pacer = frame_pacer or FramePacer()
+
+        recorder: ActionRecorder | None = None
+
+        if recording_path is None:
+            engine = self.get_engine()
+        else:
+            seed = random.getrandbits(64)
+            engine = self.get_engine(seed=seed)
+            recorder = ActionRecorder(
+                path=recording_path, seed=seed, params=self.todict()
+            )
+            engine.recorder = recorder
 
         handler: BaseEventHandler = MainMenuEventHandler(
-            engine=engine, background_image_path=main_menu_background_path
+            engine=engine,
+            background_image_path=main_menu_background_path,
+            turn_interval=self.turn_interval,
+            frame_pacer=pacer,
         )
 
+        redraw = True
+
         try:
             while True:
-                console.clear()
-                handler.on_render(console=console)
-                context.present(console)
+                handler_engine: Engine | None = getattr(handler, "engine", None)
+
+                frame_wait: float | None = None
+
+                if redraw or (handler_engine is not None and handler_engine.is_dirty):
+                    frame_wait = pacer.time_until_next_frame()
+
+                if frame_wait == 0:
+                    pacer.begin_frame()
+
+                    console.clear()
+                    handler.on_render(console=console)
+                    backend.present(console)
+                    pacer.end_frame()
+
+                    if spectators is not None:
+                        spectators.publish(console)
+
+                    if handler_engine is not None:
+                        handler_engine.mark_clean()
 
-                for event in tcod.event.get():
-                    context.convert_event(event)
-                    handler = handler.handle_event(event=event)
+                    redraw = False
+                    frame_wait = None
 
-                handler = handler.post_events(context=context)
+                timeout = handler.time_until_next_tick()
+
+                # A frame that is held back by the pacer is rendered once it is allowed
+                if frame_wait is not None:
+                    timeout = (
+                        frame_wait if timeout is None else min(timeout, frame_wait)
+                    )
+
+                events = coalescer.coalesce(backend.wait(timeout=timeout))
+
+                for event in events:
+                    backend.convert_event(event)
+                    new_handler = handler.handle_event(event=event)
+
+                    # Mouse motion only matters if it changes the state of the engine
+                    if new_handler is not handler or not isinstance(
+                        event, tcod.event.MouseMotion
+                    ):
+                        redraw = True
+
+                    handler = new_handler
+
+                new_handler = handler.post_events(backend=backend)
+                redraw = redraw or new_handler is not handler
+                handler = new_handler
+
+                pacer.end_iteration()
 
         except QuitWithoutSavingException:
             raise
@@ -183,3 +323,8 @@ class Game:
             if hasattr(handler, "engine"):
                 engine_to_save: Engine = handler.engine
                 save_game(engine=engine_to_save)
+        finally:
+            if recorder is not None:
+                recorder.close()
+
+            logger.info(f"Frame stats: {pacer.stats.todict()}")
@@ -0,0 +1,228 @@
+"""This module defines the classes that are used to render a frame as a stack of
+layers which are only redrawn when what they show changes."""
+
+from __future__ import annotations
+
+from types import EllipsisType
+from typing import Callable, Hashable
+
+import numpy as np
+from tcod.console import Console
+
+
+class Layer:
+    """Class to represent a layer of a frame.
+
+    A layer is drawn to its own off-screen console, which is kept between frames.
+    It is only redrawn when the key it is given changes, so the key should
+    capture everything the layer shows.
+
+    Opaque layers replace the tiles of the layers below them, either in their
+    region or everywhere. Other layers are drawn on top of the layers below them,
+    like they would be if they were drawn on the same console: the character of
+    every tile they print to is replaced, and so is its foreground color if
+    they set one. Background colors are kept.
+
+    Attributes:
+        name (str): Name of the layer.
+
+        draw (Callable[[Console], None]): Function that draws the layer on a console.
+
+        get_key (Callable[[], Hashable]): Function that returns a value which
+            changes whenever what the layer shows changes.
+
+        opaque (bool): Whether the layer replaces the tiles below it.
+
+        region (tuple[int, int, int, int] | None): Region an opaque layer covers,
+            as `(x, y, width, height)`, or `None` if it covers the whole frame.
+
+        redraws (int): Number of times the layer has been drawn.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        draw: Callable[[Console], None],
+        get_key: Callable[[], Hashable],
+        opaque: bool = False,
+        region: tuple[int, int, int, int] | None = None,
+    ) -> None:
+        """Create a layer.
+
+        Args:
+            name: Name of the layer.
+
+            draw: Function that draws the layer on a console.
+
+            get_key: Function that returns a value which changes whenever what
+                the layer shows changes.
+
+            opaque: Whether the layer should replace the tiles below it.
+                Defaults to `False`.
+
+            region: Region an opaque layer covers, as `(x, y, width, height)`.
+                If set to `None`, it covers the whole frame. It is ignored for
+                layers that are not opaque.
+        """
+        self.name = name
+        self.draw = draw
+        self.get_key = get_key
+        self.opaque = opaque
+        self.region = region
+        self.redraws = 0
+
+        self._console: Console | None = None
+        self._blank: np.ndarray | None = None
+        self._key: Hashable = None
+        self._ch_mask: np.ndarray | None = None
+        self._fg_mask: np.ndarray | None = None
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(name={self.name!r})"
+
+    def __str__(self) -> str:
+        return self.__repr__()
+
+    def update(self, width: int, height: int) -> bool:
+        """Method to redraw the layer if its key has changed.
+
+        Args:
+            width: Width of the frame.
+
+            height: Height of the frame.
+
+        Returns:
+            `True` if the layer was redrawn, `False` otherwise.
+        """
+        key = self.get_key()
+        console = self._console
+
+        if console is None or (console.width, console.height) != (width, height):
+            console = self._console = Console(width, height, order="F")
+
+            if not self.opaque:
+                # Tiles that are not printed to keep a null character, and a
+                # transparent foreground color unless one is set
+                console.rgba["ch"] = 0
+                console.rgba["fg"] = 0
+
+            # Copying raw tiles is much faster than clearing the console
+            self._blank = _as_void(console.rgba).copy(order="F")
+        elif key == self._key:
+            return False
+        else:
+            _as_void(console.rgba)[...] = self._blank
+
+        self.draw(console)
+
+        if not self.opaque:
+            tiles = console.rgba
+            self._ch_mask = tiles["ch"] != 0
+            self._fg_mask = self._ch_mask & (tiles["fg"][..., 3] != 0)
+
+        self._key = key
+        self.redraws += 1
+
+        return True
+
+    def compose(self, frame: np.ndarray) -> None:
+        """Method to draw the layer over the layers below it.
+
+        Args:
+            frame: Tiles of the frame, with the layout of `Console.rgba`.
+        """
+        if self._console is None:
+            return
+
+        tiles = self._console.rgba
+
+        if self.opaque:
+            region: tuple[slice, slice] | EllipsisType = np.s_[...]
+
+            if self.region is not None:
+                x, y, width, height = self.region
+                region = np.s_[x : x + width, y : y + height]
+
+            _as_void(frame)[region] = _as_void(tiles)[region]
+            return
+
+        # Masks are set whenever a transparent layer is drawn
+        assert self._ch_mask is not None and self._fg_mask is not None
+
+        np.copyto(frame["ch"], tiles["ch"], where=self._ch_mask)
+        np.copyto(frame["fg"], tiles["fg"], where=self._fg_mask[..., np.newaxis])
+
+
+class Compositor:
+    """Class to render a frame from a stack of layers.
+
+    Each frame, the layers whose keys have changed are redrawn. The result of
+    merging each layer with the ones below it is kept, so only the layers from
+    the lowest one that was redrawn up are merged again. If no layer was
+    redrawn, the previous frame is reused as is.
+
+    Attributes:
+        layers (list[Layer]): Layers from bottom to top.
+    """
+
+    def __init__(self, layers: list[Layer] | None = None) -> None:
+        """Create a compositor.
+
+        Args:
+            layers: Layers from bottom to top. More can be added with `add_layer()`.
+        """
+        self.layers = layers or []
+        self._size: tuple[int, int] | None = None
+        self._blank: np.ndarray | None = None
+        self._frames: list[np.ndarray] = []
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__name__}(layers={[layer.name for layer in self.layers]})"
+        )
+
+    def __str__(self) -> str:
+        return self.__repr__()
+
+    def add_layer(self, layer: Layer) -> None:
+        """Method to add a layer on top of the others.
+
+        Args:
+            layer: Layer to add.
+        """
+        self.layers.append(layer)
+        self._size = None
+
+    def render(self, console: Console) -> None:
+        """Method to render the frame to a console.
+
+        Args:
+            console: Console to render to. It should be in Fortran order,
+                like the rest of the game expects.
+        """
+        width, height = console.width, console.height
+        layers = self.layers
+
+        changed = [layer.update(width=width, height=height) for layer in layers]
+        start = changed.index(True) if True in changed else len(layers)
+
+        if self._blank is None or self._size != (width, height):
+            self._size = width, height
+            self._blank = Console(width, height, order="F").rgba.copy(order="F")
+            self._frames = [self._blank.copy(order="F") for _ in layers]
+            start = 0
+
+        below: np.ndarray = self._blank if start == 0 else self._frames[start - 1]
+
+        for layer, frame in zip(layers[start:], self._frames[start:]):
+            _as_void(frame)[...] = _as_void(below)
+            layer.compose(frame=frame)
+            below = frame
+
+        _as_void(console.rgba)[...] = _as_void(below)
+
+
+def _as_void(tiles: np.ndarray) -> np.ndarray:
+    # Tiles have fields with subarrays, which numpy copies one by one. Viewing
+    # them as opaque values lets whole tiles be copied at once.
+    return tiles.view(f"V{tiles.dtype.itemsize}")
@@ -0,0 +1,188 @@
+"""This module defines the class that is used to turn game events into messages."""
+
+from __future__ import annotations
+
+from functools import partial
+from typing import TYPE_CHECKING
+
+from yarl.events import DamageEvent, DamageSource, DeathEvent, PickupEvent, XPEvent
+from yarl.interface.color import COLORS
+
+if TYPE_CHECKING:
+    from yarl.entity import ActiveEntity
+    from yarl.events import EventBus
+
+    from .message_log import MessageLog
+
+
+class EventMessages:
+    """Class to add messages describing game events to a message log.
+
+    The text of each message is only produced when it is needed, so
+    games without an interface do not spend any time on formatting.
+
+    Attributes:
+        message_log (MessageLog): Message log the messages are added to.
+
+        player (ActiveEntity): Game player, which some messages are specific to.
+    """
+
+    def __init__(self, message_log: MessageLog, player: ActiveEntity) -> None:
+        """Create an event-to-message subscriber.
+
+        Args:
+            message_log: Message log the messages should be added to.
+
+            player: Game player.
+        """
+        self.message_log = message_log
+        self.player = player
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}()"
+
+    def __str__(self) -> str:
+        return self.__repr__()
+
+    def subscribe(self, event_bus: EventBus) -> None:
+        """Method to start receiving the events published on a bus.
+
+        Args:
+            event_bus: Bus to subscribe to.
+        """
+        event_bus.subscribe(DamageEvent, self.on_damage)
+        event_bus.subscribe(DeathEvent, self.on_death)
+        event_bus.subscribe(XPEvent, self.on_xp)
+        event_bus.subscribe(PickupEvent, self.on_pickup)
+
+    def on_damage(self, event: DamageEvent) -> None:
+        """Method to add a message describing an attack.
+
+        Args:
+            event: Event to describe.
+        """
+        fg = COLORS["white1"]
+
+        if event.source is DamageSource.MELEE:
+            fg = COLORS["gray88"] if event.attacker is self.player else COLORS["snow1"]
+
+        key = (
+            DamageEvent,
+            event.source,
+            event.attacker_name,
+            event.target_name,
+            event.damage,
+        )
+
+        self.message_log.add_message(
+            text=partial(describe_damage, event), fg=fg, key=key
+        )
+
+    def on_death(self, event: DeathEvent) -> None:
+        """Method to add a message describing a death.
+
+        Args:
+            event: Event to describe.
+        """
+        fg = COLORS["white1"]
+
+        if event.source is DamageSource.MELEE:
+            fg = COLORS["indianred"] if event.entity is self.player else COLORS["coral"]
+
+        key = (DeathEvent, event.entity is self.player, event.name)
+
+        self.message_log.add_message(
+            text=partial(describe_death, event, self.player), fg=fg, key=key
+        )
+
+    def on_xp(self, event: XPEvent) -> None:
+        """Method to add a message describing the player gaining experience points.
+
+        Args:
+            event: Event to describe.
+        """
+        if event.entity is not self.player:
+            return
+
+        self.message_log.add_message(
+            text=partial(describe_xp, event), key=(XPEvent, event.xp)
+        )
+
+    def on_pickup(self, event: PickupEvent) -> None:
+        """Method to add a message describing the player picking up an item.
+
+        Args:
+            event: Event to describe.
+        """
+        if event.entity is not self.player:
+            return
+
+        self.message_log.add_message(
+            text=partial(describe_pickup, event), key=(PickupEvent, event.item_name)
+        )
+
+
+def describe_damage(event: DamageEvent) -> str:
+    """Function to describe an attack.
+
+    Args:
+        event: Event to describe.
+
+    Returns:
+        Description of the attack.
+    """
+    target, damage = event.target_name, event.damage
+
+    match event.source:
+        case DamageSource.FIREBALL:
+            return f"{target} is engulfed in a fiery explosion, taking {damage} damage!"
+        case DamageSource.LIGHTNING:
+            return f"A lighting bolt strikes {target} with a loud thunder, for {damage} hit points!"
+
+    attack_desc = f"{event.attacker_name.capitalize()} attacks {target}"
+
+    if damage <= 0:
+        return f"{attack_desc} but does no damage."
+
+    return f"{attack_desc} for {damage} hit points."
+
+
+def describe_death(event: DeathEvent, player: ActiveEntity) -> str:
+    """Function to describe a death.
+
+    Args:
+        event: Event to describe.
+
+        player: Game player.
+
+    Returns:
+        Description of the death.
+    """
+    if event.entity is player and event.source is DamageSource.MELEE:
+        return "You died!"
+
+    return f"{event.name} is dead!"
+
+
+def describe_xp(event: XPEvent) -> str:
+    """Function to describe the player gaining experience points.
+
+    Args:
+        event: Event to describe.
+
+    Returns:
+        Description of the experience points gained.
+    """
+    return f"You gain {event.xp} experience points."
+
+
+def describe_pickup(event: PickupEvent) -> str:
+    """Function to describe the player picking up an item.
+
+    Args:
+        event: Event to describe.
+
+    Returns:
+        Description of the item picked up.
+    """
+    return f"You picked up the item {event.item_name}."
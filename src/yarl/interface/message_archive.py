@@ -0,0 +1,219 @@
+"""This module defines the class that is used to store old messages on disk."""
+
+from __future__ import annotations
+
+import os
+import shutil
+import struct
+import tempfile
+from array import array
+from typing import IO, Any, Iterable
+
+_HEADER = struct.Struct("<3BII")
+_OFFSET = struct.Struct("<Q")
+
+
+ArchivedMessage = tuple[str, tuple[int, int, int], int]
+"""Message as stored in an archive: full text, color and count."""
+
+
+class MessageArchive:
+    """Class to represent an append-only file of messages.
+
+    Each message is stored as its color, count and UTF-8 text. A second file
+    with the suffix `.idx` holds the offset of every message in the first one,
+    so any message can be read without reading the ones before it.
+
+    When no path is given, the messages are stored in temporary files that are
+    deleted when the archive is closed. Pickling such an archive embeds the
+    messages, so [`save()`][yarl.interface.message_archive.MessageArchive.save]
+    should be used to move them to a permanent file first.
+
+    A relative path is resolved against `directory`. The directory is not
+    pickled, so that the files can be moved along with a save; it should be set
+    again after loading.
+
+    Attributes:
+        path (str | None): Path of the file, if any.
+
+        directory (str | None): Directory that a relative `path` is resolved against.
+
+        length (int): Number of messages in the archive.
+    """
+
+    def __init__(self, path: str | None = None) -> None:
+        """Create an empty archive.
+
+        Args:
+            path: Path of the file to store the messages in. Any existing file is
+                overwritten. If set to `None`, temporary files are used.
+        """
+        self.path = path
+        self.directory: str | None = None
+        self.length = 0
+        self._size = 0
+        self._data: IO[bytes] | None = None
+        self._index: IO[bytes] | None = None
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(path={self.path!r}, length={self.length})"
+
+    def __str__(self) -> str:
+        return self.__repr__()
+
+    def __len__(self) -> int:
+        return self.length
+
+    def __getstate__(self) -> dict[str, Any]:
+        state: dict[str, Any] = {
+            "path": self.path,
+            "length": self.length,
+            "size": self._size,
+        }
+
+        if self.path is None and self.length:
+            data, index = self._open()
+            self.flush()
+
+            data.seek(0)
+            index.seek(0)
+            state["data"] = data.read(self._size)
+            state["index"] = index.read(self.length * _OFFSET.size)
+
+        return state
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self.path = state["path"]
+        self.directory = None
+        self.length = state["length"]
+        self._size = state["size"]
+        self._data = self._index = None
+
+        if "data" in state:
+            data, index = self._open()
+            data.write(state["data"])
+            index.write(state["index"])
+
+    def _open(self) -> tuple[IO[bytes], IO[bytes]]:
+        if self._data is not None and self._index is not None:
+            return self._data, self._index
+
+        if self.path is None:
+            data, index = tempfile.TemporaryFile(), tempfile.TemporaryFile()
+        else:
+            path = self._resolve(self.path, self.directory)
+            data, index = _open_file(path), _open_file(f"{path}.idx")
+
+        # Anything written after the archive was last saved is discarded
+        data.truncate(self._size)
+        index.truncate(self.length * _OFFSET.size)
+
+        self._data, self._index = data, index
+        return data, index
+
+    def append(self, messages: Iterable[ArchivedMessage]) -> None:
+        """Method to add messages to the end of the archive.
+
+        Args:
+            messages: Messages to add, as text, color and count.
+        """
+        data, index = self._open()
+
+        chunks: list[bytes] = []
+        offsets = array("Q")
+        offset = self._size
+
+        for text, fg, count in messages:
+            encoded = text.encode()
+            chunk = _HEADER.pack(*fg, count, len(encoded)) + encoded
+
+            chunks.append(chunk)
+            offsets.append(offset)
+            offset += len(chunk)
+
+        data.seek(self._size)
+        data.write(b"".join(chunks))
+        index.seek(self.length * _OFFSET.size)
+        index.write(offsets.tobytes())
+
+        self._size = offset
+        self.length += len(offsets)
+
+    def get(self, index: int) -> ArchivedMessage:
+        """Method to read a message.
+
+        Args:
+            index: Index of the message.
+
+        Returns:
+            Text, color and count of the message at `index`.
+
+        Raises:
+            IndexError: If there is no message at `index`.
+        """
+        if not 0 <= index < self.length:
+            raise IndexError(f"Message index out of range: {index}.")
+
+        data, index_file = self._open()
+
+        index_file.seek(index * _OFFSET.size)
+        (offset,) = _OFFSET.unpack(index_file.read(_OFFSET.size))
+
+        data.seek(offset)
+        r, g, b, count, length = _HEADER.unpack(data.read(_HEADER.size))
+
+        return data.read(length).decode(), (r, g, b), count
+
+    def flush(self) -> None:
+        """Method to write any buffered messages to the files."""
+        if self._data is not None and self._index is not None:
+            self._data.flush()
+            self._index.flush()
+
+    def save(self, path: str, directory: str | None = None) -> None:
+        """Method to copy the archive to a permanent file and keep using that file.
+
+        Args:
+            path: Path of the file.
+
+            directory: Directory that `path` is resolved against if it is relative.
+                Defaults to None.
+        """
+        destination = self._resolve(path, directory)
+
+        if self.path is not None and destination == self._resolve(
+            self.path, self.directory
+        ):
+            self.flush()
+            self.path, self.directory = path, directory
+            return
+
+        data, index = self._open()
+
+        for source, target in ((data, destination), (index, f"{destination}.idx")):
+            source.flush()
+            source.seek(0)
+
+            with open(target, "wb") as f:
+                shutil.copyfileobj(source, f)
+
+        self.close()
+        self.path, self.directory = path, directory
+
+    def close(self) -> None:
+        """Method to close the files. Temporary files are deleted."""
+        for f in (self._data, self._index):
+            if f is not None:
+                f.close()
+
+        self._data = self._index = None
+
+    @staticmethod
+    def _resolve(path: str, directory: str | None) -> str:
+        return path if directory is None else os.path.join(directory, path)
+
+
+def _open_file(path: str) -> IO[bytes]:
+    # Opened for reading and writing without truncating, creating it if needed
+    open(path, "ab").close()
+    return open(path, "r+b")
@@ -3,33 +3,58 @@
 
 from __future__ import annotations
 
+import textwrap
+from typing import Any, Callable, Hashable
+
 from tcod.console import Console
 from yarl.interface.color import COLORS
-from yarl.interface.renderer import render_messages
+from yarl.interface.renderer import render_text_at_location
+
+from .message_archive import MessageArchive
 
 
 class Message:
     """Class to represent a colored text message.
 
-    Attributes:
-        plain_text (str): Text of the message.
+    The text can be given as a function which produces it, in which case it is
+    only produced the first time it is needed, for example when the message is
+    rendered. This way, no time is spent on messages that nobody reads.
 
+    The full text and the lines it is wrapped to are cached until `count` changes,
+    so rendering a message that has not changed does not format or wrap it again.
+
+    Attributes:
         fg (tuple[int, int, int]): Color for the message.
 
         count (int): Multiplier to show beside the message.
+
+        key (Hashable | None): Value which identifies messages with the same text
+            without producing it. It is the text itself if the text is given
+            as a string.
     """
 
-    def __init__(self, text: str, fg: tuple[int, int, int]) -> None:
+    def __init__(
+        self,
+        text: str | Callable[[], str],
+        fg: tuple[int, int, int],
+        key: Hashable | None = None,
+    ) -> None:
         """Create a message.
 
         Args:
-            text: Text of the message.
+            text: Text of the message or a function which produces it.
 
             fg: Color for the message.
+
+            key: Value which identifies messages with the same text. If set to
+                `None`, it falls back to `text` when `text` is a string.
         """
-        self.plain_text = text
+        self._text = text
         self.fg = fg
-        self.count = 1
+        self._count = 1
+        self._full_text: str | None = None
+        self._lines: dict[int, list[str]] = {}
+        self.key = key if key is not None or callable(text) else text
 
     def __repr__(self) -> str:
         return f"{self.__class__.__name__}(plain_text={self.plain_text}, count={self.count})"
@@ -37,6 +62,36 @@ class Message:
     def __str__(self) -> str:
         return self.__repr__()
 
+    def __getstate__(self) -> dict[str, Any]:
+        # The caches can be recomputed, so they are not saved
+        state = self.__dict__.copy()
+        del state["_full_text"], state["_lines"]
+        return state
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._full_text = None
+        self._lines = {}
+
+    @property
+    def count(self) -> int:
+        """Multiplier to show beside the message."""
+        return self._count
+
+    @count.setter
+    def count(self, value: int) -> None:
+        self._count = value
+        self._full_text = None
+        self._lines.clear()
+
+    @property
+    def plain_text(self) -> str:
+        """Text of the message."""
+        if callable(self._text):
+            self._text = self._text()
+
+        return self._text
+
     @property
     def full_text(self) -> str:
         """The full text of the message with the count.
@@ -49,21 +104,69 @@ class Message:
             >>> msg.full_text
             'Hello (x3)'
         """
-        return (
-            f"{self.plain_text} (x{self.count})" if self.count > 1 else self.plain_text
-        )
+        if self._full_text is None:
+            self._full_text = (
+                f"{self.plain_text} (x{self.count})"
+                if self.count > 1
+                else self.plain_text
+            )
+
+        return self._full_text
+
+    def wrap(self, width: int) -> list[str]:
+        """Method to wrap the full text of the message to lines of a given width.
+
+        Args:
+            width: Maximum width of the lines.
+
+        Returns:
+            Lines of the message. The list is cached and should not be modified.
+        """
+        lines = self._lines.get(width)
+
+        if lines is None:
+            lines = self._lines[width] = textwrap.wrap(text=self.full_text, width=width)
+
+        return lines
 
 
 class MessageLog:
     """Class to represent a list of `Message` instances with rendering capabilities.
 
+    Only the most recent messages are kept in memory. Once there are more than
+    `capacity` of them, the older half is moved to a
+    [`MessageArchive`][yarl.interface.message_archive.MessageArchive], so memory
+    use and save size stay flat however long the game is. Messages are indexed
+    from the first message of the game, whether they are archived or not
+    (see `get_message()`).
+
     Attributes:
-        messages (list[Message]): Current messages in the log.
+        messages (list[Message]): Most recent messages in the log.
+
+        capacity (int): Maximum number of messages kept in memory.
+
+        archive (MessageArchive): Archive that older messages are moved to.
+
+        version (int): Counter that is incremented whenever a message is added
+            or stacked.
     """
 
-    def __init__(self) -> None:
-        """Create an empty message log."""
+    def __init__(
+        self, capacity: int = 1000, archive: MessageArchive | None = None
+    ) -> None:
+        """Create an empty message log.
+
+        Args:
+            capacity: Maximum number of messages kept in memory. Defaults to 1000.
+
+            archive: Empty archive that older messages should be moved to. If set
+                to `None`, one that uses temporary files is created.
+        """
         self.messages: list[Message] = []
+        self.capacity = max(2, capacity)
+        self.archive = archive or MessageArchive()
+        self.version = 0
+        self._archived: dict[int, Message] = {}
 
     def __repr__(self) -> str:
         return f"{self.__class__.__name__}()"
@@ -71,19 +174,94 @@ class MessageLog:
     def __str__(self) -> str:
         return self.__repr__()
 
+    def __len__(self) -> int:
+        return len(self.archive) + len(self.messages)
+
+    def __getstate__(self) -> dict[str, Any]:
+        state = self.__dict__.copy()
+        del state["_archived"]
+        return state
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._archived = {}
+
+    def get_message(self, index: int) -> Message:
+        """Method to obtain a message, reading it from the archive if needed.
+
+        Recently read archived messages are kept in memory, so that paging
+        back and forth does not read them again.
+
+        Args:
+            index: Index of the message, counting from the first message of the game.
+
+        Returns:
+            Message at `index`.
+
+        Raises:
+            IndexError: If there is no message at `index`.
+        """
+        archived = len(self.archive)
+
+        if index >= archived:
+            return self.messages[index - archived]
+
+        message = self._archived.get(index)
+
+        if message is None:
+            text, fg, count = self.archive.get(index)
+
+            message = Message(text=text, fg=fg)
+            message.count = count
+
+            if len(self._archived) >= 256:
+                self._archived.clear()
+
+            self._archived[index] = message
+
+        return message
+
+    def get_messages(self, start: int, stop: int | None = None) -> list[Message]:
+        """Method to obtain consecutive messages, reading them from the archive if needed.
+
+        Args:
+            start: Index of the first message.
+
+            stop: Index after the last message. If set to `None`, it falls back to
+                the number of messages in the log.
+
+        Returns:
+            Messages from `start` up to, but not including, `stop`.
+        """
+        stop = len(self) if stop is None else min(stop, len(self))
+        return [self.get_message(index) for index in range(start, stop)]
+
+    def _spill(self) -> None:
+        # Half the messages are moved at once so that it happens rarely. The
+        # newest message always stays in memory so that it can be stacked.
+        spilled = len(self.messages) - self.capacity // 2
+
+        self.archive.append(
+            (message.plain_text, message.fg, message.count)
+            for message in self.messages[:spilled]
+        )
+        del self.messages[:spilled]
+
     def add_message(
         self,
-        text: str,
+        text: str | Callable[[], str],
         fg: tuple[int, int, int] = COLORS["white1"],
         *,
         stack: bool = True,
+        key: Hashable | None = None,
     ) -> None:
         """Add a message to the message log with optional stacking.
 
         It creates a [`Message`][yarl.interface.message_log.Message] instance and adds it to the log.
 
         Args:
-            text: Text of the message.
+            text: Text of the message or a function which produces it.
+                See [`Message`][yarl.interface.message_log.Message].
 
             fg: Color for the message. Defaults to `color.WHITE`.
 
@@ -91,12 +269,27 @@ class MessageLog:
                 If `True` and the last message in the log has the same text as `text`,
                 the count of the message is incremented. Otherwise, the message is appended
                 to the log. Defaults to `True`.
+
+            key: Value which identifies messages with the same text. Messages whose
+                text is given as a function are only stacked if it is set.
         """
-        if stack and self.messages and self.messages[-1].plain_text == text:
+        self.version += 1
+
+        message = Message(text=text, fg=fg, key=key)
+
+        if (
+            stack
+            and message.key is not None
+            and self.messages
+            and self.messages[-1].key == message.key
+        ):
             self.messages[-1].count += 1
             return None
 
-        self.messages.append(Message(text=text, fg=fg))
+        self.messages.append(message)
+
+        if len(self.messages) > self.capacity:
+            self._spill()
 
     def render(
         self,
@@ -130,15 +323,18 @@ class MessageLog:
             limit: Limits the number of messages rendered to the first `limit` messages.
                 When set to `None`, all the messages in the log are rendered.
         """
-        messages = self.messages if limit is None else self.messages[:limit]
-
-        render_messages(
-            console=console,
-            x=x,
-            y=y,
-            width=width,
-            height=height,
-            messages=reversed(
-                [(message.full_text, message.fg) for message in messages]
-            ),
-        )
+        end = len(self) if limit is None else min(limit, len(self))
+
+        # Walk back from the last message until the space is filled, so the
+        # cost does not depend on the length of the log
+        for index in range(end - 1, -1, -1):
+            message = self.get_message(index)
+
+            for line in reversed(message.wrap(width=width)):
+                render_text_at_location(
+                    console=console, text=line, x=x, y=y + height - 1, fg=message.fg
+                )
+                height -= 1
+
+                if height <= 0:
+                    return
@@ -0,0 +1,222 @@
+"""This module defines the class that is used to render an overview of the game map."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import numpy as np
+from yarl.interface.color import COLORS
+
+if TYPE_CHECKING:
+    from tcod.console import Console
+    from yarl.map import GameMap
+
+
+MINIMAP_COLORS: dict[str, tuple[int, int, int]] = {
+    "wall": COLORS["gray30"],
+    "floor": COLORS["gray55"],
+    "visible": COLORS["gray85"],
+    "stairs": COLORS["gold1"],
+    "player": COLORS["deepskyblue1"],
+}
+"""Colors of the minimap, by what they show."""
+
+
+class Minimap:
+    """Class to render a scaled-down overview of the explored parts of a game map.
+
+    Each cell of the minimap shows 2x2 pixels (see `Console.draw_semigraphics()`)
+    and each pixel covers a square block of tiles. A pixel shows a floor if any
+    tile in its block is an explored floor, or else a wall if any is an explored
+    wall. Floors that are visible, the stairs once they have been explored and
+    the player are drawn on top.
+
+    The explored pixels are kept between renders. When tiles are explored, only
+    the pixels of the blocks that contain them are computed again, and the
+    visible floors are computed from the region around the player, so rendering
+    does not depend on the size of the map.
+
+    Attributes:
+        width (int): Maximum width of the minimap, in cells.
+
+        height (int): Maximum height of the minimap, in cells.
+
+        scale (int): Number of tiles along each side of the block of a pixel.
+
+        full_rebuilds (int): Number of times all the explored pixels were computed.
+
+        partial_rebuilds (int): Number of times the explored pixels were updated
+            for newly explored tiles.
+    """
+
+    def __init__(self, width: int, height: int) -> None:
+        """Create a minimap.
+
+        Args:
+            width: Maximum width of the minimap, in cells.
+
+            height: Maximum height of the minimap, in cells.
+        """
+        self.width = width
+        self.height = height
+        self.scale = 1
+        self.full_rebuilds = 0
+        self.partial_rebuilds = 0
+
+        self._pixels: np.ndarray | None = None
+        self._game_map_id: int | None = None
+        self._explored_version = 0
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(width={self.width}, height={self.height})"
+
+    def __str__(self) -> str:
+        return self.__repr__()
+
+    def get_size(self, game_map: GameMap) -> tuple[int, int]:
+        """Method to obtain the size of the minimap of a game map.
+
+        Args:
+            game_map: Game map.
+
+        Returns:
+            Width and height of the minimap, in cells.
+        """
+        scale = self._get_scale(game_map=game_map)
+        pixels_x, pixels_y = -(-game_map.width // scale), -(-game_map.height // scale)
+        return -(-pixels_x // 2), -(-pixels_y // 2)
+
+    def _get_scale(self, game_map: GameMap) -> int:
+        # The smallest scale at which the map fits, the same along both axes
+        return max(
+            -(-game_map.width // (self.width * 2)),
+            -(-game_map.height // (self.height * 2)),
+            1,
+        )
+
+    def update(self, game_map: GameMap) -> None:
+        """Method to bring the explored pixels up to date with a game map.
+
+        Args:
+            game_map: Game map to show.
+        """
+        game_map.refresh_fov()
+        version = game_map.explored_version
+        scale = self._get_scale(game_map=game_map)
+
+        same_map = (
+            self._pixels is not None
+            and self._game_map_id == id(game_map)
+            and self.scale == scale
+        )
+
+        if same_map and version == self._explored_version:
+            return
+
+        if (
+            same_map
+            and version == self._explored_version + 1
+            and game_map.explored_bounds is not None
+        ):
+            self._update_region(game_map, game_map.explored_bounds)
+            self.partial_rebuilds += 1
+        else:
+            self.scale = scale
+            self._game_map_id = id(game_map)
+            self._pixels = np.zeros(
+                (-(-game_map.width // scale), -(-game_map.height // scale), 3),
+                dtype=np.uint8,
+            )
+            self._update_region(game_map, (0, 0, game_map.width, game_map.height))
+            self.full_rebuilds += 1
+
+        self._explored_version = version
+
+    def _update_region(
+        self, game_map: GameMap, bounds: tuple[int, int, int, int]
+    ) -> None:
+        assert self._pixels is not None
+
+        blocks, tiles = self._get_blocks(game_map=game_map, bounds=bounds)
+
+        explored = game_map.explored[tiles]
+        walkable = game_map.tiles["walkable"][tiles]
+
+        pixels = self._pixels[blocks]
+        pixels[...] = 0
+        pixels[_reduce(explored & ~walkable, self.scale)] = MINIMAP_COLORS["wall"]
+        pixels[_reduce(explored & walkable, self.scale)] = MINIMAP_COLORS["floor"]
+
+    def _get_blocks(
+        self, game_map: GameMap, bounds: tuple[int, int, int, int]
+    ) -> tuple[tuple[slice, slice], tuple[slice, slice]]:
+        # Slices of the pixels covering the bounds, and of the tiles they cover
+        scale = self.scale
+        x0, y0, x1, y1 = bounds
+        bx0, by0 = x0 // scale, y0 // scale
+        bx1, by1 = -(-x1 // scale), -(-y1 // scale)
+
+        blocks = np.s_[bx0:bx1, by0:by1]
+        tiles = np.s_[
+            bx0 * scale : min(bx1 * scale, game_map.width),
+            by0 * scale : min(by1 * scale, game_map.height),
+        ]
+
+        return blocks, tiles
+
+    def render(
+        self,
+        console: Console,
+        game_map: GameMap,
+        player: tuple[int, int],
+        x: int,
+        y: int,
+    ) -> None:
+        """Method to render the minimap to a console.
+
+        Args:
+            console: Console to render to.
+
+            game_map: Game map to show.
+
+            player: Location of the player.
+
+            x: x-coordinate of the top-left corner of the minimap.
+
+            y: y-coordinate of the top-left corner of the minimap.
+        """
+        self.update(game_map=game_map)
+        assert self._pixels is not None
+
+        scale = self.scale
+        pixels = self._pixels.copy()
+
+        blocks, tiles = self._get_blocks(game_map=game_map, bounds=game_map.fov_bounds)
+        visible = game_map.visible[tiles] & game_map.tiles["walkable"][tiles]
+        pixels[blocks][_reduce(visible, scale)] = MINIMAP_COLORS["visible"]
+
+        stairs_x, stairs_y = game_map.stairs_location
+
+        if game_map.explored[stairs_x, stairs_y]:
+            pixels[stairs_x // scale, stairs_y // scale] = MINIMAP_COLORS["stairs"]
+
+        player_x, player_y = player
+        pixels[player_x // scale, player_y // scale] = MINIMAP_COLORS["player"]
+
+        # Semigraphics expect an image, with rows first
+        console.draw_semigraphics(pixels=pixels.transpose(1, 0, 2), x=x, y=y)
+
+
+def _reduce(mask: np.ndarray, scale: int) -> np.ndarray:
+    # Whether any tile is set in each block, padding partial blocks at the edges
+    width, height = mask.shape
+    pixels_x, pixels_y = -(-width // scale), -(-height // scale)
+
+    if (width, height) != (pixels_x * scale, pixels_y * scale):
+        padded = np.zeros((pixels_x * scale, pixels_y * scale), dtype=bool)
+        padded[:width, :height] = mask
+        mask = padded
+
+    blocks = mask.reshape(pixels_x, scale, pixels_y, scale)
+    reduced: np.ndarray = blocks.any(axis=(1, 3))
+    return reduced
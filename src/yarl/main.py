@@ -1,8 +1,16 @@
+from __future__ import annotations
+
+import argparse
+import contextlib
 import os
+import sys
 
 import tcod
+from yarl.backends import Backend, TcodBackend
 from yarl.game import Game
 from yarl.logger import logger
+from yarl.server import SpectatorPublisher
+from yarl.timing import FramePacer
 
 
 def get_tileset_path() -> str:
@@ -15,22 +23,98 @@ def get_background_img_path() -> str:
     return os.path.join(parent, "assets", "menu_background.png")
 
 
-def main() -> None:
-    screen_width = 100
-    screen_height = 50
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Yet Another RogueLike")
+    parser.add_argument(
+        "--terminal",
+        action="store_true",
+        help="Play in the terminal instead of a window, for example over SSH.",
+    )
+    parser.add_argument(
+        "--spectator-port",
+        type=int,
+        default=None,
+        help="Stream the game to spectators on this local port.",
+    )
+    parser.add_argument(
+        "--fps",
+        type=float,
+        default=60,
+        help="Maximum number of frames rendered per second, or 0 for no cap.",
+    )
+    parser.add_argument(
+        "--turn-interval",
+        type=float,
+        default=0.5,
+        help=(
+            "Seconds after which the enemies act if the player does nothing, "
+            "or 0 for a purely turn-based game."
+        ),
+    )
+    parser.add_argument(
+        "--no-vsync",
+        action="store_true",
+        help="Do not wait for the display to refresh before presenting a frame.",
+    )
+    args = parser.parse_args(argv)
+
+    if args.terminal and sys.platform == "win32":
+        parser.error("--terminal is not supported on Windows.")
+
+    return args
+
+
+def create_backend(
+    terminal: bool, screen_width: int, screen_height: int, vsync: bool = True
+) -> Backend:
+    if terminal:
+        # The terminal backend relies on POSIX-only modules
+        from yarl.backends.ansi import AnsiBackend
+
+        return AnsiBackend()
 
     tileset = tcod.tileset.load_tilesheet(
         get_tileset_path(), 32, 8, tcod.tileset.CHARMAP_TCOD
     )
 
-    with tcod.context.new(
+    context = tcod.context.new(
         columns=screen_width,
         rows=screen_height,
         tileset=tileset,
         title="Yet Another RogueLike",
-        vsync=True,
-    ) as context:
-        game = Game(map_width=80, map_height=43)
+        vsync=vsync,
+    )
+
+    return TcodBackend(context=context)
+
+
+def main(argv: list[str] | None = None) -> None:
+    args = parse_args(argv)
+
+    screen_width = 100
+    screen_height = 50
+
+    with contextlib.ExitStack() as stack:
+        backend = stack.enter_context(
+            create_backend(
+                terminal=args.terminal,
+                screen_width=screen_width,
+                screen_height=screen_height,
+                vsync=not args.no_vsync,
+            )
+        )
+
+        spectators: SpectatorPublisher | None = None
+
+        if args.spectator_port is not None:
+            spectators = stack.enter_context(
+                SpectatorPublisher(port=args.spectator_port)
+            )
+            logger.info(f"Streaming to spectators on {spectators.address}.")
+
+        game = Game(
+            map_width=80, map_height=43, turn_interval=args.turn_interval or None
+        )
 
         logger.info("Game started.")
 
@@ -38,8 +122,11 @@ def main() -> None:
 
         game.run(
             console=root_console,
-            context=context,
+            backend=backend,
             main_menu_background_path=get_background_img_path(),
+            recording_path=os.environ.get("YARL_RECORDING_PATH"),
+            spectators=spectators,
+            frame_pacer=FramePacer(max_fps=args.fps or None),
         )
 
 
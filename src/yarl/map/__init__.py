@@ -6,3 +6,6 @@ Package for handling game map, game map generation and game world generation.
 from .gamemap import GameMap
 from .gameworld import GameWorld
 from .mapgen import MapGenerator, RectangularRoom
+from .movement_batch import MovementBatch
+from .pathfinding import PathfindingService
+from .room_graph import RoomGraph
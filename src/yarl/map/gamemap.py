@@ -13,6 +13,9 @@ from tcod.map import compute_fov
 from yarl.entity import ActiveEntity, Item
 from yarl.exceptions import CollisionWithEntityException
 
+from .pathfinding import PathfindingService
+from .room_graph import RoomGraph
+
 if TYPE_CHECKING:
     from yarl.entity import Entity
 
@@ -35,12 +38,35 @@ class GameMap:
 
         visible (np.ndarray): Boolean array of dimensions `width x height`,
             representing the tiles currently visible to the player.
+            See `update_fov()`.
 
         explored (np.ndarray): Boolean array of dimensions `width x height`,
             representing the tiles the player as explored.
+            See `update_fov()`.
 
         stairs_location (tuple[int, int]): Location of stairs to descend to lower
             level of dungeon.
+
+        room_graph (RoomGraph): Connectivity graph of the rooms and corridors
+            in the map, used for long-distance pathfinding. It is populated
+            by the map generator.
+
+        pathfinding (PathfindingService): Service used to find paths on the map.
+
+        version (int): Counter that is incremented whenever an entity is added to,
+            moved on or removed from the map, or dies.
+
+        fov_version (int): Counter that is incremented whenever the FOV is recomputed.
+
+        fov_bounds (tuple[int, int, int, int]): Bounds of the region that contains
+            every visible tile, as `(x0, y0, x1, y1)` with exclusive ends.
+
+        explored_version (int): Counter that is incremented whenever tiles are
+            explored for the first time.
+
+        explored_bounds (tuple[int, int, int, int] | None): Bounds of the region
+            that contains the tiles explored the last time `explored_version` was
+            incremented, as `(x0, y0, x1, y1)` with exclusive ends.
     """
 
     def __init__(
@@ -66,13 +92,22 @@ class GameMap:
         self.entities = set(entities)
         self._entity_map: defaultdict[tuple[int, int], set[Entity]] = defaultdict(set)
         self.stairs_location = (0, 0)
+        self.room_graph = RoomGraph(width=width, height=height)
+        self.pathfinding = PathfindingService(game_map=self)
+        self.version = 0
 
         for entity in entities:
             self._entity_map[(entity.x, entity.y)].add(entity)
 
         self.tiles = np.full((width, height), fill_value=tiles.wall, order="F")
-        self.visible = np.full((width, height), fill_value=False, order="F")
-        self.explored = np.full((width, height), fill_value=False, order="F")
+        self._visible = np.full((width, height), fill_value=False, order="F")
+        self._explored = np.full((width, height), fill_value=False, order="F")
+        self._pending_pov: tuple[int, int] | None = None
+        self._computed_pov: tuple[int, int] | None = None
+        self.fov_version = 0
+        self.fov_bounds = (0, 0, 0, 0)
+        self.explored_version = 0
+        self.explored_bounds: tuple[int, int, int, int] | None = None
 
     def __repr__(self) -> str:
         return f"{self.__class__.__name__}(width={self.width}, height={self.height}, pov_radius={self.pov_radius})"
@@ -80,6 +115,18 @@ class GameMap:
     def __str__(self) -> str:
         return self.__repr__()
 
+    @property
+    def visible(self) -> np.ndarray:
+        """Tiles currently visible to the player."""
+        self.refresh_fov()
+        return self._visible
+
+    @property
+    def explored(self) -> np.ndarray:
+        """Tiles the player has explored."""
+        self.refresh_fov()
+        return self._explored
+
     def in_bounds(self, x: int, y: int) -> bool:
         """Method to check if `(x, y)` is within the bounds of the map.
 
@@ -95,16 +142,61 @@ class GameMap:
     def update_fov(self, pov: tuple[int, int]) -> None:
         """Method to update the field-of-view (FOV) with respect to a location.
 
+        The FOV is not computed right away but marked as stale, and it is
+        computed the next time `visible` or `explored` is read. This way, it is
+        computed once no matter how many times it is updated in between, for
+        example when several actions are handled before a frame is rendered.
+        It is not computed again if `pov` has not changed since the last time.
+
         Args:
             pov: Location with respect to which the POV should be updated.
         """
-        self.visible[:] = compute_fov(
+        self._pending_pov = pov
+
+    def refresh_fov(self) -> None:
+        """Method to compute the FOV right away if it is stale."""
+        pov = self._pending_pov
+
+        if pov is None:
+            return
+
+        self._pending_pov = None
+
+        # The tiles do not change once the map has been generated
+        if pov == self._computed_pov:
+            return
+
+        self._visible[:] = compute_fov(
             transparency=self.tiles["transparent"],
             pov=pov,
             radius=self.pov_radius,
             algorithm=tcod.FOV_BASIC,
         )
-        self.explored |= self.visible
+        self._computed_pov = pov
+        self.fov_version += 1
+
+        # Every visible tile is within the radius, so only that region is checked
+        x, y = pov
+        radius = self.pov_radius
+
+        if radius > 0:
+            self.fov_bounds = (
+                max(x - radius, 0),
+                max(y - radius, 0),
+                min(x + radius + 1, self.width),
+                min(y + radius + 1, self.height),
+            )
+        else:
+            self.fov_bounds = (0, 0, self.width, self.height)
+
+        x0, y0, x1, y1 = self.fov_bounds
+        visible = self._visible[x0:x1, y0:y1]
+        explored = self._explored[x0:x1, y0:y1]
+
+        if (visible & ~explored).any():
+            explored |= visible
+            self.explored_version += 1
+            self.explored_bounds = self.fov_bounds
 
     def get_entities(self, x: int, y: int) -> set[Entity]:
         """Method to obtain the entities at location `(x, y)`.
@@ -181,6 +273,21 @@ class GameMap:
         entities = self.get_entities(x=x, y=y)
         return {entity for entity in entities if isinstance(entity, Item)}
 
+    def get_sorted_items(self, x: int, y: int) -> list[Item]:
+        """Method to obtain the items at location `(x, y)` in a reproducible order.
+
+        Items are stored in a set, so they are sorted by name. This lets them be
+        referred to by their index, for example in recordings and server requests.
+
+        Args:
+            x: x-coordinate of the location.
+            y: y-coordinate of the location.
+
+        Returns:
+            Items at location `(x, y)`, sorted by name.
+        """
+        return sorted(self.get_items(x=x, y=y), key=lambda item: item.name)
+
     def get_active_entity(self, x: int, y: int) -> ActiveEntity | None:
         """Method to obtain the active entity at location `(x, y)`.
 
@@ -244,6 +351,7 @@ class GameMap:
 
         self._entity_map[(x, y)].add(entity)
         entity.place(x=x, y=y)
+        self.version += 1
 
     def add_entity(
         self, entity: Entity, x: int = -1, y: int = -1, *, check_blocking: bool = True
@@ -286,6 +394,7 @@ class GameMap:
         entity.place(x=x, y=y)
         self.entities.add(entity)
         self._entity_map[(x, y)].add(entity)
+        self.version += 1
 
     def remove_entity(self, entity: Entity) -> None:
         """Method to remove an entity from the map.
@@ -300,6 +409,7 @@ class GameMap:
 
         entities.discard(entity)
         self.entities.discard(entity)
+        self.version += 1
 
     def get_names_at_location(self, x: int, y: int) -> str:
         """Method to obtain the names of the entities at location `(x, y)`.
@@ -364,6 +474,15 @@ class GameMap:
     def render(self, console: Console) -> None:
         """Method to render the tiles and entities of the game map to console.
 
+        Args:
+            console: Console to render to.
+        """
+        self.render_tiles(console=console)
+        self.render_entities(console=console)
+
+    def render_tiles(self, console: Console) -> None:
+        """Method to render the tiles of the game map to console.
+
         Args:
             console: Console to render to.
         """
@@ -373,6 +492,12 @@ class GameMap:
             default=tiles.SHROUD,
         )
 
+    def render_entities(self, console: Console) -> None:
+        """Method to render the visible entities of the game map to console.
+
+        Args:
+            console: Console to render to.
+        """
         for entity in sorted(self.entities, key=lambda x: x.render_order.value):
             if self.visible[entity.x, entity.y]:
                 console.print(
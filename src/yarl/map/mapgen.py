@@ -190,17 +190,24 @@ class MapGenerator:
     def create_bsp_tree(self) -> BSP:
         """Method to create a BSP tree and obtain its root node.
 
+        The tree is split using a generator seeded from the `random` module,
+        so that seeding `random` is enough to make map generation reproducible.
+
         Returns:
             Root node of the generated BSP tree.
         """
         root = tcod.bsp.BSP(x=0, y=0, width=self.map_width, height=self.map_height)
 
+        rng = tcod.random.Random(seed=random.getrandbits(32))
+
         root.split_recursive(
             depth=self.depth,
             min_width=self.room_min_size + 1,
             min_height=self.room_min_size + 1,
             max_horizontal_ratio=1.5,
             max_vertical_ratio=1.5,
+            # tcod passes `seed` to C as is, so it needs the underlying generator
+            seed=rng.random_c,
         )
 
         return root
@@ -250,6 +257,7 @@ class MapGenerator:
         room = RectangularRoom.fromnode(node=node)
 
         self.game_map.tiles[room.inner] = tiles.floor
+        self.game_map.room_graph.add_room(room)
 
         self.rooms.append(room)
 
@@ -281,6 +289,8 @@ class MapGenerator:
     def connect_rooms(self, node1: BSP, node2: BSP) -> None:
         """Method to connect the two rooms represented by the given BSP nodes.
 
+        The tunnel is also added as a corridor to the room graph of the map.
+
         Args:
             node1: First node to connect.
             node2: Second node to connect.
@@ -288,9 +298,18 @@ class MapGenerator:
         room1 = RectangularRoom.fromnode(node=node1)
         room2 = RectangularRoom.fromnode(node=node2)
 
-        for x, y in self.tunnel_coordinates(room1.center, room2.center):
+        tunnel = [
+            (int(x), int(y))
+            for x, y in self.tunnel_coordinates(room1.center, room2.center)
+        ]
+
+        for x, y in tunnel:
             self.game_map.tiles[x, y] = tiles.floor
 
+        self.game_map.room_graph.add_corridor(
+            start=room1.center, end=room2.center, tiles=tunnel
+        )
+
     def place_objects(
         self,
         room: RectangularRoom,
@@ -386,6 +405,7 @@ class MapGenerator:
             >>> game_map = generator.generate_map()
         """
         self.game_map = GameMap(width=self.map_width, height=self.map_height)
+        self.rooms = []
 
         bsp = self.create_bsp_tree()
 
@@ -0,0 +1,155 @@
+"""This module defines the class that is used to move multiple entities simultaneously."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from yarl.entity import ActiveEntity
+
+    from .gamemap import GameMap
+
+
+class MovementBatch:
+    """Class to collect the moves of multiple entities and apply them simultaneously.
+
+    Moves are submitted with `submit()` and applied with `resolve()`. Conflicts are
+    resolved through a cell-reservation array: each destination is reserved by the
+    entity that submitted its move first, and a move only succeeds if its entity holds
+    the reservation and the destination is vacated by the end of the batch. Entities
+    that would swap places are not moved, while longer chains of entities following
+    each other are moved together.
+
+    Attributes:
+        game_map (GameMap): Map the entities are moved on.
+
+        moves (dict[ActiveEntity, tuple[int, int]]): Submitted destinations, in
+            submission order.
+    """
+
+    def __init__(self, game_map: GameMap) -> None:
+        """Create an empty MovementBatch.
+
+        Args:
+            game_map: Map the entities are moved on.
+        """
+        self.game_map = game_map
+        self.moves: dict[ActiveEntity, tuple[int, int]] = {}
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(moves={len(self.moves)})"
+
+    def __str__(self) -> str:
+        return self.__repr__()
+
+    def __len__(self) -> int:
+        return len(self.moves)
+
+    def submit(self, entity: ActiveEntity, dx: int, dy: int) -> bool:
+        """Method to submit a move for an entity.
+
+        Like [`MovementAction`][yarl.actions.MovementAction], the move is
+        dropped if the entity is waiting to move. If the entity has already
+        submitted a move, it is replaced but keeps its priority.
+
+        Args:
+            entity: Entity to move.
+
+            dx: Deviation in the x-direction from the entity's current location.
+
+            dy: Deviation in the y-direction from the entity's current location.
+
+        Returns:
+            `True` if the move was accepted, `False` if the entity is waiting to move
+                or the destination is out of bounds or not walkable.
+        """
+        if entity.is_waiting_to_move:
+            return False
+
+        game_map = self.game_map
+        x, y = entity.x + dx, entity.y + dy
+
+        if not game_map.in_bounds(x=x, y=y) or not game_map.tiles["walkable"][x, y]:
+            return False
+
+        self.moves[entity] = (x, y)
+        return True
+
+    def resolve(self) -> list[ActiveEntity]:
+        """Method to apply the submitted moves and empty the batch.
+
+        Returns:
+            Entities whose moves were rejected.
+        """
+        moves = {
+            entity: destination
+            for entity, destination in self.moves.items()
+            if entity.is_alive
+        }
+        self.moves = {}
+
+        if not moves:
+            return []
+
+        game_map = self.game_map
+        width, height = game_map.width, game_map.height
+
+        entities = list(moves)
+        count = len(entities)
+        index = np.arange(count)
+
+        sources = np.array([(entity.x, entity.y) for entity in entities])
+        destinations = np.array(list(moves.values()))
+
+        src = np.ravel_multi_index((sources[:, 0], sources[:, 1]), (width, height))
+        dst = np.ravel_multi_index(
+            (destinations[:, 0], destinations[:, 1]), (width, height)
+        )
+
+        # Cells held by blocking entities which are not part of the batch
+        static = np.zeros(width * height, dtype=bool)
+        static[
+            np.array(
+                [
+                    np.ravel_multi_index((entity.x, entity.y), (width, height))
+                    for entity in game_map.entities
+                    if entity.blocking and entity not in moves
+                ],
+                dtype=np.intp,
+            )
+        ] = True
+
+        occupant = np.full(width * height, fill_value=-1)
+        occupant[src] = index
+
+        blocker = occupant[dst]
+        has_blocker = blocker >= 0
+
+        swapping = np.zeros(count, dtype=bool)
+        swapping[has_blocker] = dst[blocker[has_blocker]] == src[has_blocker]
+
+        moving = ~static[dst] & ~swapping
+
+        reservation = np.empty(width * height, dtype=index.dtype)
+
+        while True:
+            reservation.fill(count)
+            np.minimum.at(reservation, dst[moving], index[moving])
+
+            blocked_by_staying = np.zeros(count, dtype=bool)
+            blocked_by_staying[has_blocker] = ~moving[blocker[has_blocker]]
+
+            still_moving = moving & (reservation[dst] == index) & ~blocked_by_staying
+
+            if np.array_equal(still_moving, moving):
+                break
+
+            moving = still_moving
+
+        for i in np.flatnonzero(moving):
+            x, y = moves[entities[i]]
+            game_map.move_entity(entity=entities[i], x=x, y=y, check_blocking=False)
+
+        return [entities[i] for i in np.flatnonzero(~moving)]
@@ -0,0 +1,156 @@
+"""This module defines the class that is used to answer path queries on a game map."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+import tcod
+
+if TYPE_CHECKING:
+    from .gamemap import GameMap
+
+
+class PathfindingService:
+    """Class to answer path queries on a game map while reusing pathfinding state.
+
+    The cost array and the graph built from it are created once per map. The costs
+    are updated in place whenever the entities in the map have changed (as tracked by
+    `GameMap.version`), so the graph never needs to be rebuilt.
+
+    Searches are rooted at the destination of a query and cached per destination
+    until the map changes. Since the search expands incrementally, a single search
+    answers the queries of all entities heading to the same destination, such
+    as every enemy chasing the player in a turn.
+
+    Attributes:
+        game_map (GameMap): Map the paths are computed on.
+
+        max_pathfinders (int): Maximum number of searches to keep at any time.
+    """
+
+    BLOCKING_ENTITY_COST: int = 10
+    """Extra cost of moving through a location with a blocking entity."""
+
+    def __init__(self, game_map: GameMap, max_pathfinders: int = 8) -> None:
+        """Create a pathfinding service.
+
+        Args:
+            game_map: Map the paths are computed on.
+
+            max_pathfinders: Maximum number of searches to keep at any time.
+                Defaults to 8.
+        """
+        self.game_map = game_map
+        self.max_pathfinders = max_pathfinders
+
+        self._reset()
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(max_pathfinders={self.max_pathfinders})"
+
+    def __str__(self) -> str:
+        return self.__repr__()
+
+    def __getstate__(self) -> dict[str, Any]:
+        # tcod objects cannot be pickled and are cheap to rebuild
+        return {"game_map": self.game_map, "max_pathfinders": self.max_pathfinders}
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._reset()
+
+    def _reset(self) -> None:
+        self._cost: np.ndarray | None = None
+        self._graph: tcod.path.SimpleGraph | None = None
+        self._pathfinders: dict[tuple[int, int], tcod.path.Pathfinder] = {}
+        self._version = -1
+
+    def invalidate(self) -> None:
+        """Method to discard all cached state.
+
+        It should be called after the tiles of the map have been changed.
+        Changes to the entities are picked up automatically.
+        """
+        self._reset()
+
+    def get_graph(self) -> tcod.path.SimpleGraph:
+        """Method to obtain the graph used for pathfinding, with up-to-date costs.
+
+        Returns:
+            Graph representing the current state of the map.
+        """
+        game_map = self.game_map
+
+        if self._graph is None or self._cost is None:
+            self._cost = np.array(game_map.tiles["walkable"], dtype=np.int8, order="F")
+            self._graph = tcod.path.SimpleGraph(cost=self._cost, cardinal=2, diagonal=3)
+            self._version = -1
+
+        if self._version != game_map.version:
+            self._update_cost()
+
+        return self._graph
+
+    def _update_cost(self) -> None:
+        """Method to update the cost array in place and discard stale searches."""
+        game_map, cost = self.game_map, self._cost
+
+        assert cost is not None
+
+        np.copyto(cost, game_map.tiles["walkable"], casting="unsafe")
+
+        for entity in game_map.entities:
+            if entity.blocking is False or cost[entity.x, entity.y] == 0:
+                continue
+
+            cost[entity.x, entity.y] += self.BLOCKING_ENTITY_COST
+
+        # Searches keep their results when the costs change and `Pathfinder.clear()`
+        # does not reset the paths found so far, so stale searches are replaced
+        self._pathfinders.clear()
+        self._version = game_map.version
+
+    def get_pathfinder(self, root: tuple[int, int]) -> tcod.path.Pathfinder:
+        """Method to obtain the search rooted at a location.
+
+        Args:
+            root: Location the search is rooted at.
+
+        Returns:
+            Search rooted at `root`.
+        """
+        graph = self.get_graph()
+        pathfinders = self._pathfinders
+
+        pathfinder = pathfinders.get(root)
+
+        if pathfinder is None:
+            if len(pathfinders) >= self.max_pathfinders:
+                del pathfinders[next(iter(pathfinders))]
+
+            pathfinder = tcod.path.Pathfinder(graph=graph)
+            pathfinder.add_root(index=root)
+            pathfinders[root] = pathfinder
+
+        return pathfinder
+
+    def get_path(
+        self, start: tuple[int, int], goal: tuple[int, int]
+    ) -> list[tuple[int, int]]:
+        """Method to obtain the shortest path between two locations.
+
+        Args:
+            start: Location to start from.
+
+            goal: Location to reach.
+
+        Returns:
+            Path from `start` to `goal`, excluding `start`. It is
+                empty if `goal` cannot be reached.
+        """
+        pathfinder = self.get_pathfinder(root=goal)
+
+        path: list[list[int]] = pathfinder.path_from(index=start)[1:].tolist()
+
+        return [(x, y) for x, y in path]
@@ -0,0 +1,369 @@
+"""This module defines the class that is used to represent the connectivity of the rooms
+and corridors of a map, which is used for hierarchical pathfinding.
+"""
+
+from __future__ import annotations
+
+import heapq
+import itertools
+from typing import TYPE_CHECKING, Iterable
+
+import numpy as np
+import tcod
+
+if TYPE_CHECKING:
+    from .mapgen import RectangularRoom
+
+
+class RoomGraph:
+    """Class to represent the connectivity graph of the rooms and corridors of a map.
+
+    The nodes of the graph are waypoints: the centers of the rooms and the junctions
+    between which corridors have been dug. The edges are the corridors. Each edge
+    stores the tiles of its corridor so that a route through the graph can be
+    turned into a walkable path without searching the grid.
+
+    A path between two locations is found by first routing between the waypoints
+    closest to the two locations (room-level routing) and then stitching together
+    the corridors along the route and the paths from the locations to the
+    waypoints (intra-room paths). Both the shortest-path trees of the graph and the
+    intra-room paths are cached.
+
+    Attributes:
+        width (int): Width of the map.
+
+        height (int): Height of the map.
+
+        nodes (list[tuple[int, int]]): Locations of the waypoints.
+
+        edges (list[dict[int, tuple[tuple[int, int], ...]]]): Corridors by waypoint.
+            `edges[a][b]` contains the tiles of the corridor from waypoint `a` to
+            waypoint `b`, including both of them.
+
+        rooms (list[RectangularRoom]): Rooms in the map.
+
+        room_index (np.ndarray): Integer array of dimensions `width x height`
+            with the index of the room each tile belongs to, or -1 if the
+            tile is not inside a room.
+    """
+
+    def __init__(self, width: int, height: int) -> None:
+        """Create an empty RoomGraph.
+
+        Args:
+            width: Width of the map.
+
+            height: Height of the map.
+        """
+        self.width, self.height = width, height
+
+        self.nodes: list[tuple[int, int]] = []
+        self.edges: list[dict[int, tuple[tuple[int, int], ...]]] = []
+        self.rooms: list[RectangularRoom] = []
+        self.room_index = np.full(
+            (width, height), fill_value=-1, dtype=np.int32, order="F"
+        )
+
+        self._node_ids: dict[tuple[int, int], int] = {}
+        self._room_nodes: list[int] = []
+        self._corridor_tiles: dict[tuple[int, int], tuple[int, int, int]] = {}
+        self._trees: dict[int, tuple[dict[int, int], dict[int, int]]] = {}
+        self._entry_points: dict[
+            tuple[int, int], list[tuple[int, tuple[tuple[int, int], ...]]]
+        ] = {}
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(rooms={len(self.rooms)}, nodes={len(self.nodes)})"
+
+    def __str__(self) -> str:
+        return self.__repr__()
+
+    def add_node(self, location: tuple[int, int]) -> int:
+        """Method to add a waypoint to the graph.
+
+        Args:
+            location: Location of the waypoint.
+
+        Returns:
+            Index of the waypoint. If a waypoint already exists at
+                `location`, its index is returned.
+        """
+        node = self._node_ids.get(location)
+
+        if node is not None:
+            return node
+
+        node = len(self.nodes)
+        self.nodes.append(location)
+        self.edges.append({})
+        self._node_ids[location] = node
+
+        return node
+
+    def add_room(self, room: RectangularRoom) -> int:
+        """Method to add a room to the graph.
+
+        The center of the room is added as a waypoint.
+
+        Args:
+            room: Room to add.
+
+        Returns:
+            Index of the waypoint at the center of the room.
+        """
+        node = self.add_node(room.center)
+
+        self.room_index[room.inner] = len(self.rooms)
+        self.rooms.append(room)
+
+        # Corridors dug before the room was created can pass through it
+        x_slice, y_slice = room.inner
+        for location in itertools.product(
+            range(x_slice.start, x_slice.stop), range(y_slice.start, y_slice.stop)
+        ):
+            self._corridor_tiles.pop(location, None)
+        self._room_nodes.append(node)
+
+        self._clear_cache()
+
+        return node
+
+    def add_corridor(
+        self,
+        start: tuple[int, int],
+        end: tuple[int, int],
+        tiles: Iterable[tuple[int, int]],
+    ) -> None:
+        """Method to add a corridor between two locations to the graph.
+
+        Both locations are added as waypoints.
+
+        Args:
+            start: Location where the corridor starts.
+
+            end: Location where the corridor ends.
+
+            tiles: Tiles of the corridor, from `start` to `end`.
+        """
+        corridor = tuple(location for location, _ in itertools.groupby(tiles))
+
+        a, b = self.add_node(start), self.add_node(end)
+
+        if a == b:
+            return
+
+        existing = self.edges[a].get(b)
+
+        if existing is not None and len(existing) <= len(corridor):
+            return
+
+        self.edges[a][b] = corridor
+        self.edges[b][a] = corridor[::-1]
+
+        for i, (x, y) in enumerate(corridor):
+            if self.room_index[x, y] == -1:
+                self._corridor_tiles[(x, y)] = (a, b, i)
+
+        self._clear_cache()
+
+    def get_path(
+        self, start: tuple[int, int], goal: tuple[int, int]
+    ) -> list[tuple[int, int]]:
+        """Method to obtain a walkable path between two locations using the graph.
+
+        Args:
+            start: Location to start from.
+
+            goal: Location to reach.
+
+        Returns:
+            Path from `start` to `goal`, excluding `start`. It is empty
+                if either location is not in a room or a corridor,
+                or if there is no route between them.
+        """
+        if start == goal:
+            return []
+
+        x1, y1 = start
+        x2, y2 = goal
+
+        room = self.room_index[x1, y1]
+
+        if room != -1 and room == self.room_index[x2, y2]:
+            # Rooms are rectangular, so a straight line never leaves them
+            return [(int(x), int(y)) for x, y in tcod.los.bresenham(start, goal)[1:]]
+
+        best: tuple[int, int, tuple, int, tuple] | None = None
+
+        goals = self.get_entry_points(goal)
+
+        for start_node, start_path in self.get_entry_points(start):
+            distances, _ = self._get_tree(start_node)
+
+            for goal_node, goal_path in goals:
+                distance = distances.get(goal_node)
+
+                if distance is None:
+                    continue
+
+                total = len(start_path) + distance + len(goal_path)
+
+                if best is None or total < best[0]:
+                    best = (total, start_node, start_path, goal_node, goal_path)
+
+        if best is None:
+            return []
+
+        _, start_node, start_path, goal_node, goal_path = best
+
+        path = [start, *start_path]
+
+        route = self.get_route(start_node, goal_node)
+
+        for a, b in zip(route, route[1:]):
+            path.extend(self.edges[a][b][1:])
+
+        path.extend(goal_path[::-1][1:])
+        path.append(goal)
+
+        return self._remove_loops(path)[1:]
+
+    def get_route(self, start_node: int, goal_node: int) -> list[int]:
+        """Method to obtain the shortest route between two waypoints.
+
+        Args:
+            start_node: Index of the waypoint to start from.
+
+            goal_node: Index of the waypoint to reach.
+
+        Returns:
+            Indices of the waypoints along the route, including both ends.
+                It is empty if there is no route.
+        """
+        distances, previous = self._get_tree(start_node)
+
+        if goal_node not in distances:
+            return []
+
+        route = [goal_node]
+
+        while route[-1] != start_node:
+            route.append(previous[route[-1]])
+
+        return route[::-1]
+
+    def get_entry_points(
+        self, location: tuple[int, int]
+    ) -> list[tuple[int, tuple[tuple[int, int], ...]]]:
+        """Method to obtain the waypoints that can be reached directly from a location.
+
+        A location inside a room can reach the waypoint at the center of
+        the room. A location on a corridor can reach the waypoints at both
+        ends of the corridor.
+
+        Args:
+            location: Location to obtain the waypoints for.
+
+        Returns:
+            Waypoints with the path from `location` to each of them,
+                excluding `location`.
+        """
+        entry_points = self._entry_points.get(location)
+
+        if entry_points is not None:
+            return entry_points
+
+        x, y = location
+
+        entry_points = []
+
+        if not (0 <= x < self.width and 0 <= y < self.height):
+            return entry_points
+
+        room = self.room_index[x, y]
+
+        if room != -1:
+            node = self._room_nodes[room]
+            line = tcod.los.bresenham(location, self.nodes[node])[1:]
+            entry_points.append((node, tuple((int(i), int(j)) for i, j in line)))
+        elif location in self._corridor_tiles:
+            a, b, i = self._corridor_tiles[location]
+            corridor = self.edges[a][b]
+            entry_points.append((a, corridor[:i][::-1]))
+            entry_points.append((b, corridor[i + 1 :]))
+
+        self._entry_points[location] = entry_points
+
+        return entry_points
+
+    def _get_tree(self, source: int) -> tuple[dict[int, int], dict[int, int]]:
+        """Method to obtain the shortest-path tree of the graph rooted at a waypoint.
+
+        The tree is computed via Dijkstra's algorithm and cached.
+
+        Args:
+            source: Index of the root waypoint.
+
+        Returns:
+            Distance to each reachable waypoint.
+
+            Previous waypoint along the shortest route to each reachable waypoint.
+        """
+        tree = self._trees.get(source)
+
+        if tree is not None:
+            return tree
+
+        distances = {source: 0}
+        previous: dict[int, int] = {}
+        heap = [(0, source)]
+
+        while heap:
+            distance, node = heapq.heappop(heap)
+
+            if distance > distances[node]:
+                continue
+
+            for neighbor, corridor in self.edges[node].items():
+                new_distance = distance + len(corridor) - 1
+
+                if new_distance < distances.get(neighbor, new_distance + 1):
+                    distances[neighbor] = new_distance
+                    previous[neighbor] = node
+                    heapq.heappush(heap, (new_distance, neighbor))
+
+        self._trees[source] = distances, previous
+
+        return distances, previous
+
+    def _clear_cache(self) -> None:
+        self._trees.clear()
+        self._entry_points.clear()
+
+    @staticmethod
+    def _remove_loops(path: list[tuple[int, int]]) -> list[tuple[int, int]]:
+        """Method to remove the parts of a path which revisit a location.
+
+        Args:
+            path: Path to remove loops from.
+
+        Returns:
+            Path without loops.
+        """
+        result: list[tuple[int, int]] = []
+        seen: dict[tuple[int, int], int] = {}
+
+        for location in path:
+            index = seen.get(location)
+
+            if index is not None:
+                for removed in result[index + 1 :]:
+                    del seen[removed]
+
+                del result[index + 1 :]
+                continue
+
+            seen[location] = len(result)
+            result.append(location)
+
+        return result
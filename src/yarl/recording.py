@@ -0,0 +1,491 @@
+"""This module defines the classes and functions that are used to record the actions
+taken in a game to a compact binary log, so that the game can be replayed.
+
+A game is fully determined by the parameters of the game, the seed of the `random`
+module and the sequence of player actions and enemy turns. The log stores exactly
+that: a header with the seed and the parameters, followed by one record per
+player action or enemy turn, in the order they happened.
+
+All values are little-endian. The header is made up of:
+
+- The magic bytes `b"YARL"`.
+- The format version (`uint8`).
+- The seed (`uint64`).
+- The length (`uint32`) of the game parameters followed by the parameters,
+    encoded as UTF-8 JSON.
+
+Each record starts with its [`RecordType`][yarl.recording.RecordType]
+(`uint8`) followed by a payload which depends on the type:
+
+- Directed actions: `dx` and `dy` (`int8` each).
+- Item references: the [`ItemSource`][yarl.recording.ItemSource] (`uint8`)
+    and the index of the item in its source (`uint8`).
+- Pickups and drops: the number of items (`uint8`) followed by the index of
+    each item in its source (`uint8` each).
+- Targeted items: an item reference followed by `x` and `y` (`int16` each).
+- Level ups: the boosted stat (`uint8`, see `BOOSTS`) and the amount (`int16`).
+- Everything else has no payload.
+
+Items are referenced by their index in the player's inventory or, for items on
+the ground, in the list of items at the player's location sorted by name.
+Records are only ever appended, so a log cut short by a crash can still be
+replayed up to its last complete record.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import struct
+from enum import IntEnum
+from typing import TYPE_CHECKING, Any, BinaryIO, Iterator
+
+from yarl.actions import (
+    BumpAction,
+    ConsumeItemAction,
+    ConsumeTargetedItemAction,
+    DropItemFromInventoryAction,
+    LevelUpAction,
+    MeleeAction,
+    MovementAction,
+    PickupAction,
+    TakeStairsAction,
+    WaitAction,
+)
+
+if TYPE_CHECKING:
+    from yarl.actions import Action
+    from yarl.engine import Engine
+    from yarl.entity import Item
+
+
+MAGIC = b"YARL"
+"""Bytes every log starts with."""
+
+FORMAT_VERSION = 1
+"""Version of the format written by [`ActionRecorder`][yarl.recording.ActionRecorder]."""
+
+BOOSTS: tuple[str | None, ...] = (None, "max_hp", "power", "defense")
+"""Stats that can be boosted on level up, by their code in the log."""
+
+_HEADER = struct.Struct("<4sBQI")
+_DIRECTION = struct.Struct("<bb")
+_ITEM = struct.Struct("<BB")
+_LOCATION = struct.Struct("<hh")
+_BOOST = struct.Struct("<Bh")
+
+
+class RecordType(IntEnum):
+    """Types of records in a log."""
+
+    ENEMY_TURN = 0
+    """A complete turn of the enemies."""
+
+    BUMP = 1
+    """[`BumpAction`][yarl.actions.BumpAction]."""
+
+    MOVEMENT = 2
+    """[`MovementAction`][yarl.actions.MovementAction]."""
+
+    MELEE = 3
+    """[`MeleeAction`][yarl.actions.MeleeAction]."""
+
+    WAIT = 4
+    """[`WaitAction`][yarl.actions.WaitAction]."""
+
+    TAKE_STAIRS = 5
+    """[`TakeStairsAction`][yarl.actions.TakeStairsAction]."""
+
+    PICKUP = 6
+    """[`PickupAction`][yarl.actions.PickupAction]."""
+
+    DROP = 7
+    """[`DropItemFromInventoryAction`][yarl.actions.DropItemFromInventoryAction]."""
+
+    CONSUME = 8
+    """[`ConsumeItemAction`][yarl.actions.ConsumeItemAction]."""
+
+    CONSUME_TARGETED = 9
+    """[`ConsumeTargetedItemAction`][yarl.actions.ConsumeTargetedItemAction]."""
+
+    LEVEL_UP = 10
+    """[`LevelUpAction`][yarl.actions.LevelUpAction]."""
+
+
+class ItemSource(IntEnum):
+    """Places an item referenced in a record can be found in."""
+
+    INVENTORY = 0
+    """The player's inventory."""
+
+    GROUND = 1
+    """The player's location."""
+
+    NONE = 2
+    """No item."""
+
+
+_DIRECTED_TYPES = {
+    BumpAction: RecordType.BUMP,
+    MovementAction: RecordType.MOVEMENT,
+    MeleeAction: RecordType.MELEE,
+}
+
+
+def _get_ground_items(engine: Engine) -> list[Item]:
+    player = engine.player
+    return engine.game_map.get_sorted_items(x=player.x, y=player.y)
+
+
+def _get_item_index(engine: Engine, source: ItemSource, item: Item) -> int:
+    if source is ItemSource.INVENTORY:
+        inventory = engine.player.inventory
+        items = [] if inventory is None else inventory.items
+    else:
+        items = _get_ground_items(engine=engine)
+
+    for index, other in enumerate(items):
+        if other is item:
+            return index
+
+    raise ValueError(f"The item {item.name} cannot be found in the {source.name}.")
+
+
+def _encode_item(engine: Engine, item: Item | None) -> bytes:
+    if item is None:
+        return _ITEM.pack(ItemSource.NONE, 0)
+
+    inventory = engine.player.inventory
+
+    if inventory is not None and any(other is item for other in inventory.items):
+        source = ItemSource.INVENTORY
+    else:
+        source = ItemSource.GROUND
+
+    return _ITEM.pack(source, _get_item_index(engine=engine, source=source, item=item))
+
+
+def _encode_items(engine: Engine, source: ItemSource, items: list[Item]) -> bytes:
+    indices = [
+        _get_item_index(engine=engine, source=source, item=item) for item in items
+    ]
+    return bytes([len(indices), *indices])
+
+
+def encode_action(action: Action) -> bytes:
+    """Function to encode a player action as a record.
+
+    It must be called before the action is performed, since items are
+    referenced by their position at the time the action is taken.
+
+    Args:
+        action: Action to encode.
+
+    Returns:
+        Encoded record.
+
+    Raises:
+        ValueError: If the action cannot be encoded, for example because it
+            references an item which is neither in the inventory nor at the
+            player's location.
+    """
+    engine = action.engine
+
+    if isinstance(action, (BumpAction, MovementAction, MeleeAction)):
+        record_type = _DIRECTED_TYPES[type(action)]
+        return bytes([record_type]) + _DIRECTION.pack(action.dx, action.dy)
+
+    if isinstance(action, WaitAction):
+        return bytes([RecordType.WAIT])
+
+    if isinstance(action, TakeStairsAction):
+        return bytes([RecordType.TAKE_STAIRS])
+
+    if isinstance(action, PickupAction):
+        items = _encode_items(
+            engine=engine, source=ItemSource.GROUND, items=action.items
+        )
+        return bytes([RecordType.PICKUP]) + items
+
+    if isinstance(action, DropItemFromInventoryAction):
+        items = _encode_items(
+            engine=engine, source=ItemSource.INVENTORY, items=action.items
+        )
+        return bytes([RecordType.DROP]) + items
+
+    if isinstance(action, ConsumeItemAction):
+        item = _encode_item(engine=engine, item=action.item)
+        return bytes([RecordType.CONSUME]) + item
+
+    if isinstance(action, ConsumeTargetedItemAction):
+        item = _encode_item(engine=engine, item=action.item)
+        location = _LOCATION.pack(*action.target_location)
+        return bytes([RecordType.CONSUME_TARGETED]) + item + location
+
+    if isinstance(action, LevelUpAction):
+        boost = _BOOST.pack(BOOSTS.index(action.boost), action.amount)
+        return bytes([RecordType.LEVEL_UP]) + boost
+
+    raise ValueError(f"Actions of type {type(action).__name__} cannot be recorded.")
+
+
+def decode_action(engine: Engine, record_type: RecordType, payload: bytes) -> Action:
+    """Function to decode a record into a player action.
+
+    It must be called right before the action is performed, since items are
+    referenced by their position at the time the action is taken.
+
+    Args:
+        engine: Engine representing the current game.
+
+        record_type: Type of the record. It must not be `RecordType.ENEMY_TURN`.
+
+        payload: Payload of the record.
+
+    Returns:
+        Decoded action.
+
+    Raises:
+        ValueError: If the record does not represent an action.
+    """
+    player = engine.player
+
+    match record_type:
+        case RecordType.BUMP | RecordType.MOVEMENT | RecordType.MELEE:
+            cls = {value: key for key, value in _DIRECTED_TYPES.items()}[record_type]
+            dx, dy = _DIRECTION.unpack(payload)
+            return cls(engine=engine, entity=player, dx=dx, dy=dy)
+        case RecordType.WAIT:
+            return WaitAction(engine=engine, entity=player)
+        case RecordType.TAKE_STAIRS:
+            return TakeStairsAction(engine=engine, entity=player)
+        case RecordType.PICKUP:
+            items = _get_ground_items(engine=engine)
+            return PickupAction(
+                engine=engine,
+                entity=player,
+                items=[items[index] for index in payload[1:]],
+            )
+        case RecordType.DROP:
+            inventory = player.inventory
+            items = [] if inventory is None else inventory.items
+            return DropItemFromInventoryAction(
+                engine=engine,
+                entity=player,
+                items=[items[index] for index in payload[1:]],
+            )
+        case RecordType.CONSUME:
+            item = _decode_item(engine=engine, payload=payload)
+            return ConsumeItemAction(engine=engine, entity=player, item=item)
+        case RecordType.CONSUME_TARGETED:
+            item = _decode_item(engine=engine, payload=payload[: _ITEM.size])
+            x, y = _LOCATION.unpack(payload[_ITEM.size :])
+            return ConsumeTargetedItemAction(
+                engine=engine, entity=player, target_location=(x, y), item=item
+            )
+        case RecordType.LEVEL_UP:
+            boost, amount = _BOOST.unpack(payload)
+            return LevelUpAction(
+                engine=engine, entity=player, boost=BOOSTS[boost], amount=amount
+            )
+
+    raise ValueError(f"Records of type {record_type.name} do not represent actions.")
+
+
+def _decode_item(engine: Engine, payload: bytes) -> Item | None:
+    source, index = _ITEM.unpack(payload)
+
+    if source == ItemSource.NONE:
+        return None
+
+    items: list[Item]
+
+    if source == ItemSource.INVENTORY:
+        inventory = engine.player.inventory
+
+        if inventory is None:
+            return None
+
+        items = inventory.items
+    else:
+        items = _get_ground_items(engine=engine)
+
+    return items[int(index)]
+
+
+class ActionRecorder:
+    """Class to append the player actions and enemy turns of a game to a log.
+
+    The recorder is attached to an engine through `Engine.recorder`, after
+    which [`Engine.handle_player_action()`][yarl.engine.Engine.handle_player_action]
+    records every player action and [`AIExecutor`][yarl.ai_executor.AIExecutor]
+    records every completed enemy turn.
+
+    The `random` module must be seeded with `seed` before the engine is created.
+
+    Attributes:
+        path (str): Path of the log.
+
+        seed (int): Seed of the `random` module for the recorded game.
+
+        params (dict[str, Any]): Parameters of the recorded game.
+            See [`Game.todict()`][yarl.game.Game.todict].
+
+        records (int): Number of records written by this recorder.
+    """
+
+    def __init__(self, path: str, seed: int, params: dict[str, Any]) -> None:
+        """Create a recorder, overwriting the log at `path` if it exists.
+
+        Args:
+            path: Path of the log.
+
+            seed: Seed of the `random` module for the recorded game.
+
+            params: Parameters of the recorded game.
+        """
+        self.path = path
+        self.seed = seed
+        self.params = params
+        self.records = 0
+
+        encoded = json.dumps(params).encode("utf-8")
+
+        self._file: BinaryIO = open(path, "wb")
+        self._file.write(_HEADER.pack(MAGIC, FORMAT_VERSION, seed, len(encoded)))
+        self._file.write(encoded)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(path={self.path!r}, seed={self.seed})"
+
+    def __str__(self) -> str:
+        return self.__repr__()
+
+    def __enter__(self) -> ActionRecorder:
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+    @property
+    def closed(self) -> bool:
+        """Indicates whether the log has been closed."""
+        return self._file.closed
+
+    def record_action(self, action: Action) -> None:
+        """Method to record a player action.
+
+        It must be called before the action is performed.
+
+        Args:
+            action: Action to record.
+        """
+        self._file.write(encode_action(action=action))
+        self.records += 1
+
+    def record_enemy_turn(self) -> None:
+        """Method to record a complete turn of the enemies."""
+        self._file.write(bytes([RecordType.ENEMY_TURN]))
+        self.records += 1
+
+    def flush(self) -> None:
+        """Method to write any buffered records to the log."""
+        self._file.flush()
+
+    def close(self) -> None:
+        """Method to write any buffered records and close the log."""
+        self._file.close()
+
+
+class ActionLog:
+    """Class to read a log written by [`ActionRecorder`][yarl.recording.ActionRecorder].
+
+    Attributes:
+        path (str): Path of the log.
+
+        seed (int): Seed of the `random` module for the recorded game.
+
+        params (dict[str, Any]): Parameters of the recorded game.
+    """
+
+    def __init__(self, path: str) -> None:
+        """Open a log and read its header.
+
+        Args:
+            path: Path of the log.
+
+        Raises:
+            ValueError: If the file is not a log or was written with
+                an unsupported version of the format.
+        """
+        self.path = path
+
+        with open(path, "rb") as f:
+            header = f.read(_HEADER.size)
+
+            if len(header) < _HEADER.size:
+                raise ValueError(f"{path} is not a valid log.")
+
+            magic, version, seed, length = _HEADER.unpack(header)
+
+            if magic != MAGIC:
+                raise ValueError(f"{path} is not a valid log.")
+
+            if version != FORMAT_VERSION:
+                raise ValueError(f"Unsupported log version {version}.")
+
+            self.seed: int = seed
+            self.params: dict[str, Any] = json.loads(f.read(length).decode("utf-8"))
+            self._offset = f.tell()
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(path={self.path!r}, seed={self.seed})"
+
+    def __str__(self) -> str:
+        return self.__repr__()
+
+    def __iter__(self) -> Iterator[tuple[RecordType, bytes]]:
+        return self.records()
+
+    def records(self) -> Iterator[tuple[RecordType, bytes]]:
+        """Method to iterate over the records in the log.
+
+        An incomplete record at the end of the log, as left by a crash, is ignored.
+
+        Yields:
+            Type and payload of each record.
+        """
+        with open(self.path, "rb") as f:
+            f.seek(self._offset)
+            data = f.read()
+
+        offset, size = 0, len(data)
+
+        while offset < size:
+            record_type = RecordType(data[offset])
+            offset += 1
+
+            match record_type:
+                case RecordType.PICKUP | RecordType.DROP:
+                    length = 1 + (data[offset] if offset < size else 0)
+                case RecordType.BUMP | RecordType.MOVEMENT | RecordType.MELEE:
+                    length = _DIRECTION.size
+                case RecordType.CONSUME:
+                    length = _ITEM.size
+                case RecordType.CONSUME_TARGETED:
+                    length = _ITEM.size + _LOCATION.size
+                case RecordType.LEVEL_UP:
+                    length = _BOOST.size
+                case _:
+                    length = 0
+
+            if offset + length > size:
+                return
+
+            yield record_type, data[offset : offset + length]
+            offset += length
+
+    @property
+    def size(self) -> int:
+        """Size of the log in bytes."""
+        return os.path.getsize(self.path)
@@ -0,0 +1,22 @@
+"""Package for hosting many games in a single process, driven over a socket."""
+
+
+from .server import (
+    DEFAULT_GAME_PARAMS,
+    MAX_MAP_SIZE,
+    MIN_MAP_SIZE,
+    PARAM_RANGES,
+    GameServer,
+    LatencyStats,
+)
+from .session import Session, parse_action
+from .spectator import (
+    CELL_DTYPE,
+    FrameDecoder,
+    FrameType,
+    SpectatorPublisher,
+    cells_to_console,
+    console_to_cells,
+    encode_delta,
+    encode_keyframe,
+)
@@ -0,0 +1,434 @@
+"""This module defines the class that is used to host many games in a single process.
+
+The server speaks a line-delimited JSON protocol over TCP or a Unix socket: each
+request is a JSON object on its own line and each response is a JSON object on its
+own line, in the same order. Requests carry an operation in `op`:
+
+- `{"op": "new", "params": {...}, "seed": 1}`: Create a session. `params` and `seed`
+    are optional. The response contains the ID of the session in `session` and a
+    full update in `state`. Parameters of the wrong type or out of range, like a
+    map larger than the server allows, are rejected.
+- `{"op": "act", "session": 1, "action": {...}}`: Play a turn in a session. The
+    response contains whether the action was performed in `performed` and an update
+    in `state`. See [`parse_action()`][yarl.server.session.parse_action].
+- `{"op": "state", "session": 1}`: Obtain a full update of a session.
+- `{"op": "close", "session": 1}`: Close a session.
+- `{"op": "stats"}`: Obtain the number of sessions, the latency of actions and,
+    if tracked, the memory used per session.
+
+Every response has `ok` set to `true` on success, or to `false` with the reason in
+`error` on failure. If a request has an `id`, it is copied to the response.
+
+Examples:
+
+    Running a server on port 8765:
+
+    ```pycon
+    >>> import asyncio
+    >>> from yarl.server import GameServer
+    >>> asyncio.run(GameServer().serve(host="127.0.0.1", port=8765))
+    ```
+"""
+
+from __future__ import annotations
+
+import asyncio
+import itertools
+import json
+import math
+import time
+import tracemalloc
+from collections import deque
+from typing import Any
+
+import numpy as np
+from yarl.game import Game
+from yarl.logger import logger
+from yarl.utils import remove_socket_file
+
+from .session import Session
+
+DEFAULT_GAME_PARAMS: dict[str, Any] = {
+    "map_width": 80,
+    "map_height": 43,
+    "turn_interval": None,
+}
+"""Parameters of the games hosted by default. Games are turn-based since the
+server only advances a game when it receives an action."""
+
+MAX_MAP_SIZE = (200, 200)
+"""Largest map clients can ask for by default, as `(width, height)`."""
+
+MIN_MAP_SIZE = 20
+"""Smallest width and height of a map that clients can ask for."""
+
+PARAM_RANGES: dict[str, tuple[int, int | None]] = {
+    "room_min_size": (2, 8),
+    "player_max_hp": (1, None),
+    "player_defense": (0, None),
+    "player_power": (0, None),
+    "player_movement_delay": (0, None),
+    "player_attack_delay": (0, None),
+    "player_inventory_capacity": (0, None),
+}
+"""Smallest and largest values (or `None` for no limit) of the integer parameters
+clients can set, other than the size of the map."""
+
+
+class LatencyStats:
+    """Class to keep track of how long operations take.
+
+    Attributes:
+        count (int): Number of operations measured.
+
+        total (float): Total time (in seconds) of all operations.
+
+        max (float): Longest time (in seconds) of an operation.
+
+        samples (deque[float]): Times (in seconds) of the most recent operations.
+    """
+
+    def __init__(self, max_samples: int = 10000) -> None:
+        """Create empty latency stats.
+
+        Args:
+            max_samples: Number of recent operations to keep the times of, for
+                percentiles. Defaults to 10000.
+        """
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.samples: deque[float] = deque(maxlen=max_samples)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(count={self.count})"
+
+    def __str__(self) -> str:
+        return self.__repr__()
+
+    def add(self, elapsed: float) -> None:
+        """Method to record the time of an operation.
+
+        Args:
+            elapsed: Time (in seconds) of the operation.
+        """
+        self.count += 1
+        self.total += elapsed
+        self.max = max(self.max, elapsed)
+        self.samples.append(elapsed)
+
+    def todict(self) -> dict[str, float | int]:
+        """Method to summarize the stats, with times in milliseconds.
+
+        Returns:
+            Count, mean, median, 99th percentile and maximum.
+        """
+        if not self.count:
+            return {"count": 0}
+
+        p50, p99 = np.percentile(self.samples, [50, 99]) * 1000
+
+        return {
+            "count": self.count,
+            "mean_ms": self.total / self.count * 1000,
+            "p50_ms": float(p50),
+            "p99_ms": float(p99),
+            "max_ms": self.max * 1000,
+        }
+
+
+class GameServer:
+    """Class to host many games in a single process.
+
+    All sessions share the event loop and run on its thread. Sessions are not tied
+    to connections, so a client can reconnect and resume a session; they live
+    until they are closed.
+
+    Attributes:
+        game_params (dict[str, Any]): Parameters of the games, which requests can
+            override.
+
+        max_sessions (int): Maximum number of open sessions.
+
+        max_map_size (tuple[int, int]): Largest map clients can ask for, as
+            `(width, height)`.
+
+        track_memory (bool): Whether the memory allocated when creating each session
+            is measured. It slows down the whole process.
+
+        sessions (dict[int, Session]): Open sessions by ID.
+
+        latency (LatencyStats): Time taken by `act` requests.
+    """
+
+    def __init__(
+        self,
+        game_params: dict[str, Any] | None = None,
+        max_sessions: int = 10000,
+        track_memory: bool = False,
+        max_map_size: tuple[int, int] = MAX_MAP_SIZE,
+    ) -> None:
+        """Create a server.
+
+        Args:
+            game_params: Parameters of the games, which requests can override. If set
+                to `None`, it falls back to using `DEFAULT_GAME_PARAMS`.
+
+            max_sessions: Maximum number of open sessions. Defaults to 10000.
+
+            track_memory: Whether the memory allocated when creating each session
+                should be measured. Defaults to `False`.
+
+            max_map_size: Largest map clients can ask for, as `(width, height)`.
+                Defaults to `MAX_MAP_SIZE`.
+        """
+        self.game_params = game_params or DEFAULT_GAME_PARAMS
+        self.max_sessions = max_sessions
+        self.track_memory = track_memory
+        self.max_map_size = max_map_size
+        self.sessions: dict[int, Session] = {}
+        self.latency = LatencyStats()
+
+        self._ids = itertools.count(1)
+        self._session_memory: dict[int, int] = {}
+
+        if track_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(sessions={len(self.sessions)})"
+
+    def __str__(self) -> str:
+        return self.__repr__()
+
+    def handle_request(self, request: dict[str, Any]) -> dict[str, Any]:
+        """Method to handle a single request.
+
+        Errors are reported in the response, so that a bad request does not
+        close the connection.
+
+        Args:
+            request: Request to handle.
+
+        Returns:
+            Response to the request.
+        """
+        try:
+            response = self._dispatch(request=request)
+        except (KeyError, ValueError) as e:
+            response = {"ok": False, "error": str(e)}
+        except Exception as e:
+            # Requests should be validated before they get this far
+            logger.exception("Failed to handle request.")
+            response = {"ok": False, "error": f"Internal error: {e!r}."}
+
+        if "id" in request:
+            response["id"] = request["id"]
+
+        return response
+
+    def _dispatch(self, request: dict[str, Any]) -> dict[str, Any]:
+        match request.get("op"):
+            case "new":
+                session = self.create_session(
+                    params=request.get("params"), seed=request.get("seed")
+                )
+                return {
+                    "ok": True,
+                    "session": session.session_id,
+                    "state": session.get_update(full=True),
+                }
+            case "act":
+                session = self._get_session(request=request)
+
+                start = time.perf_counter()
+                performed = session.perform(data=request["action"])
+                state = session.get_update()
+                self.latency.add(time.perf_counter() - start)
+
+                return {"ok": True, "performed": performed, "state": state}
+            case "state":
+                session = self._get_session(request=request)
+                return {"ok": True, "state": session.get_update(full=True)}
+            case "close":
+                session = self._get_session(request=request)
+                self.close_session(session_id=session.session_id)
+                return {"ok": True}
+            case "stats":
+                return {"ok": True, "stats": self.get_stats()}
+
+        raise ValueError(f"Unknown operation: {request.get('op')!r}.")
+
+    def _get_session(self, request: dict[str, Any]) -> Session:
+        session_id = request.get("session")
+        session = self.sessions.get(session_id) if isinstance(session_id, int) else None
+
+        if session is None:
+            raise ValueError(f"Unknown session: {session_id!r}.")
+
+        return session
+
+    def create_session(
+        self, params: dict[str, Any] | None = None, seed: int | None = None
+    ) -> Session:
+        """Method to create a session.
+
+        Args:
+            params: Parameters that override those of the server for this game.
+
+            seed: Seed for the `random` module. If set to `None`, the generator
+                is left as is.
+
+        Returns:
+            Created session.
+
+        Raises:
+            ValueError: If the maximum number of sessions are open, or the parameters
+                or the seed are not valid.
+        """
+        if len(self.sessions) >= self.max_sessions:
+            raise ValueError("Too many sessions.")
+
+        if seed is not None and not _is_int(seed):
+            raise ValueError(f"The seed must be an integer, got {seed!r}.")
+
+        if params is not None and not isinstance(params, dict):
+            raise ValueError(f"The parameters must be an object, got {params!r}.")
+
+        params = {**self.game_params, **(params or {})}
+        self._check_params(params=params)
+
+        game = Game.fromdict(params=params)
+        session_id = next(self._ids)
+
+        if self.track_memory:
+            before, _ = tracemalloc.get_traced_memory()
+
+        session = Session(session_id=session_id, game=game, seed=seed)
+
+        if self.track_memory:
+            after, _ = tracemalloc.get_traced_memory()
+            self._session_memory[session_id] = after - before
+
+        self.sessions[session_id] = session
+        return session
+
+    def _check_params(self, params: dict[str, Any]) -> None:
+        ranges: dict[str, tuple[int, int | None]] = {
+            **PARAM_RANGES,
+            "map_width": (MIN_MAP_SIZE, self.max_map_size[0]),
+            "map_height": (MIN_MAP_SIZE, self.max_map_size[1]),
+        }
+
+        for name, (low, high) in ranges.items():
+            if name not in params:
+                continue
+
+            value = params[name]
+
+            if not _is_int(value) or value < low or (high is not None and value > high):
+                limit = f"between {low} and {high}" if high is not None else f">= {low}"
+                raise ValueError(f"{name} must be an integer {limit}, got {value!r}.")
+
+        turn_interval = params.get("turn_interval")
+
+        if turn_interval is not None and (
+            not isinstance(turn_interval, (int, float))
+            or isinstance(turn_interval, bool)
+            or not math.isfinite(turn_interval)
+            or turn_interval <= 0
+        ):
+            raise ValueError(
+                f"turn_interval must be a positive number, got {turn_interval!r}."
+            )
+
+    def close_session(self, session_id: int) -> None:
+        """Method to close a session. It does nothing if the session does not exist.
+
+        Args:
+            session_id: ID of the session.
+        """
+        self.sessions.pop(session_id, None)
+        self._session_memory.pop(session_id, None)
+
+    def get_stats(self) -> dict[str, Any]:
+        """Method to obtain statistics about the server.
+
+        Returns:
+            Number of sessions, latency of `act` requests and, if memory is
+                tracked, the mean memory (in bytes) allocated per session.
+        """
+        stats: dict[str, Any] = {
+            "sessions": len(self.sessions),
+            "latency": self.latency.todict(),
+        }
+
+        if self.track_memory and self._session_memory:
+            memory = self._session_memory.values()
+            stats["memory_per_session"] = sum(memory) / len(memory)
+
+        return stats
+
+    async def handle_client(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        """Coroutine to serve the requests of a single connection until it is closed.
+
+        Args:
+            reader: Stream to read requests from.
+
+            writer: Stream to write responses to.
+        """
+        try:
+            while line := await reader.readline():
+                try:
+                    request = json.loads(line)
+                except json.JSONDecodeError as e:
+                    response = {"ok": False, "error": f"Invalid JSON: {e}."}
+                else:
+                    if isinstance(request, dict):
+                        response = self.handle_request(request=request)
+                    else:
+                        response = {"ok": False, "error": "Requests must be objects."}
+
+                writer.write(json.dumps(response, separators=(",", ":")).encode())
+                writer.write(b"\n")
+                await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+    async def serve(
+        self, host: str | None = None, port: int | None = None, path: str | None = None
+    ) -> None:
+        """Coroutine to serve connections forever.
+
+        Args:
+            host: Host to listen on over TCP.
+
+            port: Port to listen on over TCP.
+
+            path: Path of the Unix socket to listen on. If set, `host` and `port`
+                are ignored. A socket left at the path by an earlier server is
+                removed, and the path is removed again when serving stops.
+        """
+        if path is not None:
+            remove_socket_file(path)
+            server = await asyncio.start_unix_server(self.handle_client, path=path)
+        else:
+            server = await asyncio.start_server(
+                self.handle_client, host=host, port=port
+            )
+
+        try:
+            async with server:
+                await server.serve_forever()
+        finally:
+            if path is not None:
+                remove_socket_file(path)
+
+
+def _is_int(value: Any) -> bool:
+    # Booleans are integers in Python but not in requests
+    return isinstance(value, int) and not isinstance(value, bool)
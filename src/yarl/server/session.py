@@ -0,0 +1,325 @@
+"""This module defines the class that is used to represent a game hosted by the server."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+from yarl.actions import (
+    BumpAction,
+    ConsumeItemAction,
+    ConsumeTargetedItemAction,
+    DropItemFromInventoryAction,
+    LevelUpAction,
+    MeleeAction,
+    MovementAction,
+    PickupAction,
+    TakeStairsAction,
+    WaitAction,
+)
+
+if TYPE_CHECKING:
+    from yarl.actions import Action
+    from yarl.engine import Engine
+    from yarl.entity import Item
+    from yarl.game import Game
+
+
+LEVEL_UP_BOOSTS: dict[str | None, int] = {
+    None: 0,
+    "max_hp": 20,
+    "power": 1,
+    "defense": 1,
+}
+"""Amount each stat is boosted by on level up, like in the level up menu."""
+
+
+class Session:
+    """Class to represent a game hosted by the server.
+
+    Each session owns an engine and advances it one turn per action, independently
+    of other sessions. After each action, only what has changed since the last
+    update is sent back (see `get_update()`).
+
+    Locations in updates are flattened to `x + y * width`.
+
+    Attributes:
+        session_id (int): ID of the session.
+
+        engine (Engine): Engine representing the game.
+
+        turns (int): Number of turns played.
+    """
+
+    def __init__(self, session_id: int, game: Game, seed: int | None = None) -> None:
+        """Create a session.
+
+        Args:
+            session_id: ID of the session.
+
+            game: Game to host.
+
+            seed: Seed for the `random` module, which is shared by all sessions.
+                If set to `None`, the generator is left as is.
+        """
+        self.session_id = session_id
+        self.engine = game.get_engine(seed=seed)
+        self.turns = 0
+
+        self._reset_sent_state()
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(session_id={self.session_id}, turns={self.turns})"
+
+    def __str__(self) -> str:
+        return self.__repr__()
+
+    def _reset_sent_state(self) -> None:
+        game_map = self.engine.game_map
+        self._sent_map = game_map
+        self._sent_explored = np.zeros_like(game_map.explored)
+        self._sent_messages = 0
+
+    def perform(self, data: dict[str, Any]) -> bool:
+        """Method to play a turn with an action.
+
+        Level ups do not take a turn. Any other action is followed by a turn of
+        the enemies, even if the action is not possible.
+
+        Args:
+            data: Action to take. See `parse_action()`.
+
+        Returns:
+            `True` if the action was performed, `False` otherwise.
+
+        Raises:
+            ValueError: If the action is not valid, the player is dead or the player
+                has to level up before taking any other action.
+        """
+        engine = self.engine
+        player = engine.player
+
+        if not player.is_alive:
+            raise ValueError("The game is over.")
+
+        action = parse_action(engine=engine, data=data)
+
+        if isinstance(action, LevelUpAction):
+            return engine.handle_player_action(action=action)
+
+        if player.level.can_level_up:
+            raise ValueError("The player has to level up first.")
+
+        self.turns += 1
+        return engine.step(action=action)
+
+    def get_update(self, full: bool = False) -> dict[str, Any]:
+        """Method to obtain the state of the game that has not been sent yet.
+
+        A full update is sent automatically when the player moves to a new floor.
+
+        Args:
+            full: Whether the whole state should be sent. Defaults to `False`.
+
+        Returns:
+            Update with the following keys:
+
+            - `full`: Whether this is a full update. If `True`, the client should
+                discard the map it knows.
+            - `floor`, `width` and `height`: Floor number and size of its map.
+            - `player`: Location and stats of the player.
+            - `walls` and `floors`: Newly explored walls and floor tiles.
+            - `visible`: Tiles currently visible.
+            - `entities`: Visible entities as `[location, char, name]`,
+                in render order.
+            - `messages_from` and `messages`: New messages and the index of
+                the first one in the log. The message at that index
+                replaces the known one when it has been stacked.
+        """
+        engine = self.engine
+        game_map, player = engine.game_map, engine.player
+
+        full = full or game_map is not self._sent_map
+
+        if full:
+            self._reset_sent_state()
+
+        width = game_map.width
+
+        new = game_map.explored & ~self._sent_explored
+        self._sent_explored |= new
+
+        walkable = game_map.tiles["walkable"]
+
+        def flatten(mask: np.ndarray) -> list[int]:
+            x, y = np.nonzero(mask)
+            locations: list[int] = (x + y * width).tolist()
+            return locations
+
+        entities = sorted(
+            (
+                entity
+                for entity in game_map.entities
+                if game_map.visible[entity.x, entity.y]
+            ),
+            key=lambda entity: entity.render_order.value,
+        )
+
+        message_log = engine.message_log
+        start = max(0, self._sent_messages - 1)
+        self._sent_messages = len(message_log)
+
+        fighter, level = player.fighter, player.level
+
+        return {
+            "full": full,
+            "floor": engine.game_world.current_floor,
+            "width": width,
+            "height": game_map.height,
+            "player": {
+                "location": player.x + player.y * width,
+                "hp": fighter.hp,
+                "max_hp": fighter.max_hp,
+                "power": fighter.power,
+                "defense": fighter.defense,
+                "level": level.current_level,
+                "xp": level.current_xp,
+                "can_level_up": level.can_level_up,
+                "inventory": [item.name for item in _get_inventory(engine=engine)],
+            },
+            "walls": flatten(new & ~walkable),
+            "floors": flatten(new & walkable),
+            "visible": flatten(game_map.visible),
+            "entities": [
+                [entity.x + entity.y * width, entity.char, entity.name]
+                for entity in entities
+            ],
+            "messages_from": start,
+            "messages": [
+                message.full_text for message in message_log.get_messages(start)
+            ],
+        }
+
+
+def _get_inventory(engine: Engine) -> list[Item]:
+    inventory = engine.player.inventory
+    return [] if inventory is None else inventory.items
+
+
+def parse_action(engine: Engine, data: dict[str, Any]) -> Action:
+    """Function to create a player action from its description in a request.
+
+    The type of the action is given by `data["type"]`:
+
+    - `"bump"`, `"move"` and `"melee"` take `dx` and `dy`, which must each be
+        -1, 0 or 1.
+    - `"wait"` and `"stairs"` take nothing.
+    - `"pickup"` takes the indices of the items at the player's location, sorted by
+        name, in `items`. All items are picked up if it is missing.
+    - `"drop"` takes the indices of the items in the inventory in `items`.
+    - `"consume"` takes the index of the item in the inventory in `item` or, if
+        `ground` is `true`, among the items at the player's location.
+    - `"consume_targeted"` takes the same as `"consume"` plus `x` and `y`.
+    - `"level_up"` takes the stat to boost in `boost`, or nothing to not boost any.
+
+    Numbers must be integers, indices must not be negative and `x` and `y` must be
+    on the map.
+
+    Args:
+        engine: Engine representing the current game.
+
+        data: Description of the action.
+
+    Returns:
+        Action for the player.
+
+    Raises:
+        ValueError: If the description is not valid.
+    """
+    player = engine.player
+
+    try:
+        match data["type"]:
+            case "bump" | "move" | "melee" as kind:
+                cls = {"bump": BumpAction, "move": MovementAction, "melee": MeleeAction}
+                dx, dy = _get_int(data, "dx"), _get_int(data, "dy")
+
+                if abs(dx) > 1 or abs(dy) > 1:
+                    raise ValueError(f"Invalid direction: ({dx}, {dy}).")
+
+                return cls[kind](engine=engine, entity=player, dx=dx, dy=dy)
+            case "wait":
+                return WaitAction(engine=engine, entity=player)
+            case "stairs":
+                return TakeStairsAction(engine=engine, entity=player)
+            case "pickup":
+                items = engine.game_map.get_sorted_items(x=player.x, y=player.y)
+
+                if "items" in data:
+                    items = [items[_as_index(index)] for index in data["items"]]
+
+                return PickupAction(engine=engine, entity=player, items=items)
+            case "drop":
+                inventory = _get_inventory(engine=engine)
+                items = [inventory[_as_index(index)] for index in data["items"]]
+                return DropItemFromInventoryAction(
+                    engine=engine, entity=player, items=items
+                )
+            case "consume":
+                item = _get_item(engine=engine, data=data)
+                return ConsumeItemAction(engine=engine, entity=player, item=item)
+            case "consume_targeted":
+                item = _get_item(engine=engine, data=data)
+                x, y = _get_int(data, "x"), _get_int(data, "y")
+
+                if not engine.game_map.in_bounds(x=x, y=y):
+                    raise ValueError(f"Invalid target location: ({x}, {y}).")
+
+                return ConsumeTargetedItemAction(
+                    engine=engine, entity=player, target_location=(x, y), item=item
+                )
+            case "level_up":
+                boost = data.get("boost")
+                return LevelUpAction(
+                    engine=engine,
+                    entity=player,
+                    boost=boost,
+                    amount=LEVEL_UP_BOOSTS[boost],
+                )
+    except (KeyError, IndexError, TypeError) as e:
+        raise ValueError(f"Invalid action: {data!r}.") from e
+
+    raise ValueError(f"Unknown action type: {data['type']!r}.")
+
+
+def _get_item(engine: Engine, data: dict[str, Any]) -> Item | None:
+    index = data.get("item")
+
+    if index is None:
+        return None
+
+    if data.get("ground", False):
+        player = engine.player
+        items = engine.game_map.get_sorted_items(x=player.x, y=player.y)
+    else:
+        items = _get_inventory(engine=engine)
+
+    return items[_as_index(index)]
+
+
+def _get_int(data: dict[str, Any], key: str) -> int:
+    # JSON numbers can be floats, including infinity, and booleans are ints in Python
+    value = data[key]
+
+    if not isinstance(value, int) or isinstance(value, bool):
+        raise ValueError(f"{key} must be an integer, got {value!r}.")
+
+    return value
+
+
+def _as_index(value: Any) -> int:
+    # Negative indices would silently count from the end
+    if not isinstance(value, int) or isinstance(value, bool) or value < 0:
+        raise ValueError(f"Invalid index: {value!r}.")
+
+    return value
@@ -0,0 +1,646 @@
+"""This module defines the classes and functions that are used to stream the frames
+of a game to spectators.
+
+The stream is a sequence of messages. Each message starts with a header made up of
+its [`FrameType`][yarl.server.spectator.FrameType] (`uint8`), the number of the
+frame (`uint32`), the width and height of the frame (`uint16` each) and the
+length of the payload (`uint32`), all little-endian. The payload is compressed
+with zlib.
+
+Frames are made up of cells, one per tile in row-major order. Each cell holds the
+character (`uint32`), the foreground color and the background color (three `uint8`
+each) of its tile.
+
+- Keyframes hold every cell of the frame.
+- Deltas hold the cells that differ from the last keyframe. The payload starts
+    with the number of runs (`uint32`), followed by the length of each run
+    (`uint32` each) and the cells that differ. Runs alternate between cells that
+    are the same as in the keyframe and cells that differ, starting with cells
+    that are the same.
+
+Since deltas only depend on the last keyframe, a spectator can skip any number
+of them and still decode the next one.
+
+Examples:
+
+    Streaming a game to spectators on port 8766:
+
+    ```pycon
+    >>> from yarl.server import SpectatorPublisher
+    >>> with SpectatorPublisher(host="127.0.0.1", port=8766) as spectators:
+    ...     game.run(console=console, backend=backend, spectators=spectators)
+    ```
+
+    Watching it in a terminal:
+
+    ```pycon
+    >>> import socket, sys
+    >>> from yarl.backends.ansi import AnsiRenderer
+    >>> from yarl.server import FrameDecoder, cells_to_console
+    >>> decoder, renderer = FrameDecoder(), AnsiRenderer()
+    >>> with socket.create_connection(("127.0.0.1", 8766)) as sock:
+    ...     while data := sock.recv(65536):
+    ...         for cells in decoder.feed(data):
+    ...             sys.stdout.write(renderer.render(cells_to_console(cells)))
+    ```
+"""
+
+from __future__ import annotations
+
+import selectors
+import socket
+import struct
+import threading
+import zlib
+from collections import deque
+from enum import IntEnum
+from typing import Any
+
+import numpy as np
+from tcod.console import Console
+from yarl.utils import remove_socket_file
+
+CELL_DTYPE = np.dtype([("ch", "<u4"), ("fg", "u1", (3,)), ("bg", "u1", (3,))])
+"""Layout of a cell in a frame."""
+
+_HEADER = struct.Struct("<BIHHI")
+_COUNT = struct.Struct("<I")
+
+
+class FrameType(IntEnum):
+    """Types of messages in a stream."""
+
+    KEYFRAME = 0
+    DELTA = 1
+
+
+def console_to_cells(console: Console) -> np.ndarray:
+    """Function to extract the cells of a frame from a console.
+
+    Args:
+        console: Console to extract the cells from.
+
+    Returns:
+        Cells of the frame, with shape `(height, width)`.
+    """
+    return _tiles_to_cells(console.rgba.T)
+
+
+def cells_to_console(cells: np.ndarray) -> Console:
+    """Function to create a console that shows a frame.
+
+    Args:
+        cells: Cells of the frame, with shape `(height, width)`.
+
+    Returns:
+        Console in Fortran order with the characters and colors of the cells.
+    """
+    height, width = cells.shape
+    console = Console(width, height, order="F")
+
+    tiles = console.rgba.T
+    tiles["ch"] = cells["ch"]
+    tiles["fg"][..., :3] = cells["fg"]
+    tiles["bg"][..., :3] = cells["bg"]
+
+    return console
+
+
+def encode_keyframe(cells: np.ndarray, number: int, level: int = 6) -> bytes:
+    """Function to encode a frame in full.
+
+    Args:
+        cells: Cells of the frame, with shape `(height, width)`.
+
+        number: Number of the frame.
+
+        level: Compression level of zlib. Defaults to 6.
+
+    Returns:
+        Encoded message.
+    """
+    payload = zlib.compress(np.ascontiguousarray(cells).tobytes(), level)
+    return _pack(FrameType.KEYFRAME, number, cells.shape, payload)
+
+
+def encode_delta(
+    cells: np.ndarray, keyframe: np.ndarray, number: int, level: int = 6
+) -> bytes:
+    """Function to encode the cells of a frame that differ from a keyframe.
+
+    Args:
+        cells: Cells of the frame, with shape `(height, width)`.
+
+        keyframe: Cells of the keyframe, with the same shape.
+
+        number: Number of the frame.
+
+        level: Compression level of zlib. Defaults to 6.
+
+    Returns:
+        Encoded message.
+    """
+    flat = np.ascontiguousarray(cells).reshape(-1)
+    changed = _as_void(flat) != _as_void(np.ascontiguousarray(keyframe).reshape(-1))
+
+    # Indices where the cells switch between being the same and being different
+    edges = np.flatnonzero(np.diff(changed)) + 1
+    bounds: np.ndarray = np.concatenate(
+        (np.array([0]), edges, np.array([changed.size]))
+    )
+    runs: np.ndarray = np.diff(bounds)
+
+    # Runs start with cells that are the same, even if there are none
+    if changed.size and changed[0]:
+        runs = np.concatenate((np.array([0]), runs))
+
+    payload = b"".join(
+        (
+            _COUNT.pack(runs.size),
+            runs.astype("<u4").tobytes(),
+            flat[changed].tobytes(),
+        )
+    )
+
+    return _pack(FrameType.DELTA, number, cells.shape, zlib.compress(payload, level))
+
+
+def _pack(
+    frame_type: FrameType, number: int, shape: tuple[int, ...], payload: bytes
+) -> bytes:
+    height, width = shape
+    return _HEADER.pack(frame_type, number, width, height, len(payload)) + payload
+
+
+class FrameDecoder:
+    """Class to decode a stream of frames.
+
+    Attributes:
+        keyframe (np.ndarray | None): Cells of the last keyframe, if any.
+
+        number (int | None): Number of the last frame decoded, if any.
+    """
+
+    def __init__(self) -> None:
+        """Create a decoder."""
+        self.keyframe: np.ndarray | None = None
+        self.number: int | None = None
+        self._buffer = bytearray()
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(number={self.number})"
+
+    def __str__(self) -> str:
+        return self.__repr__()
+
+    def feed(self, data: bytes) -> list[np.ndarray]:
+        """Method to decode the frames completed by some data from the stream.
+
+        Deltas received before the first keyframe are skipped.
+
+        Args:
+            data: Data received from the stream.
+
+        Returns:
+            Cells of each frame completed by `data`, in order.
+        """
+        buffer = self._buffer
+        buffer.extend(data)
+
+        frames: list[np.ndarray] = []
+        offset = 0
+
+        while len(buffer) - offset >= _HEADER.size:
+            frame_type, number, width, height, length = _HEADER.unpack_from(
+                buffer, offset
+            )
+            start = offset + _HEADER.size
+
+            if len(buffer) - start < length:
+                break
+
+            payload = zlib.decompress(buffer[start : start + length])
+            offset = start + length
+
+            cells = self._decode(FrameType(frame_type), payload, (height, width))
+
+            if cells is not None:
+                self.number = number
+                frames.append(cells)
+
+        del buffer[:offset]
+
+        return frames
+
+    def _decode(
+        self, frame_type: FrameType, payload: bytes, shape: tuple[int, int]
+    ) -> np.ndarray | None:
+        if frame_type is FrameType.KEYFRAME:
+            self.keyframe = np.frombuffer(payload, dtype=CELL_DTYPE).reshape(shape)
+            return self.keyframe
+
+        keyframe = self.keyframe
+
+        if keyframe is None or keyframe.shape != shape:
+            return None
+
+        (count,) = _COUNT.unpack_from(payload)
+        start = _COUNT.size + count * 4
+        runs = np.frombuffer(payload, dtype="<u4", count=count, offset=_COUNT.size)
+
+        changed = np.repeat(np.arange(count) % 2 == 1, runs)
+
+        cells = keyframe.reshape(-1).copy()
+        cells[changed] = np.frombuffer(payload, dtype=CELL_DTYPE, offset=start)
+
+        return cells.reshape(shape)
+
+
+class _Subscriber:
+    """Class to represent the connection of a spectator and its pending output."""
+
+    def __init__(self, sock: socket.socket) -> None:
+        self.sock = sock
+        self.pending: deque[bytes] = deque()
+        self.pending_size = 0
+        self.sent = 0
+        self.needs_keyframe = True
+
+    def enqueue(self, message: bytes) -> None:
+        self.pending.append(message)
+        self.pending_size += len(message)
+
+    def drop_pending(self) -> None:
+        # A message that has been partly sent must be completed to keep the
+        # stream readable
+        if self.sent:
+            partial = self.pending.popleft()
+            self.pending.clear()
+            self.pending.append(partial)
+            self.pending_size = len(partial)
+        else:
+            self.pending.clear()
+            self.pending_size = 0
+
+    def flush(self) -> int:
+        written = 0
+
+        while self.pending:
+            message = self.pending[0]
+
+            try:
+                count = self.sock.send(memoryview(message)[self.sent :])
+            except BlockingIOError:
+                break
+
+            written += count
+            self.sent += count
+
+            if self.sent < len(message):
+                break
+
+            self.pending.popleft()
+            self.pending_size -= len(message)
+            self.sent = 0
+
+        return written
+
+
+class SpectatorPublisher:
+    """Class to stream the frames of a game to spectators over a socket.
+
+    The game loop hands each frame to
+    [`publish()`][yarl.server.spectator.SpectatorPublisher.publish], which only
+    copies the tiles of the console. Encoding the frames and sending them is done
+    on a background thread. If that thread falls behind, only the most recent
+    frame is encoded.
+
+    A keyframe is sent every `keyframe_interval` frames, when the size of the
+    frame changes, or when a delta would be about as large as a keyframe. Other
+    frames are sent as deltas against the last keyframe.
+
+    The output waiting to be sent to each spectator is bounded. When a spectator
+    does not keep up, its pending output is dropped and it is sent the last
+    keyframe and the current delta instead, so slow spectators skip frames
+    rather than slow down the game or use more memory.
+
+    Attributes:
+        address (Any): Address the publisher listens on.
+
+        keyframe_interval (int): Maximum number of frames between keyframes.
+
+        max_buffer_size (int): Maximum number of bytes waiting to be sent to a
+            spectator.
+
+        max_subscribers (int): Maximum number of spectators connected at once.
+
+        compression_level (int): Compression level of zlib.
+
+        frames_published (int): Number of frames handed to the publisher.
+
+        frames_encoded (int): Number of frames encoded. Frames published while the
+            background thread is busy are skipped.
+
+        bytes_sent (int): Total number of bytes sent to all spectators.
+
+        resyncs (int): Number of times the output of a spectator was dropped
+            because it did not keep up.
+    """
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        path: str | None = None,
+        keyframe_interval: int = 60,
+        max_buffer_size: int = 1 << 20,
+        max_subscribers: int = 8,
+        compression_level: int = 6,
+    ) -> None:
+        """Create a publisher and start listening for spectators.
+
+        Args:
+            host: Host to listen on over TCP. Defaults to `"127.0.0.1"`.
+
+            port: Port to listen on over TCP. If set to 0, a free port is chosen,
+                which can be read from `address`. Defaults to 0.
+
+            path: Path of the Unix socket to listen on. If set, `host` and `port`
+                are ignored. A socket left at the path by an earlier publisher is
+                removed, and the path is removed again when the publisher is closed.
+
+            keyframe_interval: Maximum number of frames between keyframes.
+                Defaults to 60.
+
+            max_buffer_size: Maximum number of bytes that can wait to be sent
+                to a spectator. Defaults to 1 MiB.
+
+            max_subscribers: Maximum number of spectators connected at once.
+                Others are disconnected right away. Defaults to 8.
+
+            compression_level: Compression level of zlib. Defaults to 6.
+        """
+        self.keyframe_interval = keyframe_interval
+        self.max_buffer_size = max_buffer_size
+        self.max_subscribers = max_subscribers
+        self.compression_level = compression_level
+
+        self.frames_published = 0
+        self.frames_encoded = 0
+        self.bytes_sent = 0
+        self.resyncs = 0
+
+        self._path = path
+
+        if path is not None:
+            remove_socket_file(path)
+            self._listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            self._listener.bind(path)
+        else:
+            self._listener = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+            self._listener.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+            self._listener.bind((host, port))
+
+        self._listener.listen()
+        self._listener.setblocking(False)
+        self.address = self._listener.getsockname()
+
+        self._selector = selectors.DefaultSelector()
+        self._selector.register(self._listener, selectors.EVENT_READ)
+
+        # Written to by the game loop to wake the background thread up
+        self._wake_reader, self._wake_writer = socket.socketpair()
+        self._wake_reader.setblocking(False)
+        self._wake_writer.setblocking(False)
+        self._selector.register(self._wake_reader, selectors.EVENT_READ)
+
+        self._lock = threading.Lock()
+        self._frame: tuple[np.ndarray, np.dtype] | None = None
+        self._closed = False
+        self._thread: threading.Thread | None = None
+
+        self._subscribers: dict[socket.socket, _Subscriber] = {}
+        self._keyframe: np.ndarray | None = None
+        self._keyframe_message = b""
+        self._since_keyframe = 0
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(address={self.address!r})"
+
+    def __str__(self) -> str:
+        return self.__repr__()
+
+    def __enter__(self) -> SpectatorPublisher:
+        self.start()
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+    @property
+    def subscribers(self) -> int:
+        """Number of spectators connected."""
+        return len(self._subscribers)
+
+    def start(self) -> None:
+        """Method to start the background thread that serves the spectators."""
+        if self._thread is None:
+            self._thread = threading.Thread(
+                target=self._serve, name="spectator-publisher", daemon=True
+            )
+            self._thread.start()
+
+    def publish(self, console: Console) -> None:
+        """Method to hand a frame to the publisher.
+
+        It returns right away. Any frame that has not been encoded yet is
+        replaced.
+
+        Args:
+            console: Console with the frame.
+        """
+        tiles = console.rgba.T
+
+        # Copying raw tiles is much faster than copying structured ones
+        frame = tiles.view(f"V{tiles.dtype.itemsize}").copy(order="C")
+
+        with self._lock:
+            self._frame = frame, tiles.dtype
+            self.frames_published += 1
+
+        try:
+            self._wake_writer.send(b"\0")
+        except (BlockingIOError, OSError):
+            pass
+
+    def close(self) -> None:
+        """Method to stop the background thread and disconnect all spectators."""
+        if self._closed:
+            return
+
+        self._closed = True
+
+        try:
+            self._wake_writer.send(b"\0")
+        except (BlockingIOError, OSError):
+            pass
+
+        if self._thread is not None:
+            self._thread.join()
+
+        for sock in list(self._subscribers):
+            self._disconnect(sock)
+
+        self._selector.close()
+        self._listener.close()
+        self._wake_reader.close()
+        self._wake_writer.close()
+
+        if self._path is not None:
+            remove_socket_file(self._path)
+
+    def _serve(self) -> None:
+        while not self._closed:
+            for key, events in self._selector.select():
+                sock = key.fileobj
+
+                if sock is self._listener:
+                    self._accept()
+                elif sock is self._wake_reader:
+                    self._drain_wake()
+                elif events & selectors.EVENT_READ and not self._receive(sock):
+                    self._disconnect(sock)
+                elif events & selectors.EVENT_WRITE and sock in self._subscribers:
+                    self._flush(key.data)
+
+            with self._lock:
+                frame, self._frame = self._frame, None
+
+            if frame is not None:
+                self._broadcast(*frame)
+
+    def _accept(self) -> None:
+        try:
+            sock, _ = self._listener.accept()
+        except BlockingIOError:
+            return
+
+        if len(self._subscribers) >= self.max_subscribers:
+            sock.close()
+            return
+
+        sock.setblocking(False)
+        self._subscribers[sock] = subscriber = _Subscriber(sock=sock)
+        self._selector.register(sock, selectors.EVENT_READ, data=subscriber)
+
+        if self._keyframe is not None:
+            self._send(subscriber, self._keyframe_message)
+            subscriber.needs_keyframe = False
+
+    def _drain_wake(self) -> None:
+        try:
+            while self._wake_reader.recv(4096):
+                pass
+        except BlockingIOError:
+            pass
+
+    def _receive(self, sock: Any) -> bool:
+        # Spectators do not send anything, so this only detects disconnection
+        try:
+            return bool(sock.recv(4096))
+        except BlockingIOError:
+            return True
+        except OSError:
+            return False
+
+    def _disconnect(self, sock: Any) -> None:
+        if self._subscribers.pop(sock, None) is None:
+            return
+
+        self._selector.unregister(sock)
+        sock.close()
+
+    def _broadcast(self, frame: np.ndarray, dtype: np.dtype) -> None:
+        cells = _tiles_to_cells(frame.view(dtype))
+        number = self.frames_encoded
+        self.frames_encoded += 1
+
+        message = self._encode(cells=cells, number=number)
+        is_keyframe = message is self._keyframe_message
+
+        for subscriber in list(self._subscribers.values()):
+            if subscriber.pending_size + len(message) > self.max_buffer_size:
+                self.resyncs += 1
+                subscriber.drop_pending()
+                subscriber.needs_keyframe = True
+
+            if subscriber.needs_keyframe and not is_keyframe:
+                self._send(subscriber, self._keyframe_message)
+
+            subscriber.needs_keyframe = False
+            self._send(subscriber, message)
+
+    def _encode(self, cells: np.ndarray, number: int) -> bytes:
+        keyframe = self._keyframe
+
+        if (
+            keyframe is None
+            or keyframe.shape != cells.shape
+            or self._since_keyframe >= self.keyframe_interval
+        ):
+            return self._new_keyframe(cells=cells, number=number)
+
+        message = encode_delta(
+            cells=cells, keyframe=keyframe, number=number, level=self.compression_level
+        )
+
+        # A delta that is as large as a keyframe is better sent as one, since
+        # later deltas are likely to be smaller against it
+        if len(message) >= len(self._keyframe_message):
+            return self._new_keyframe(cells=cells, number=number)
+
+        self._since_keyframe += 1
+        return message
+
+    def _new_keyframe(self, cells: np.ndarray, number: int) -> bytes:
+        self._keyframe = cells
+        self._keyframe_message = encode_keyframe(
+            cells=cells, number=number, level=self.compression_level
+        )
+        self._since_keyframe = 0
+
+        return self._keyframe_message
+
+    def _send(self, subscriber: _Subscriber, message: bytes) -> None:
+        if subscriber.sock not in self._subscribers:
+            return
+
+        subscriber.enqueue(message)
+        self._flush(subscriber)
+
+    def _flush(self, subscriber: _Subscriber) -> None:
+        try:
+            self.bytes_sent += subscriber.flush()
+        except OSError:
+            self._disconnect(subscriber.sock)
+            return
+
+        events = selectors.EVENT_READ
+
+        if subscriber.pending:
+            events |= selectors.EVENT_WRITE
+
+        self._selector.modify(subscriber.sock, events, data=subscriber)
+
+
+def _tiles_to_cells(tiles: np.ndarray) -> np.ndarray:
+    cells = np.empty(tiles.shape, dtype=CELL_DTYPE)
+    cells["ch"] = tiles["ch"]
+    cells["fg"] = tiles["fg"][..., :3]
+    cells["bg"] = tiles["bg"][..., :3]
+
+    return cells
+
+
+def _as_void(cells: np.ndarray) -> np.ndarray:
+    return cells.view(f"V{cells.dtype.itemsize}")
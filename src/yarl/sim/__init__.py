@@ -0,0 +1,7 @@
+"""Package for running games without a window, for example to test or benchmark the game."""
+
+
+from .policies import PlayerPolicy, bot_policy, wait_policy
+from .replay import Replay
+from .runner import RESULT_DTYPE, play_game, run_batch, save_csv
+from .simulation import Simulation
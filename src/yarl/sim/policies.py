@@ -0,0 +1,114 @@
+"""This module defines policies that can be used to control the player in simulations.
+
+A policy is a callable that receives the engine and returns the action the player
+should take in the next turn, or `None` to do nothing.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Callable
+
+from yarl.actions import (
+    BumpAction,
+    ConsumeItemAction,
+    PickupAction,
+    TakeStairsAction,
+    WaitAction,
+)
+from yarl.components.consumables import HealingPotion
+
+if TYPE_CHECKING:
+    from yarl.actions import Action
+    from yarl.engine import Engine
+
+
+PlayerPolicy = Callable[["Engine"], "Action | None"]
+"""Callable that receives the engine and returns the action the player should take
+in the next turn, or `None` to do nothing."""
+
+
+def wait_policy(engine: Engine) -> Action:
+    """Policy which makes the player wait every turn.
+
+    Args:
+        engine: Engine representing the current game.
+
+    Returns:
+        Action to wait.
+    """
+    return WaitAction(engine=engine, entity=engine.player)
+
+
+def bot_policy(engine: Engine) -> Action:
+    """Policy which plays the game like a simple-minded player.
+
+    In order of priority, the player:
+
+    - Attacks the weakest adjacent enemy.
+    - Drinks a healing potion when below half of its maximum HP.
+    - Picks up the items it is standing on, if there is space in the inventory.
+    - Descends the stairs it is standing on.
+    - Walks towards the closest visible enemy or, if there is none, the stairs.
+
+    The bot knows where the stairs are without exploring the floor.
+
+    Args:
+        engine: Engine representing the current game.
+
+    Returns:
+        Action the player should take.
+    """
+    player, game_map = engine.player, engine.game_map
+    x, y = player.x, player.y
+
+    # Entities are stored in a set, so they are sorted to break ties reproducibly
+    enemies = sorted(
+        (
+            entity
+            for entity in game_map.active_entities
+            if entity is not player and game_map.visible[entity.x, entity.y]
+        ),
+        key=lambda entity: (entity.y, entity.x),
+    )
+
+    adjacent = [
+        entity for entity in enemies if max(abs(entity.x - x), abs(entity.y - y)) <= 1
+    ]
+
+    if adjacent:
+        target = min(adjacent, key=lambda entity: entity.fighter.hp)
+        dx, dy = target.x - x, target.y - y
+        return BumpAction(engine=engine, entity=player, dx=dx, dy=dy)
+
+    fighter, inventory = player.fighter, player.inventory
+
+    if inventory is not None and fighter.hp < fighter.max_hp // 2:
+        for item in inventory.items:
+            if isinstance(item.consumable, HealingPotion):
+                return ConsumeItemAction(engine=engine, entity=player, item=item)
+
+    items = game_map.get_items(x=x, y=y)
+
+    if items and inventory is not None and len(inventory.items) < inventory.capacity:
+        return PickupAction(
+            engine=engine,
+            entity=player,
+            items=sorted(items, key=lambda item: item.name),
+        )
+
+    if (x, y) == game_map.stairs_location:
+        return TakeStairsAction(engine=engine, entity=player)
+
+    goal = game_map.stairs_location
+
+    if enemies:
+        closest = min(enemies, key=lambda entity: player.distance(entity.x, entity.y))
+        goal = closest.x, closest.y
+
+    path = game_map.pathfinding.get_path(start=(x, y), goal=goal)
+
+    if not path:
+        return WaitAction(engine=engine, entity=player)
+
+    dest_x, dest_y = path[0]
+    return BumpAction(engine=engine, entity=player, dx=dest_x - x, dy=dest_y - y)
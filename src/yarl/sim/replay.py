@@ -0,0 +1,119 @@
+"""This module defines the class that is used to replay a recorded game without a window.
+
+Examples:
+
+    Replaying a game and keeping the characters on screen every 100 turns:
+
+    ```pycon
+    >>> import tcod
+    >>> from yarl.sim import Replay
+    >>> replay = Replay(path="game.rec")
+    >>> console = tcod.Console(width=100, height=50, order="F")
+    >>> frames = []
+    >>> def sample_frame(engine):
+    ...     console.clear()
+    ...     engine.render(console=console)
+    ...     frames.append(console.ch.copy())
+    >>> replay.run(frame_interval=100, on_frame=sample_frame)
+    ```
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Callable
+
+from yarl.game import Game
+from yarl.recording import ActionLog, RecordType, decode_action
+
+if TYPE_CHECKING:
+    from yarl.engine import Engine
+
+
+class Replay:
+    """Class to re-execute a game recorded by [`ActionRecorder`][yarl.recording.ActionRecorder]
+    as fast as possible.
+
+    The game is rebuilt from the parameters and seed in the log, and each record is
+    applied in order: player actions through
+    [`Engine.handle_player_action()`][yarl.engine.Engine.handle_player_action] and
+    enemy turns through [`Engine.handle_enemy_turns()`][yarl.engine.Engine.handle_enemy_turns].
+    Nothing is rendered and nothing waits for time to pass, unless frames are
+    sampled with `run()`.
+
+    Since the `random` module is reseeded, a replay must not run concurrently with
+    anything else in the same process that relies on it.
+
+    Attributes:
+        log (ActionLog): Log being replayed.
+
+        game (Game): Game rebuilt from the log.
+
+        engine (Engine): Engine representing the replayed game.
+
+        records (int): Number of records replayed so far.
+
+        turns (int): Number of enemy turns replayed so far.
+    """
+
+    def __init__(self, path: str) -> None:
+        """Create a replay.
+
+        Args:
+            path: Path of the log to replay.
+        """
+        self.log = ActionLog(path=path)
+        self.game = Game.fromdict(params=self.log.params)
+        self.engine = self.game.get_engine(seed=self.log.seed)
+        self.records = 0
+        self.turns = 0
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__name__}(path={self.log.path!r}, records={self.records})"
+        )
+
+    def __str__(self) -> str:
+        return self.__repr__()
+
+    def run(
+        self,
+        frame_interval: int | None = None,
+        on_frame: Callable[[Engine], None] | None = None,
+    ) -> int:
+        """Method to replay the whole log.
+
+        Args:
+            frame_interval: Number of enemy turns between sampled frames. If set to
+                `None`, no frames are sampled. Defaults to `None`.
+
+            on_frame: Callable that receives the engine at each sampled frame, for
+                example to render it. The final state is always sampled when set.
+
+        Returns:
+            Number of records replayed.
+        """
+        engine = self.engine
+        interval = frame_interval if on_frame is not None else None
+
+        for record_type, payload in self.log.records():
+            self.records += 1
+
+            if record_type is not RecordType.ENEMY_TURN:
+                action = decode_action(
+                    engine=engine, record_type=record_type, payload=payload
+                )
+                engine.handle_player_action(action=action)
+                continue
+
+            engine.handle_enemy_turns()
+            engine.update_fov()
+            self.turns += 1
+
+            if interval is not None and self.turns % interval == 0:
+                assert on_frame is not None
+                on_frame(engine)
+
+        if on_frame is not None:
+            on_frame(engine)
+
+        return self.records
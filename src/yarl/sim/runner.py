@@ -0,0 +1,194 @@
+"""This module defines functions that are used to play many games in parallel
+and collect statistics about them, for example to balance the game.
+
+Examples:
+
+    Playing 100 games with the bot on all cores and saving the results:
+
+    ```pycon
+    >>> from yarl.sim import run_batch, save_csv
+    >>> results = run_batch(games=100, seed=0)
+    >>> results["floors"].mean()
+    >>> save_csv(results, "results.csv")
+    ```
+"""
+
+from __future__ import annotations
+
+import csv
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+from yarl.events import DamageEvent, DeathEvent
+from yarl.factories import ENEMIES
+from yarl.game import Game
+
+from .policies import PlayerPolicy, bot_policy
+from .simulation import Simulation
+
+if TYPE_CHECKING:
+    from yarl.entity import ActiveEntity
+    from yarl.events import EventBus
+
+ENEMY_TYPES: dict[str, str] = {enemy.name: key for key, enemy in ENEMIES.items()}
+"""Enemy types by name of the enemy, using the keys of
+[`ENEMIES`][yarl.factories.ENEMIES] as types."""
+
+RESULT_DTYPE = np.dtype(
+    [
+        ("seed", np.int64),
+        ("floors", np.int32),
+        ("turns", np.int32),
+        ("level", np.int32),
+        ("damage_taken", np.int32),
+        *((f"kills_{enemy_type}", np.int32) for enemy_type in ENEMY_TYPES.values()),
+        ("death_cause", "U32"),
+    ]
+)
+"""Columns of the results of [`run_batch()`][yarl.sim.runner.run_batch]."""
+
+DEFAULT_GAME_PARAMS: dict[str, Any] = {"map_width": 80, "map_height": 43}
+"""Parameters of the games played by default."""
+
+
+def play_game(
+    seed: int,
+    game_params: dict[str, Any] | None = None,
+    policy: PlayerPolicy = bot_policy,
+    max_turns: int = 5000,
+) -> tuple:
+    """Function to play a single game headlessly and collect statistics about it.
+
+    The game ends when the player dies or after `max_turns` turns.
+
+    Args:
+        seed: Seed for the game.
+
+        game_params: Parameters for [`Game.fromdict()`][yarl.game.Game.fromdict].
+            If set to `None`, it falls back to using `DEFAULT_GAME_PARAMS`.
+
+        policy: Policy that controls the player. Defaults to
+            [`bot_policy()`][yarl.sim.policies.bot_policy].
+
+        max_turns: Maximum number of turns to play. Defaults to 5000.
+
+    Returns:
+        Statistics of the game, in the order of the columns of `RESULT_DTYPE`.
+    """
+    game = Game.fromdict(params=game_params or DEFAULT_GAME_PARAMS)
+    simulation = Simulation(game=game, policy=policy, seed=seed)
+
+    engine, player = simulation.engine, simulation.engine.player
+
+    stats = _GameStats(player=player)
+    stats.subscribe(event_bus=engine.event_bus)
+
+    simulation.run(max_turns=max_turns)
+
+    return (
+        seed,
+        engine.game_world.current_floor,
+        simulation.turns,
+        player.level.current_level,
+        stats.damage_taken,
+        *stats.kills.values(),
+        stats.death_cause,
+    )
+
+
+class _GameStats:
+    """Class to collect the statistics of a game from its events."""
+
+    def __init__(self, player: ActiveEntity) -> None:
+        self.player = player
+        self.damage_taken = 0
+        self.kills = dict.fromkeys(ENEMY_TYPES.values(), 0)
+        self.death_cause = ""
+
+    def subscribe(self, event_bus: EventBus) -> None:
+        event_bus.subscribe(DamageEvent, self.on_damage)
+        event_bus.subscribe(DeathEvent, self.on_death)
+
+    def on_damage(self, event: DamageEvent) -> None:
+        if event.target is self.player:
+            self.damage_taken += max(0, event.damage)
+
+    def on_death(self, event: DeathEvent) -> None:
+        if event.entity is self.player:
+            self.death_cause = event.killer_name
+        elif event.killer is self.player and event.name in ENEMY_TYPES:
+            self.kills[ENEMY_TYPES[event.name]] += 1
+
+
+def run_batch(
+    games: int,
+    seed: int = 0,
+    game_params: dict[str, Any] | None = None,
+    policy: PlayerPolicy = bot_policy,
+    max_turns: int = 5000,
+    processes: int | None = None,
+) -> np.ndarray:
+    """Function to play several games in parallel and collect statistics about them.
+
+    Game `i` is played with seed `seed + i`, so a batch can be reproduced
+    and extended. Games are independent, so throughput scales with the
+    number of processes.
+
+    Args:
+        games: Number of games to play.
+
+        seed: Seed of the first game. Defaults to 0.
+
+        game_params: Parameters for [`Game.fromdict()`][yarl.game.Game.fromdict].
+            If set to `None`, it falls back to using `DEFAULT_GAME_PARAMS`.
+
+        policy: Policy that controls the player. It must be picklable, e.g. a
+            module-level function. Defaults to
+            [`bot_policy()`][yarl.sim.policies.bot_policy].
+
+        max_turns: Maximum number of turns to play per game. Defaults to 5000.
+
+        processes: Number of worker processes. If set to `None`, one is used per
+            core. If set to 1, the games are played in the current process.
+
+    Returns:
+        Structured array with one row per game and the columns of `RESULT_DTYPE`.
+    """
+    seeds = range(seed, seed + games)
+    args = (
+        seeds,
+        [game_params] * games,
+        [policy] * games,
+        [max_turns] * games,
+    )
+
+    if processes == 1:
+        rows = list(map(play_game, *args))
+    else:
+        workers = processes or os.cpu_count() or 1
+        # A few chunks per worker keeps the workers busy without much overhead
+        chunksize = max(1, games // (4 * workers))
+
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            rows = list(executor.map(play_game, *args, chunksize=chunksize))
+
+    return np.array(rows, dtype=RESULT_DTYPE)
+
+
+def save_csv(results: np.ndarray, path: str) -> None:
+    """Function to save the results of [`run_batch()`][yarl.sim.runner.run_batch]
+    as a CSV file.
+
+    Args:
+        results: Results to save.
+
+        path: Path of the CSV file.
+    """
+    names = results.dtype.names or ()
+
+    with open(path, "w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(names)
+        writer.writerows(results.tolist())
@@ -0,0 +1,121 @@
+"""This module defines the class that is used to run a game without a window.
+
+The game is advanced via [`Engine.step()`][yarl.engine.Engine.step], so no
+context, console, event handler or clock is involved.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from yarl.actions import LevelUpAction
+
+from .policies import PlayerPolicy, wait_policy
+
+if TYPE_CHECKING:
+    from yarl.game import Game
+
+
+class Simulation:
+    """Class to run a game without a window, one turn at a time.
+
+    The player is controlled by a policy. Since there is no level up menu,
+    level ups are applied automatically with a fixed boost.
+
+    Attributes:
+        game (Game): Game being simulated.
+
+        engine (Engine): Engine representing the simulated game.
+
+        policy (PlayerPolicy): Policy that controls the player.
+
+        seed (int | None): Seed used for the `random` module.
+
+        level_up_boost (tuple[str, int]): Stat and amount to boost on level up.
+            See [`Level.level_up_with_boost()`][yarl.components.level.Level.level_up_with_boost].
+
+        turns (int): Number of turns simulated so far.
+    """
+
+    def __init__(
+        self,
+        game: Game,
+        policy: PlayerPolicy | None = None,
+        seed: int | None = None,
+        level_up_boost: tuple[str, int] = ("max_hp", 20),
+    ) -> None:
+        """Create a simulation.
+
+        Args:
+            game: Game to simulate.
+
+            policy: Policy that controls the player. If set to `None`, it falls back
+                to using [`wait_policy()`][yarl.sim.policies.wait_policy].
+
+            seed: Seed for the `random` module, which drives map generation and the
+                enemies. When set, two simulations with the same game parameters, seed
+                and a deterministic policy play out identically. Note that the
+                module-level generator is shared by everything in the process.
+
+            level_up_boost: Stat and amount to boost on level up. Defaults to
+                `("max_hp", 20)`.
+        """
+        self.game = game
+        self.policy = policy or wait_policy
+        self.seed = seed
+        self.level_up_boost = level_up_boost
+        self.turns = 0
+
+        self.engine = game.get_engine(seed=seed)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(seed={self.seed}, turns={self.turns})"
+
+    def __str__(self) -> str:
+        return self.__repr__()
+
+    @property
+    def is_over(self) -> bool:
+        """Indicates whether the game is over, i.e. the player is dead."""
+        return not self.engine.player.is_alive
+
+    def step(self) -> bool:
+        """Method to simulate a single turn.
+
+        Returns:
+            `True` if the game can continue, `False` if it is over.
+        """
+        if self.is_over:
+            return False
+
+        engine = self.engine
+
+        engine.step(action=self.policy(engine))
+        self.turns += 1
+
+        player = engine.player
+        boost, amount = self.level_up_boost
+
+        while player.is_alive and player.level.can_level_up:
+            action = LevelUpAction(
+                engine=engine, entity=player, boost=boost, amount=amount
+            )
+            engine.handle_player_action(action=action)
+
+        return not self.is_over
+
+    def run(self, max_turns: int) -> int:
+        """Method to simulate turns until the game is over or a number of turns have been simulated.
+
+        Args:
+            max_turns: Maximum number of turns to simulate.
+
+        Returns:
+            Number of turns simulated in this call.
+        """
+        start = self.turns
+
+        while self.turns - start < max_turns and self.step():
+            pass
+
+        return self.turns - start
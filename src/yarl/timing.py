@@ -0,0 +1,341 @@
+"""This module defines classes that are used to pace things in real time."""
+
+from __future__ import annotations
+
+import time
+from collections import deque
+from typing import Callable
+
+import numpy as np
+
+
+class FixedTimestep:
+    """Class to schedule ticks at a fixed rate, independently of the frame rate.
+
+    The time elapsed between calls to `update()` is accumulated and each full
+    `interval` in the accumulator is a tick that is due. Ticks are never lost
+    when a frame takes longer than `interval`: several ticks become due at
+    once instead. To keep the game from spiralling after a long stall, at most
+    `max_catch_up_ticks` ticks are returned by a single call to `update()` and
+    the rest are dropped and counted in `dropped_ticks`.
+
+    Attributes:
+        interval (float): Time (in seconds) between ticks.
+
+        max_catch_up_ticks (int): Maximum number of ticks returned by a single update.
+
+        clock (Callable[[], float]): Clock used to measure time.
+
+        ticks (int): Total number of ticks that have been returned.
+
+        dropped_ticks (int): Total number of ticks that have been dropped because
+            they exceeded `max_catch_up_ticks`.
+
+        lag (float): Time (in seconds) by which the earliest tick returned by the last
+            update was late. It is 0 if no tick was due.
+
+        max_lag (float): Largest `lag` seen so far.
+    """
+
+    def __init__(
+        self,
+        interval: float,
+        max_catch_up_ticks: int = 4,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Create a fixed timestep.
+
+        Args:
+            interval: Time (in seconds) between ticks.
+
+            max_catch_up_ticks: Maximum number of ticks returned by a single update.
+                Defaults to 4.
+
+            clock: Clock used to measure time. Defaults to `time.monotonic`.
+
+        Raises:
+            ValueError: If `interval` is not positive or `max_catch_up_ticks` is less than 1.
+        """
+        if interval <= 0:
+            raise ValueError(f"The interval must be positive, got {interval}.")
+
+        if max_catch_up_ticks < 1:
+            raise ValueError(
+                f"At least one tick must be allowed per update, got {max_catch_up_ticks}."
+            )
+
+        self.interval = interval
+        self.max_catch_up_ticks = max_catch_up_ticks
+        self.clock = clock
+
+        self.ticks = 0
+        self.dropped_ticks = 0
+        self.lag = 0.0
+        self.max_lag = 0.0
+
+        self._accumulator = 0.0
+        self._last_time = clock()
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(interval={self.interval}, max_catch_up_ticks={self.max_catch_up_ticks})"
+
+    def __str__(self) -> str:
+        return self.__repr__()
+
+    def reset(self) -> None:
+        """Method to restart the schedule from now, discarding any accumulated time."""
+        self._accumulator = 0.0
+        self._last_time = self.clock()
+
+    def update(self) -> int:
+        """Method to accumulate the time elapsed since the last update and consume the due ticks.
+
+        Returns:
+            Number of ticks that are due, at most `max_catch_up_ticks`.
+        """
+        now = self.clock()
+        self._accumulator += now - self._last_time
+        self._last_time = now
+
+        due = int(self._accumulator // self.interval)
+
+        if due == 0:
+            self.lag = 0.0
+            return 0
+
+        self.lag = self._accumulator - self.interval
+        self.max_lag = max(self.max_lag, self.lag)
+
+        self._accumulator -= due * self.interval
+
+        ticks = min(due, self.max_catch_up_ticks)
+
+        self.ticks += ticks
+        self.dropped_ticks += due - ticks
+
+        return ticks
+
+    def time_until_next_tick(self) -> float:
+        """Method to obtain the time (in seconds) until the next tick is due.
+
+        Returns:
+            Time until the next tick, or 0 if a tick is already due.
+        """
+        elapsed = self._accumulator + self.clock() - self._last_time
+        return max(0.0, self.interval - elapsed)
+
+
+class FrameStats:
+    """Class to measure the rate and duration of the frames of the game loop.
+
+    A frame is one iteration of the loop, whether or not anything was rendered in
+    it, so the frame rate is not only measured over the frames that were rendered.
+
+    Attributes:
+        frames (int): Number of frames recorded.
+
+        rendered (int): Number of frames in which something was rendered.
+
+        frame_times (deque[float]): Times (in seconds) between the ends of the most
+            recent frames and the frames before them.
+
+        render_times (deque[float]): Times (in seconds) taken to render and present
+            the most recent frames that were rendered.
+    """
+
+    def __init__(self, max_samples: int = 1000) -> None:
+        """Create empty frame stats.
+
+        Args:
+            max_samples: Number of recent frames to keep the times of, for the
+                frame rate and percentiles. Defaults to 1000.
+        """
+        self.frames = 0
+        self.rendered = 0
+        self.frame_times: deque[float] = deque(maxlen=max_samples)
+        self.render_times: deque[float] = deque(maxlen=max_samples)
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__name__}(frames={self.frames}, rendered={self.rendered})"
+        )
+
+    def __str__(self) -> str:
+        return self.__repr__()
+
+    @property
+    def fps(self) -> float:
+        """Average number of frames per second over the most recent frames."""
+        total = sum(self.frame_times)
+        return len(self.frame_times) / total if total > 0 else 0.0
+
+    def add(self, frame_time: float | None, render_time: float | None = None) -> None:
+        """Method to record a frame.
+
+        Args:
+            frame_time: Time (in seconds) since the end of the previous frame, or
+                `None` if it is the first frame.
+
+            render_time: Time (in seconds) taken to render and present the frame, or
+                `None` if nothing was rendered. Defaults to None.
+        """
+        self.frames += 1
+
+        if render_time is not None:
+            self.rendered += 1
+            self.render_times.append(render_time)
+
+        if frame_time is not None:
+            self.frame_times.append(frame_time)
+
+    def todict(self) -> dict[str, float | int]:
+        """Method to summarize the stats, with times in milliseconds.
+
+        Returns:
+            Number of frames, number of frames rendered, frame rate, and median,
+                95th and 99th percentiles of the frame times and render times.
+        """
+        stats: dict[str, float | int] = {
+            "frames": self.frames,
+            "rendered": self.rendered,
+            "fps": self.fps,
+        }
+
+        for name, samples in (
+            ("frame", self.frame_times),
+            ("render", self.render_times),
+        ):
+            if samples:
+                p50, p95, p99 = np.percentile(samples, [50, 95, 99]) * 1000
+                stats[f"{name}_p50_ms"] = float(p50)
+                stats[f"{name}_p95_ms"] = float(p95)
+                stats[f"{name}_p99_ms"] = float(p99)
+
+        return stats
+
+    def summary(self) -> str:
+        """Method to obtain a short description of the stats, to show on screen.
+
+        Returns:
+            Frame rate and 99th percentiles of the frame and render times.
+        """
+        stats = self.todict()
+
+        if "frame_p99_ms" not in stats:
+            return f"{stats['fps']:.1f} FPS"
+
+        return (
+            f"{stats['fps']:.1f} FPS, frame p99 {stats['frame_p99_ms']:.1f} ms, "
+            f"render p99 {stats['render_p99_ms']:.1f} ms"
+        )
+
+
+class FramePacer:
+    """Class to cap the rate at which frames are rendered.
+
+    Frames are scheduled `1 / max_fps` seconds apart. The game loop asks how long
+    it must wait before the next frame with `time_until_next_frame()` and sleeps
+    while waiting for events in the meantime, so input and the simulation are
+    still handled as they come while rendering is capped. If a frame starts late,
+    the schedule catches up by at most one frame instead of bursting.
+
+    The cap can be changed at any time, including while the game is running.
+
+    The game loop also calls `end_iteration()` once per iteration, so the frames
+    are measured whether or not they were rendered.
+
+    Attributes:
+        clock (Callable[[], float]): Clock used to measure time.
+
+        stats (FrameStats): Measurements of the frames of the game loop.
+    """
+
+    def __init__(
+        self,
+        max_fps: float | None = 60,
+        clock: Callable[[], float] = time.perf_counter,
+        stats: FrameStats | None = None,
+    ) -> None:
+        """Create a frame pacer.
+
+        Args:
+            max_fps: Maximum number of frames per second. If set to `None`, the
+                frame rate is not capped. Defaults to 60.
+
+            clock: Clock used to measure time. Defaults to `time.perf_counter`.
+
+            stats: Stats the frames should be recorded in. If set to `None`, new
+                stats are created.
+
+        Raises:
+            ValueError: If `max_fps` is not positive.
+        """
+        self.clock = clock
+        self.stats = stats or FrameStats()
+        self.max_fps = max_fps
+
+        self._next_frame = 0.0
+        self._frame_start: float | None = None
+        self._render_time: float | None = None
+        self._last_iteration_end: float | None = None
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(max_fps={self.max_fps})"
+
+    def __str__(self) -> str:
+        return self.__repr__()
+
+    @property
+    def max_fps(self) -> float | None:
+        """Maximum number of frames per second, or `None` if it is not capped."""
+        return self._max_fps
+
+    @max_fps.setter
+    def max_fps(self, value: float | None) -> None:
+        if value is not None and value <= 0:
+            raise ValueError(f"The frame rate cap must be positive, got {value}.")
+
+        self._max_fps = value
+
+    def time_until_next_frame(self) -> float:
+        """Method to obtain the time (in seconds) until the next frame can be rendered.
+
+        Returns:
+            Time until the next frame, or 0 if it can be rendered now.
+        """
+        if self._max_fps is None:
+            return 0.0
+
+        return max(0.0, self._next_frame - self.clock())
+
+    def begin_frame(self) -> None:
+        """Method to mark the start of a frame, before it is rendered."""
+        now = self.clock()
+
+        if self._max_fps is not None:
+            interval = 1 / self._max_fps
+            self._next_frame = max(self._next_frame, now - interval) + interval
+
+        self._frame_start = now
+
+    def end_frame(self) -> None:
+        """Method to mark the end of a frame, once it has been presented."""
+        if self._frame_start is None:
+            return
+
+        start, self._frame_start = self._frame_start, None
+        self._render_time = self.clock() - start
+
+    def end_iteration(self) -> None:
+        """Method to mark the end of an iteration of the game loop and record it
+        as a frame, whether or not it was rendered."""
+        now = self.clock()
+
+        frame_time = None
+
+        if self._last_iteration_end is not None:
+            frame_time = now - self._last_iteration_end
+
+        self.stats.add(frame_time=frame_time, render_time=self._render_time)
+        self._render_time = None
+        self._last_iteration_end = now
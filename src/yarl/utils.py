@@ -5,15 +5,27 @@ from __future__ import annotations
 import lzma
 import os
 import pickle
+import stat
+import struct
 from enum import Enum, auto
 from typing import TYPE_CHECKING
 
+from yarl.exceptions import IncompatibleSaveException
+
 if TYPE_CHECKING:
     from yarl.engine import Engine
 
 
 GAME_SAVE_FILENAME = "save.sav"
 
+MESSAGE_ARCHIVE_FILENAME = "messages.log"
+
+SAVE_FORMAT_VERSION = 2
+"""Version of the format games are saved in. Saves in other versions cannot be loaded."""
+
+_SAVE_HEADER = struct.Struct("<4sH")
+_SAVE_MAGIC = b"YARL"
+
 
 class RenderOrder(Enum):
     """Priorities for rendering entities.
@@ -56,6 +68,17 @@ def get_game_save_path() -> str:
     return os.path.join(parent, "saved_games")
 
 
+def get_cache_path() -> str:
+    """Function to get the absolute path of the directory where data that can be
+    recomputed (like pre-rendered images) should be cached.
+
+    Returns:
+        Absolute path to the cache directory.
+    """
+    parent = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
+    return os.path.join(parent, "cache")
+
+
 def save_game(engine: Engine) -> None:
     """Function to save the game.
 
@@ -67,35 +90,80 @@ def save_game(engine: Engine) -> None:
     if not os.path.isdir(parent):
         os.makedirs(parent)
 
+    # Archived messages are kept in their own file instead of the save. Its path is
+    # relative to the save directory, so that the directory can be moved
+    engine.message_log.archive.save(path=MESSAGE_ARCHIVE_FILENAME, directory=parent)
+
     data = lzma.compress(pickle.dumps(engine))
 
     path = os.path.join(parent, GAME_SAVE_FILENAME)
 
     with open(path, "wb") as f:
+        f.write(_SAVE_HEADER.pack(_SAVE_MAGIC, SAVE_FORMAT_VERSION))
         f.write(data)
 
 
 def load_game() -> Engine:
     """Function to load a saved game.
 
+    Games saved in a different format (see `SAVE_FORMAT_VERSION`) are not loaded,
+    since the state of the game has changed in ways that cannot be filled in.
+    This includes games saved before the format was versioned.
+
     Returns:
         Engine that represents the loaded game.
+
+    Raises:
+        IncompatibleSaveException: If the game was saved in a different format.
     """
     parent = get_game_save_path()
     path = os.path.join(parent, GAME_SAVE_FILENAME)
 
     with open(path, "rb") as f:
+        header = f.read(_SAVE_HEADER.size)
+
+        if len(header) < _SAVE_HEADER.size or _SAVE_HEADER.unpack(header) != (
+            _SAVE_MAGIC,
+            SAVE_FORMAT_VERSION,
+        ):
+            raise IncompatibleSaveException(
+                "The saved game was saved by another version of the game."
+            )
+
         data = lzma.decompress(f.read())
         engine: Engine = pickle.loads(data)
 
+    engine.message_log.archive.directory = parent
     return engine
 
 
 def clear_game() -> None:
     """Function to remove a saved game."""
-    path = os.path.join(get_game_save_path(), GAME_SAVE_FILENAME)
+    parent = get_game_save_path()
+    filenames = (
+        GAME_SAVE_FILENAME,
+        MESSAGE_ARCHIVE_FILENAME,
+        f"{MESSAGE_ARCHIVE_FILENAME}.idx",
+    )
+
+    for filename in filenames:
+        path = os.path.join(parent, filename)
 
-    if not os.path.exists(path):
-        return
+        if os.path.exists(path):
+            os.remove(path)
 
-    os.remove(path)
+
+def remove_socket_file(path: str) -> None:
+    """Function to remove the file of a Unix socket, if there is one.
+
+    A listener does not remove its file when it is closed, and binding to
+    a path that exists fails. Files that are not sockets are left alone.
+
+    Args:
+        path: Path of the socket.
+    """
+    try:
+        if stat.S_ISSOCK(os.stat(path).st_mode):
+            os.remove(path)
+    except FileNotFoundError:
+        pass
@@ -0,0 +1,120 @@
+import pytest
+import yarl.tile_types as tiles
+from yarl.actions import (
+    ActionStatus,
+    BumpAction,
+    MeleeAction,
+    MovementAction,
+    TakeStairsAction,
+)
+from yarl.engine import Engine
+from yarl.entity import ActiveEntity
+from yarl.exceptions import ImpossibleActionException
+from yarl.factories import ENEMIES
+from yarl.game import Game
+from yarl.map import GameMap
+
+
+@pytest.fixture
+def engine() -> Engine:
+    engine = Game(map_width=80, map_height=43).get_engine(seed=1)
+
+    # The player is at the left edge of a small room, with an orc and a wall nearby
+    game_map = GameMap(width=10, height=10)
+    game_map.tiles[:, :] = tiles.floor
+    game_map.tiles[0, 6] = tiles.wall
+    game_map.stairs_location = (9, 9)
+    game_map.add_entity(engine.player, x=0, y=5)
+    game_map.add_entity(ActiveEntity.fromentity(other=ENEMIES["orc"]), x=1, y=4)
+
+    engine.game_map = game_map
+    return engine
+
+
+@pytest.fixture
+def orc(engine: Engine) -> ActiveEntity:
+    orc = engine.game_map.get_active_entity(x=1, y=4)
+    assert orc is not None
+    return orc
+
+
+@pytest.mark.parametrize(
+    ["deviation", "expected"],
+    [
+        [(1, 0), ActionStatus.PERFORMED],
+        [(-1, 0), ActionStatus.BLOCKED],
+        [(0, 1), ActionStatus.BLOCKED],
+        [(1, -1), ActionStatus.BLOCKED],
+    ],
+    ids=["floor", "out_of_bounds", "wall", "blocking_entity"],
+)
+def test_movement_try_perform(
+    engine: Engine, deviation: tuple[int, int], expected: ActionStatus
+) -> None:
+    player = engine.player
+    dx, dy = deviation
+
+    action = MovementAction(engine=engine, entity=player, dx=dx, dy=dy)
+
+    assert action.try_perform() is expected
+    assert (player.x, player.y) == (
+        (dx, 5 + dy) if expected is ActionStatus.PERFORMED else (0, 5)
+    )
+
+
+def test_movement_try_perform_waiting(engine: Engine) -> None:
+    player = engine.player
+    player.movement_wait = 2
+
+    action = MovementAction(engine=engine, entity=player, dx=1, dy=0)
+
+    assert action.try_perform() is ActionStatus.WAITING
+    assert (player.x, player.y) == (0, 5)
+
+
+def test_movement_perform_raises_when_blocked(engine: Engine) -> None:
+    action = MovementAction(engine=engine, entity=engine.player, dx=-1, dy=0)
+
+    with pytest.raises(ImpossibleActionException):
+        action.perform()
+
+
+def test_melee_try_perform(engine: Engine, orc: ActiveEntity) -> None:
+    player = engine.player
+
+    missed = MeleeAction(engine=engine, entity=player, dx=1, dy=0)
+    assert missed.try_perform() is ActionStatus.NO_TARGET
+
+    hp = orc.fighter.hp
+
+    hit = MeleeAction(engine=engine, entity=player, dx=1, dy=-1)
+    assert hit.try_perform() is ActionStatus.PERFORMED
+    assert orc.fighter.hp < hp
+
+
+@pytest.mark.parametrize(
+    ["deviation", "expected"],
+    [
+        [(1, -1), ActionStatus.PERFORMED],
+        [(1, 0), ActionStatus.PERFORMED],
+        [(-1, 0), ActionStatus.BLOCKED],
+    ],
+    ids=["attack", "move", "out_of_bounds"],
+)
+def test_bump_try_perform(
+    engine: Engine,
+    orc: ActiveEntity,
+    deviation: tuple[int, int],
+    expected: ActionStatus,
+) -> None:
+    dx, dy = deviation
+    action = BumpAction(engine=engine, entity=engine.player, dx=dx, dy=dy)
+
+    assert action.try_perform() is expected
+    assert (orc.fighter.hp < orc.fighter.max_hp) is (deviation == (1, -1))
+
+
+def test_try_perform_reports_impossible_actions(engine: Engine) -> None:
+    action = TakeStairsAction(engine=engine, entity=engine.player)
+
+    assert action.try_perform() is ActionStatus.IMPOSSIBLE
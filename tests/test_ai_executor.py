@@ -0,0 +1,81 @@
+import pytest
+from yarl.ai_executor import AIExecutor
+from yarl.engine import Engine
+from yarl.entity import ActiveEntity
+from yarl.game import Game
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def engine() -> Engine:
+    return Game(map_width=80, map_height=43).get_engine(seed=1)
+
+
+@pytest.fixture
+def performed(monkeypatch: pytest.MonkeyPatch) -> list[ActiveEntity]:
+    # Each AI takes 1ms on a fake clock, so budgets are exact
+    entities: list[ActiveEntity] = []
+    clock = FakeClock()
+    perform = AIExecutor.perform
+
+    def timed_perform(self: AIExecutor, entity: ActiveEntity) -> None:
+        entities.append(entity)
+        clock.now += 0.001
+        perform(self, entity=entity)
+
+    monkeypatch.setattr(AIExecutor, "perform", timed_perform)
+    monkeypatch.setattr("yarl.ai_executor.time.perf_counter", clock)
+
+    return entities
+
+
+def test_turn_order(engine: Engine) -> None:
+    executor = engine.ai_executor
+    executor.start_turn()
+
+    enemies = list(executor.queue)
+    locations = [(entity.y, entity.x) for entity in enemies]
+
+    assert len(enemies) > 1
+    assert locations == sorted(locations)
+    assert engine.player not in enemies
+
+
+def test_run_stops_at_budget(engine: Engine, performed: list[ActiveEntity]) -> None:
+    entities = performed
+    executor = engine.ai_executor
+    executor.start_turn()
+    count = len(executor.queue)
+
+    assert not executor.run(time_budget=0.0045)
+    assert len(entities) == 5
+    assert len(executor.queue) == count - 5
+    assert executor.in_progress
+
+    # A budget that is already used up still makes progress
+    assert not executor.run(time_budget=0)
+    assert len(entities) == 6
+
+
+def test_run_resumes_turn(engine: Engine, performed: list[ActiveEntity]) -> None:
+    entities = performed
+    executor = engine.ai_executor
+    executor.start_turn()
+    enemies = list(executor.queue)
+
+    frames = 1
+
+    while not executor.run(time_budget=0.0095):
+        frames += 1
+
+    assert frames == -(-len(enemies) // 10)
+    assert entities == enemies
+    assert not executor.in_progress
+    assert executor.movement_batch is None
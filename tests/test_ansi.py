@@ -0,0 +1,98 @@
+import io
+import os
+
+import pytest
+import tcod.event
+from tcod.console import Console
+from tcod.event import KeySym, Modifier
+
+# The terminal backend is only available on POSIX systems
+pytest.importorskip("termios")
+
+from yarl.backends.ansi import AnsiBackend, AnsiRenderer, parse_input  # noqa: E402
+
+
+def test_parse_input_keys() -> None:
+    events = parse_input(b"aB?\x1b[A\x1bOD\x1b[5~\r\x1b")
+
+    assert [(event.sym, event.mod) for event in events] == [
+        (KeySym.a, Modifier.NONE),
+        (KeySym.b, Modifier.LSHIFT),
+        (KeySym.SLASH, Modifier.LSHIFT),
+        (KeySym.UP, Modifier.NONE),
+        (KeySym.LEFT, Modifier.NONE),
+        (KeySym.PAGEUP, Modifier.NONE),
+        (KeySym.RETURN, Modifier.NONE),
+        (KeySym.ESCAPE, Modifier.NONE),
+    ]
+
+
+def test_parse_input_ctrl_c_quits() -> None:
+    events = parse_input(b"\x03")
+
+    assert len(events) == 1
+    assert isinstance(events[0], tcod.event.Quit)
+
+
+def test_backend_joins_escape_sequences_split_across_reads() -> None:
+    reader, writer = os.pipe()
+
+    with open(reader, "rb") as stdin, AnsiBackend(
+        stdin=stdin, stdout=io.BytesIO()
+    ) as backend:
+        os.write(writer, b"a\x1b[")
+        events = backend.wait(timeout=0)
+        assert [event.sym for event in events] == [KeySym.a]
+
+        os.write(writer, b"5")
+        assert backend.wait(timeout=0) == []
+
+        os.write(writer, b"~\x1b")
+        events = backend.wait(timeout=0)
+        assert [event.sym for event in events] == [KeySym.PAGEUP, KeySym.ESCAPE]
+
+    os.close(writer)
+
+
+def test_renderer_writes_only_changed_cells() -> None:
+    console = Console(20, 10, order="F")
+    console.print(x=0, y=0, string="Hello", fg=(255, 0, 0), bg=(0, 0, 255))
+    renderer = AnsiRenderer()
+
+    first = renderer.render(console)
+    assert first.startswith("\x1b[0m\x1b[2J")
+    assert renderer.changed_cells == 20 * 10
+
+    assert renderer.render(console) == ""
+    assert renderer.changed_cells == 0
+
+    console.print(x=5, y=3, string="@", fg=(255, 255, 0))
+    output = renderer.render(console)
+
+    assert renderer.changed_cells == 1
+    assert output.startswith("\x1b[4;6H")
+    assert output.endswith("@")
+    assert len(output) < 50
+
+
+def test_renderer_joins_close_changes() -> None:
+    console = Console(20, 1, order="F")
+    renderer = AnsiRenderer(max_gap=2)
+    renderer.render(console)
+
+    console.print(x=0, y=0, string="a  b      c")
+    output = renderer.render(console)
+
+    # "a" and "b" are written in one run, "c" in another
+    assert output.count("\x1b[1;") == 2
+    assert "a  b" in output
+
+
+def test_renderer_reset_writes_full_frame() -> None:
+    console = Console(5, 5, order="F")
+    renderer = AnsiRenderer()
+    renderer.render(console)
+    renderer.reset()
+
+    renderer.render(console)
+    assert renderer.changed_cells == 25
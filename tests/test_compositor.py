@@ -0,0 +1,82 @@
+import pytest
+import tcod
+from tcod.console import Console
+from yarl.event_handlers import EventHandler
+from yarl.event_handlers.history import HistoryEventHandler
+from yarl.event_handlers.inventory import InventoryEventHandler
+from yarl.event_handlers.player_info import PlayerInfoEventHandler
+from yarl.game import Game
+from yarl.interface.compositor import Compositor, Layer
+
+
+def test_compositor_matches_drawing_in_order() -> None:
+    state = {"hp": 10, "hover": "Orc"}
+
+    def draw_terrain(console: Console) -> None:
+        console.draw_rect(x=0, y=0, width=10, height=5, ch=ord("."), bg=(0, 0, 100))
+
+    def draw_hud(console: Console) -> None:
+        console.print(x=0, y=5, string=f"HP: {state['hp']}", bg=(100, 0, 0))
+
+    def draw_tooltip(console: Console) -> None:
+        console.print(x=2, y=2, string=state["hover"])
+
+    layers = [
+        Layer(name="terrain", draw=draw_terrain, get_key=lambda: 0, opaque=True),
+        Layer(
+            name="hud",
+            draw=draw_hud,
+            get_key=lambda: state["hp"],
+            opaque=True,
+            region=(0, 5, 10, 1),
+        ),
+        Layer(name="tooltip", draw=draw_tooltip, get_key=lambda: state["hover"]),
+    ]
+    compositor = Compositor(layers=layers)
+
+    for hp in (10, 10, 9):
+        state["hp"] = hp
+
+        expected = tcod.console.Console(10, 6, order="F")
+        for draw in (draw_terrain, draw_hud, draw_tooltip):
+            draw(expected)
+
+        console = tcod.console.Console(10, 6, order="F")
+        compositor.render(console=console)
+
+        assert (console.rgb == expected.rgb).all()
+
+    assert [layer.redraws for layer in layers] == [1, 2, 1]
+
+
+@pytest.mark.parametrize(
+    "handler_cls",
+    [InventoryEventHandler, PlayerInfoEventHandler, HistoryEventHandler],
+)
+def test_modal_handlers_do_not_redraw_paused_game(
+    handler_cls: type[EventHandler],
+) -> None:
+    engine = Game(map_width=80, map_height=43).get_engine(seed=1)
+    console = Console(80, 50, order="F")
+
+    engine.render(console=console)
+    assert engine._compositor is not None
+
+    layers = engine._compositor.layers
+    redraws = [layer.redraws for layer in layers]
+
+    handler = handler_cls(engine)
+
+    for _ in range(3):
+        handler.on_render(console=console)
+
+    assert [layer.redraws for layer in layers] == redraws
+
+    # Hovering only redraws the names under the cursor
+    engine.mouse_location = engine.player.x + 1, engine.player.y
+    handler.on_render(console=console)
+
+    redrawn = [
+        layer.name for layer, count in zip(layers, redraws) if layer.redraws > count
+    ]
+    assert redrawn == ["tooltip"]
@@ -0,0 +1,52 @@
+import pytest
+import tcod.event
+from yarl.event_handlers import EventCoalescer, KeyRepeatPolicy
+
+
+def motion(x: int) -> tcod.event.MouseMotion:
+    return tcod.event.MouseMotion(position=(x, 0), tile=(x, 0))
+
+
+def key(sym: int, repeat: bool = False) -> tcod.event.KeyDown:
+    return tcod.event.KeyDown(scancode=0, sym=sym, mod=0, repeat=repeat)
+
+
+def test_keeps_last_mouse_motion() -> None:
+    coalescer = EventCoalescer()
+
+    click = tcod.event.MouseButtonDown(tile=(2, 0))
+    press = key(sym=tcod.event.K_a)
+
+    events = [motion(0), motion(1), press, motion(2), click, motion(3), motion(4)]
+
+    kept = coalescer.coalesce(events)
+
+    assert kept == [press, events[3], click, events[-1]]
+    assert coalescer.dropped_mouse_motions == 3
+
+
+@pytest.mark.parametrize(
+    "policy, expected",
+    [
+        (KeyRepeatPolicy.KEEP_ALL, [0, 1, 2, 3, 4]),
+        (KeyRepeatPolicy.ONE_PER_FRAME, [0, 1, 3, 4]),
+        (KeyRepeatPolicy.DROP, [0, 4]),
+    ],
+)
+def test_key_repeat_policy(policy: KeyRepeatPolicy, expected: list[int]) -> None:
+    coalescer = EventCoalescer(key_repeat_policy=policy)
+
+    left, right = tcod.event.K_LEFT, tcod.event.K_RIGHT
+
+    events = [
+        key(sym=left),
+        key(sym=left, repeat=True),
+        key(sym=left, repeat=True),
+        key(sym=right, repeat=True),
+        key(sym=right),
+    ]
+
+    kept = coalescer.coalesce(events)
+
+    assert kept == [events[i] for i in expected]
+    assert coalescer.dropped_key_repeats == len(events) - len(expected)
@@ -0,0 +1,49 @@
+from yarl.events import EventBus, GameEvent, XPEvent
+from yarl.interface.message_log import MessageLog
+
+
+def test_event_bus_dispatch() -> None:
+    bus = EventBus()
+    received = []
+
+    bus.subscribe(XPEvent, lambda event: received.append(("xp", event.xp)))
+    bus.subscribe(GameEvent, lambda event: received.append(("any", event.xp)))
+
+    bus.publish(XPEvent(entity=None, xp=10))  # type: ignore[arg-type]
+
+    # Subscribers of more general types are called first
+    assert received == [("any", 10), ("xp", 10)]
+
+
+def test_unsubscribe() -> None:
+    bus = EventBus()
+    received = []
+
+    bus.subscribe(XPEvent, received.append)
+    bus.unsubscribe(XPEvent, received.append)
+
+    bus.publish(XPEvent(entity=None, xp=10))  # type: ignore[arg-type]
+
+    assert received == []
+    assert not bus.has_subscribers(XPEvent)
+
+
+def test_messages_are_formatted_lazily() -> None:
+    message_log = MessageLog()
+    calls = []
+
+    def format_text() -> str:
+        calls.append(1)
+        return "You gain 10 experience points."
+
+    for _ in range(3):
+        message_log.add_message(text=format_text, key="xp")
+
+    assert calls == []
+    assert len(message_log.messages) == 1
+
+    message = message_log.messages[0]
+
+    assert message.full_text == "You gain 10 experience points. (x3)"
+    assert message.full_text == "You gain 10 experience points. (x3)"
+    assert calls == [1]
@@ -0,0 +1,154 @@
+import os
+import subprocess
+import sys
+from typing import Iterable
+
+import pytest
+import tcod.event
+from tcod.console import Console
+from tcod.event import Event, KeySym, Modifier
+from yarl.backends import Backend
+from yarl.game import Game
+from yarl.main import parse_args
+from yarl.timing import FramePacer
+
+
+class ScriptedBackend(Backend):
+    def __init__(self, script: list[list[Event]]) -> None:
+        self.script = script
+        self.frames = 0
+        self.timeouts: list[float | None] = []
+        self.presented: list[int] = []
+
+    def present(self, console: Console) -> None:
+        self.frames += 1
+
+    def wait(self, timeout: float | None) -> Iterable[Event]:
+        # Frames presented before each wait, to check which events caused one
+        self.presented.append(self.frames)
+        self.timeouts.append(timeout)
+
+        if not self.script:
+            raise SystemExit()
+
+        return self.script.pop(0)
+
+
+def key(sym: KeySym) -> tcod.event.KeyDown:
+    return tcod.event.KeyDown(scancode=0, sym=sym, mod=Modifier.NONE)
+
+
+def motion(x: int, y: int) -> tcod.event.MouseMotion:
+    return tcod.event.MouseMotion(tile=(x, y))
+
+
+def run(
+    game: Game,
+    script: list[list[Event]],
+    console: Console | None = None,
+    frame_pacer: FramePacer | None = None,
+) -> ScriptedBackend:
+    backend = ScriptedBackend(script=script)
+    game.run(
+        console=console or Console(100, 50, order="F"),
+        backend=backend,
+        frame_pacer=frame_pacer or FramePacer(max_fps=None),
+    )
+    return backend
+
+
+@pytest.fixture(autouse=True)
+def no_saves(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr("yarl.game.save_game", lambda engine: None)
+
+
+def test_frames_are_skipped_when_nothing_changed() -> None:
+    game = Game(map_width=80, map_height=43, turn_interval=None)
+
+    backend = run(
+        game,
+        [
+            [key(KeySym.n)],
+            [motion(5, 5)],
+            [motion(5, 5)],
+            [motion(90, 45)],
+            [motion(6, 5)],
+        ],
+    )
+
+    # Only starting the game and the first and last mouse motions change the state
+    assert backend.presented == [1, 2, 3, 3, 3, 4]
+
+
+def test_every_iteration_is_a_frame() -> None:
+    game = Game(map_width=80, map_height=43, turn_interval=None)
+    pacer = FramePacer(max_fps=None)
+    script = [[key(KeySym.n)], [motion(5, 5)], [motion(5, 5)], [motion(5, 5)]]
+
+    backend = run(game, script, frame_pacer=pacer)
+
+    # Nothing is rendered after the repeated motions, and the loop exits while
+    # waiting in the fifth iteration
+    assert backend.frames == 3
+    assert (pacer.stats.frames, pacer.stats.rendered) == (4, 3)
+    assert len(pacer.stats.frame_times) == 3
+
+
+def test_frame_keys_are_handled_by_main_game() -> None:
+    game = Game(map_width=80, map_height=43, turn_interval=None)
+    console = Console(100, 50, order="F")
+    pacer = FramePacer(max_fps=None)
+
+    # The keys do nothing in the main menu
+    run(
+        game,
+        [[key(KeySym.F10)], [key(KeySym.n)], [key(KeySym.F10)], [key(KeySym.F11)]],
+        console=console,
+        frame_pacer=pacer,
+    )
+
+    top_line = "".join(chr(c) for c in console.ch[:, 0])
+
+    assert pacer.max_fps == 30
+    assert "FPS" in top_line
+
+
+def test_loop_blocks_while_idle() -> None:
+    game = Game(map_width=80, map_height=43, turn_interval=None)
+
+    backend = run(game, [[key(KeySym.n)], [], []])
+
+    assert backend.timeouts == [None, None, None, None]
+
+
+def test_loop_wakes_up_for_enemy_turns() -> None:
+    game = Game(map_width=80, map_height=43, turn_interval=0.5)
+
+    backend = run(game, [[key(KeySym.n)]])
+
+    # The main menu waits for input, and the game for the next turn of the enemies
+    timeout = backend.timeouts[-1]
+    assert backend.timeouts[0] is None
+    assert timeout is not None and 0 < timeout <= 0.5
+
+
+@pytest.mark.parametrize(
+    ["argv", "expected"],
+    [[[], 0.5], [["--turn-interval", "1.5"], 1.5], [["--turn-interval", "0"], 0]],
+)
+def test_turn_interval_flag(argv: list[str], expected: float) -> None:
+    assert parse_args(argv).turn_interval == expected
+
+
+def test_main_imports_without_termios() -> None:
+    # Windows has no termios, which only the terminal backend needs
+    code = "import sys; sys.modules['termios'] = None; import yarl.main"
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)}
+    subprocess.run([sys.executable, "-c", code], env=env, check=True)
+
+
+def test_terminal_flag_is_rejected_on_windows(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(sys, "platform", "win32")
+
+    with pytest.raises(SystemExit):
+        parse_args(["--terminal"])
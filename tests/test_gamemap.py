@@ -1,3 +1,4 @@
+import pickle
 from unittest.mock import Mock
 
 import numpy as np
@@ -9,7 +10,7 @@ from yarl.components import AttackingAI, Fighter, Level
 from yarl.components.consumables import Consumable
 from yarl.entity import ActiveEntity, Entity, Item
 from yarl.exceptions import CollisionWithEntityException
-from yarl.map import GameMap
+from yarl.map import GameMap, MovementBatch
 
 
 @pytest.fixture
@@ -116,6 +117,25 @@ def test_update_fov(game_map: GameMap) -> None:
     assert np.all(game_map.explored == explored) == True
 
 
+def test_update_fov_is_lazy(game_map: GameMap) -> None:
+    game_map.tiles[1:99, 1:44] = tiles.floor
+
+    for x in range(10, 20):
+        game_map.update_fov(pov=(x, 22))
+
+    assert game_map.fov_version == 0
+
+    # Only the last POV is computed
+    assert game_map.visible[19, 22] and not game_map.visible[10, 22]
+    assert not game_map.explored[10, 22]
+    assert game_map.fov_version == 1
+
+    game_map.update_fov(pov=(19, 22))
+
+    assert game_map.visible[19, 22]
+    assert game_map.fov_version == 1
+
+
 def test_active_entities(
     game_map_with_entities: GameMap, active_entities: list[ActiveEntity]
 ) -> None:
@@ -379,3 +399,75 @@ def test_remove_entity_not_present_on_map(game_map_with_entities: GameMap) -> No
 
     assert old_entities == game_map_with_entities.entities
     assert old_entities_at_location == game_map_with_entities.get_entities(x=40, y=12)
+
+
+def test_movement_batch_resolve(game_map: GameMap) -> None:
+    game_map.tiles[:, 5] = tiles.floor
+
+    def make_entity(x: int) -> ActiveEntity:
+        entity = ActiveEntity(
+            fighter=Fighter(max_hp=10, base_defense=1, base_power=1),
+            level=Level(),
+            movement_delay=0,
+        )
+        game_map.add_entity(entity=entity, x=x, y=5)
+        return entity
+
+    chain = [make_entity(x) for x in (10, 11, 12)]
+    winner, loser = make_entity(20), make_entity(22)
+    swap = [make_entity(30), make_entity(31)]
+    blocked, static = make_entity(40), make_entity(41)
+
+    batch = MovementBatch(game_map=game_map)
+
+    for entity in chain:
+        assert batch.submit(entity=entity, dx=1, dy=0) is True
+
+    batch.submit(entity=winner, dx=1, dy=0)
+    batch.submit(entity=loser, dx=-1, dy=0)
+    batch.submit(entity=swap[0], dx=1, dy=0)
+    batch.submit(entity=swap[1], dx=-1, dy=0)
+    batch.submit(entity=blocked, dx=1, dy=0)
+
+    assert batch.submit(entity=static, dx=0, dy=1) is False
+
+    rejected = batch.resolve()
+
+    assert len(batch) == 0
+    assert set(rejected) == {loser, *swap, blocked}
+
+    assert [(entity.x, entity.y) for entity in chain] == [(11, 5), (12, 5), (13, 5)]
+    assert (winner.x, winner.y) == (21, 5)
+    assert (loser.x, loser.y) == (22, 5)
+    assert [(entity.x, entity.y) for entity in swap] == [(30, 5), (31, 5)]
+    assert (blocked.x, blocked.y) == (40, 5)
+
+    for entity in chain:
+        assert game_map.get_blocking_entity(x=entity.x, y=entity.y) is entity
+
+
+def test_pathfinding_get_path(game_map: GameMap) -> None:
+    game_map.tiles[10:20, 5:10] = tiles.floor
+
+    pathfinding = game_map.pathfinding
+
+    path = pathfinding.get_path(start=(10, 5), goal=(19, 5))
+
+    assert path == [(x, 5) for x in range(11, 20)]
+
+    pathfinder = pathfinding.get_pathfinder(root=(19, 5))
+
+    assert pathfinding.get_path(start=(10, 9), goal=(19, 5))[-1] == (19, 5)
+    assert pathfinding.get_pathfinder(root=(19, 5)) is pathfinder
+
+    game_map.add_entity(entity=Entity(blocking=True), x=15, y=5)
+
+    assert pathfinding.get_pathfinder(root=(19, 5)) is not pathfinder
+    assert (15, 5) not in pathfinding.get_path(start=(10, 5), goal=(19, 5))
+
+    assert pathfinding.get_path(start=(10, 5), goal=(50, 20)) == []
+
+    restored = pickle.loads(pickle.dumps(game_map))
+
+    assert restored.pathfinding.game_map is restored
+    assert restored.pathfinding.get_path(start=(10, 5), goal=(11, 5)) == [(11, 5)]
@@ -0,0 +1,54 @@
+import pytest
+import tcod.event
+from tcod.console import Console
+from tcod.event import KeySym, Modifier
+from yarl.engine import Engine
+from yarl.event_handlers.history import HistoryEventHandler
+from yarl.game import Game
+
+
+@pytest.fixture
+def engine() -> Engine:
+    engine = Game(map_width=80, map_height=43).get_engine(seed=1)
+
+    for i in range(100):
+        engine.add_to_message_log(text=f"Message {i}", fg=(255, 255, 255))
+
+    return engine
+
+
+def test_log_is_only_rendered_when_it_changes(
+    engine: Engine, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    handler = HistoryEventHandler(engine=engine)
+    console = Console(80, 50, order="F")
+
+    rendered: list[int] = []
+    render_log = handler._render_log
+
+    def count_render_log(log_console: Console) -> None:
+        rendered.append(handler.cursor)
+        render_log(log_console=log_console)
+
+    monkeypatch.setattr(handler, "_render_log", count_render_log)
+
+    handler.on_render(console=console)
+    log_console = handler._log_console
+    handler.on_render(console=console)
+
+    assert rendered == [100]
+    assert handler._log_console is log_console
+    assert log_console is not None
+    assert "Message 99" in str(log_console)
+
+    handler.ev_keydown(tcod.event.KeyDown(scancode=0, sym=KeySym.UP, mod=Modifier.NONE))
+    handler.on_render(console=console)
+
+    assert "Message 99" not in str(log_console)
+
+    engine.add_to_message_log(text="New message", fg=(255, 255, 255))
+    handler.on_render(console=console)
+    handler.on_render(console=console)
+
+    assert rendered == [100, 99, 99]
+    assert handler._log_console is log_console
@@ -0,0 +1,71 @@
+from typing import Callable
+
+import pytest
+from tcod.event import KeyDown, KeySym
+from yarl.actions import Action, BumpAction, WaitAction
+from yarl.engine import Engine
+from yarl.event_handlers import MainGameEventHandler
+from yarl.game import Game
+from yarl.timing import FixedTimestep
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def engine() -> Engine:
+    return Game(map_width=80, map_height=43).get_engine(seed=1)
+
+
+def test_pending_ticks_are_capped(engine: Engine) -> None:
+    clock = FakeClock()
+
+    # A budget of 0 only lets one enemy act per frame, so the turn stalls
+    handler = MainGameEventHandler(engine=engine, ai_time_budget=0)
+    handler.timestep = FixedTimestep(interval=0.5, max_catch_up_ticks=4, clock=clock)
+
+    for frame in range(1, 6):
+        clock.now = frame * 10.0
+        handler.post_events(backend=None)
+
+        assert engine.ai_executor.in_progress
+        assert handler.pending_ticks == (4 if frame > 1 else 3)
+
+
+def test_actions_are_queued_during_enemy_turn(
+    engine: Engine,
+    make_keydown_event: Callable[[int, int, int], KeyDown],
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    performed: list[Action] = []
+    monkeypatch.setattr(
+        engine, "handle_player_action", lambda action: performed.append(action)
+    )
+
+    handler = MainGameEventHandler(engine=engine, turn_interval=None, ai_time_budget=0)
+    handler.handle_action(action=WaitAction(engine=engine, entity=engine.player))
+
+    for sym in (KeySym.KP_5, KeySym.UP):
+        handler.handle_event(event=make_keydown_event(0, sym, 0))
+
+    assert len(performed) == 1
+    assert len(handler.queued_actions) == 2
+
+    frames = 0
+
+    while engine.ai_executor.in_progress:
+        handler.post_events(backend=None)
+        frames += 1
+
+    assert frames > 3
+    assert [type(action) for action in performed] == [
+        WaitAction,
+        WaitAction,
+        BumpAction,
+    ]
+    assert not handler.queued_actions
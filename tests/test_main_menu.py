@@ -0,0 +1,57 @@
+from pathlib import Path
+
+import numpy as np
+import pytest
+from PIL import Image
+from yarl.event_handlers import main_menu
+from yarl.event_handlers.main_menu import load_background
+
+
+@pytest.fixture
+def image_path(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> str:
+    monkeypatch.setattr(main_menu, "get_cache_path", lambda: str(tmp_path / "cache"))
+
+    pixels = np.random.default_rng(0).integers(0, 256, (20, 30, 3), dtype=np.uint8)
+    path = str(tmp_path / "background.png")
+    Image.fromarray(pixels).save(path)
+
+    return path
+
+
+def get_cache_files(image_path: str) -> list[Path]:
+    return list((Path(image_path).parent / "cache").glob("*.npy"))
+
+
+def test_background_is_loaded_from_cache(
+    image_path: str, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    expected = load_background(path=image_path, width=15, height=10)
+    assert len(get_cache_files(image_path)) == 1
+
+    def fail(*args: object, **kwargs: object) -> None:
+        raise AssertionError("The image should not be decoded.")
+
+    monkeypatch.setattr(main_menu.Image, "open", fail)
+    background = load_background(path=image_path, width=15, height=10)
+
+    assert (background.rgb == expected.rgb).all()
+
+
+@pytest.mark.parametrize("contents", [b"not an array", None], ids=["corrupt", "shape"])
+def test_background_falls_back_on_bad_cache(
+    image_path: str, contents: bytes | None
+) -> None:
+    expected = load_background(path=image_path, width=15, height=10)
+    (cache_file,) = get_cache_files(image_path)
+
+    if contents is None:
+        np.save(cache_file, np.zeros((3, 3)))
+    else:
+        cache_file.write_bytes(contents)
+
+    background = load_background(path=image_path, width=15, height=10)
+
+    assert (background.rgb == expected.rgb).all()
+
+    # The cache is written again
+    assert (np.load(cache_file) == expected.rgb).all()
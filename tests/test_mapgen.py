@@ -193,3 +193,44 @@ class TestMapGenerator:
         assert len(tuple(game_map.items)) <= max_items
 
         assert game_map.tiles[game_map.stairs_location] == tiles.stair
+
+    def test_generate_map_room_graph(self, map_generator: MapGenerator) -> None:
+        game_map = map_generator.generate_map()
+
+        room_graph = game_map.room_graph
+
+        assert room_graph.rooms == map_generator.rooms
+
+        for index, room in enumerate(room_graph.rooms):
+            assert np.all(room_graph.room_index[room.inner] == index)
+
+        walkable = game_map.tiles["walkable"]
+
+        for node, neighbors in enumerate(room_graph.edges):
+            for corridor in neighbors.values():
+                assert corridor[0] == room_graph.nodes[node]
+                assert all(walkable[x, y] for x, y in corridor)
+
+    def test_room_graph_get_path(self, map_generator: MapGenerator) -> None:
+        game_map = map_generator.generate_map()
+
+        room_graph = game_map.room_graph
+        walkable = game_map.tiles["walkable"]
+
+        start = room_graph.rooms[0].center
+
+        for room in room_graph.rooms[1:]:
+            goal = room.x1 + 1, room.y1 + 1
+
+            path = room_graph.get_path(start=start, goal=goal)
+
+            assert path[-1] == goal
+            assert len(set(path)) == len(path)
+
+            previous = start
+
+            for x, y in path:
+                assert walkable[x, y]
+                assert max(abs(x - previous[0]), abs(y - previous[1])) == 1
+
+                previous = x, y
@@ -0,0 +1,63 @@
+import pickle
+from pathlib import Path
+
+from yarl.interface.message_log import Message, MessageLog
+
+
+def test_wrap_is_cached_until_count_changes() -> None:
+    message = Message(text="The orc attacks you for 3 hit points.", fg=(255, 255, 255))
+
+    lines = message.wrap(width=20)
+
+    assert lines == ["The orc attacks you", "for 3 hit points."]
+    assert message.wrap(width=20) is lines
+
+    message.count = 2
+
+    assert message.wrap(width=20) == [
+        "The orc attacks you",
+        "for 3 hit points.",
+        "(x2)",
+    ]
+
+
+def test_pickle_drops_caches() -> None:
+    message_log = MessageLog()
+    message_log.add_message(text="Hello")
+    message_log.add_message(text="Hello")
+
+    message = message_log.messages[0]
+    message.wrap(width=10)
+
+    loaded = pickle.loads(pickle.dumps(message))
+
+    assert loaded.count == 2
+    assert loaded.wrap(width=10) == ["Hello (x2)"]
+
+
+def test_old_messages_are_archived(tmp_path: Path) -> None:
+    message_log = MessageLog(capacity=10)
+
+    for i in range(25):
+        message_log.add_message(text=f"Message {i}", fg=(i, 0, 0))
+        message_log.add_message(text=f"Message {i}", fg=(i, 0, 0))
+
+    assert len(message_log) == 25
+    assert len(message_log.messages) <= 10
+
+    first = message_log.get_message(0)
+    assert (first.full_text, first.fg) == ("Message 0 (x2)", (0, 0, 0))
+
+    texts = [message.full_text for message in message_log.get_messages(0)]
+    assert texts == [f"Message {i} (x2)" for i in range(25)]
+
+    # Messages added after saving are discarded when the save is loaded
+    message_log.archive.save(path=str(tmp_path / "messages.log"))
+    data = pickle.dumps(message_log)
+
+    for i in range(25, 40):
+        message_log.add_message(text=f"Message {i}")
+
+    loaded = pickle.loads(data)
+
+    assert [message.full_text for message in loaded.get_messages(0)] == texts
@@ -0,0 +1,73 @@
+import numpy as np
+import pytest
+import yarl.tile_types as tiles
+from tcod.console import Console
+from yarl.interface.minimap import MINIMAP_COLORS, Minimap
+from yarl.map import GameMap
+
+
+@pytest.fixture
+def game_map() -> GameMap:
+    game_map = GameMap(width=61, height=31, pov_radius=4)
+    game_map.tiles[1:-1, 1:-1] = tiles.floor
+    game_map.tiles[::6, :] = tiles.wall
+    game_map.tiles[:, 15] = tiles.floor
+    game_map.stairs_location = (40, 15)
+
+    return game_map
+
+
+def test_explored_version_only_changes_when_exploring(game_map: GameMap) -> None:
+    game_map.update_fov(pov=(10, 15))
+    game_map.refresh_fov()
+
+    assert game_map.explored_version == 1
+    assert game_map.explored_bounds == (6, 11, 15, 20)
+
+    game_map.update_fov(pov=(11, 15))
+    game_map.refresh_fov()
+    game_map.update_fov(pov=(10, 15))
+    game_map.refresh_fov()
+
+    assert game_map.explored_version == 2
+    assert game_map.fov_version == 3
+
+
+def test_minimap_updates_match_full_rebuild(game_map: GameMap) -> None:
+    minimap = Minimap(width=8, height=5)
+    console = Console(10, 10, order="F")
+
+    for x in range(3, 50):
+        game_map.update_fov(pov=(x, 15))
+        minimap.render(console=console, game_map=game_map, player=(x, 15), x=0, y=0)
+
+    assert minimap.scale == 4
+    assert minimap.get_size(game_map) == (8, 4)
+    assert minimap.full_rebuilds == 1 and minimap.partial_rebuilds > 1
+
+    rebuilt = Minimap(width=8, height=5)
+    rebuilt.update(game_map=game_map)
+
+    assert np.array_equal(minimap._pixels, rebuilt._pixels)
+
+    # Nothing has been explored at the top of the map
+    assert not minimap._pixels[:, 0].any()
+
+
+def test_minimap_render(game_map: GameMap) -> None:
+    minimap = Minimap(width=40, height=20)
+    console = Console(40, 20, order="F")
+
+    game_map.update_fov(pov=(38, 15))
+    minimap.render(console=console, game_map=game_map, player=(38, 15), x=0, y=0)
+
+    assert minimap.scale == 1
+
+    def colors(x: int, y: int) -> set[tuple[int, ...]]:
+        tile = console.rgba[x, y]
+        return {tuple(tile["fg"][:3]), tuple(tile["bg"][:3])}
+
+    # At a scale of 1, each cell shows two tiles in a row and two in a column
+    assert MINIMAP_COLORS["player"] in colors(19, 7)
+    assert MINIMAP_COLORS["stairs"] in colors(20, 7)
+    assert not console.rgba["bg"][0:10, 0:3, :3].any()
@@ -0,0 +1,70 @@
+from pathlib import Path
+
+import pytest
+from yarl.engine import Engine
+from yarl.game import Game
+from yarl.recording import ActionLog, ActionRecorder, RecordType
+from yarl.sim import Replay, Simulation, bot_policy
+
+
+def get_state(engine: Engine) -> tuple:
+    player = engine.player
+
+    return (
+        (player.x, player.y),
+        player.fighter.hp,
+        player.level.current_level,
+        player.level.current_xp,
+        engine.game_world.current_floor,
+        sorted((e.x, e.y, e.name) for e in engine.game_map.entities),
+        [message.plain_text for message in engine.message_log.messages],
+    )
+
+
+@pytest.fixture
+def recorded_game(tmp_path: Path) -> tuple[str, Engine]:
+    path = str(tmp_path / "game.rec")
+    game = Game(map_width=80, map_height=43)
+
+    simulation = Simulation(game=game, policy=bot_policy, seed=5)
+
+    with ActionRecorder(path=path, seed=5, params=game.todict()) as recorder:
+        simulation.engine.recorder = recorder
+        simulation.run(max_turns=300)
+
+    return path, simulation.engine
+
+
+def test_replay_reproduces_game(recorded_game: tuple[str, Engine]) -> None:
+    path, engine = recorded_game
+
+    frames: list[int] = []
+    replay = Replay(path=path)
+    replay.run(frame_interval=50, on_frame=lambda _: frames.append(replay.turns))
+
+    assert get_state(replay.engine) == get_state(engine)
+    assert frames[:2] == [50, 100]
+    assert frames[-1] == replay.turns
+
+
+def test_truncated_log(recorded_game: tuple[str, Engine]) -> None:
+    path, _ = recorded_game
+
+    log = ActionLog(path=path)
+    records = list(log)
+
+    assert records[-1][0] is RecordType.ENEMY_TURN
+
+    # A bump missing its dy, as left by a crash while writing it
+    with open(path, "ab") as f:
+        f.write(bytes([RecordType.BUMP, 1]))
+
+    assert list(ActionLog(path=path)) == records
+
+
+def test_invalid_log(tmp_path: Path) -> None:
+    path = tmp_path / "game.rec"
+    path.write_bytes(b"not a log at all")
+
+    with pytest.raises(ValueError):
+        ActionLog(path=str(path))
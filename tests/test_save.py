@@ -0,0 +1,77 @@
+import lzma
+import pickle
+import shutil
+from pathlib import Path
+
+import pytest
+from tcod.console import Console
+from yarl import utils
+from yarl.engine import Engine
+from yarl.exceptions import IncompatibleSaveException
+from yarl.game import Game
+from yarl.utils import (
+    GAME_SAVE_FILENAME,
+    MESSAGE_ARCHIVE_FILENAME,
+    clear_game,
+    load_game,
+    save_game,
+)
+
+
+@pytest.fixture
+def engine(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Engine:
+    monkeypatch.setattr(utils, "get_game_save_path", lambda: str(tmp_path))
+    return Game(map_width=80, map_height=43).get_engine(seed=1)
+
+
+def test_save_and_load(engine: Engine) -> None:
+    engine.render(console=Console(80, 50, order="F"))
+    save_game(engine=engine)
+
+    loaded = load_game()
+    console = Console(80, 50, order="F")
+    loaded.render(console=console)
+
+    assert (loaded.player.x, loaded.player.y) == (engine.player.x, engine.player.y)
+    assert loaded.game_map.version == engine.game_map.version
+
+    clear_game()
+
+    with pytest.raises(FileNotFoundError):
+        load_game()
+
+
+def test_unversioned_save_is_rejected(engine: Engine, tmp_path: Path) -> None:
+    # Games used to be saved as a compressed pickle without a header
+    with open(tmp_path / GAME_SAVE_FILENAME, "wb") as f:
+        f.write(lzma.compress(pickle.dumps(engine)))
+
+    with pytest.raises(IncompatibleSaveException):
+        load_game()
+
+
+def test_saves_can_be_moved(
+    engine: Engine, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    engine.message_log.capacity = 10
+
+    for i in range(25):
+        engine.message_log.add_message(text=f"Message {i}")
+
+    texts = [message.full_text for message in engine.message_log.get_messages(0)]
+    save_game(engine=engine)
+    engine.message_log.archive.close()
+
+    moved = tmp_path.parent / f"{tmp_path.name}-moved"
+    shutil.move(tmp_path, moved)
+    monkeypatch.setattr(utils, "get_game_save_path", lambda: str(moved))
+
+    loaded = load_game()
+
+    assert [m.full_text for m in loaded.message_log.get_messages(0)] == texts
+    loaded.message_log.archive.close()
+
+    clear_game()
+
+    assert not (moved / MESSAGE_ARCHIVE_FILENAME).exists()
+    assert not (moved / f"{MESSAGE_ARCHIVE_FILENAME}.idx").exists()
@@ -0,0 +1,241 @@
+import asyncio
+import json
+import socket
+from pathlib import Path
+
+import pytest
+from yarl.entity import Item
+from yarl.factories import CONSUMABLE_ITEMS
+from yarl.server import GameServer
+
+
+@pytest.fixture
+def server() -> GameServer:
+    return GameServer(max_sessions=2)
+
+
+def test_session_lifecycle(server: GameServer) -> None:
+    response = server.handle_request({"op": "new", "seed": 3, "id": "a"})
+
+    assert response["ok"] and response["id"] == "a"
+
+    session_id = response["session"]
+    state = response["state"]
+
+    assert state["full"]
+    assert state["player"]["location"] in state["visible"]
+    assert state["floors"] and state["walls"]
+    assert state["messages_from"] == 0 and len(state["messages"]) == 1
+
+    request = {"op": "act", "session": session_id, "action": {"type": "wait"}}
+    response = server.handle_request(request)
+
+    assert response["ok"] and response["performed"]
+
+    # Nothing new has been explored by waiting
+    assert not response["state"]["full"]
+    assert response["state"]["floors"] == [] and response["state"]["walls"] == []
+
+    response = server.handle_request({"op": "stats"})
+
+    assert response["stats"]["sessions"] == 1
+    assert response["stats"]["latency"]["count"] == 1
+
+    assert server.handle_request({"op": "close", "session": session_id})["ok"]
+    assert not server.handle_request({"op": "state", "session": session_id})["ok"]
+
+
+def test_invalid_requests(server: GameServer) -> None:
+    session_id = server.handle_request({"op": "new"})["session"]
+
+    for request in (
+        {"op": "fly"},
+        {"op": "act", "session": session_id, "action": {"type": "fly"}},
+        {"op": "act", "session": session_id, "action": {"type": "bump"}},
+        {"op": "act", "session": session_id, "action": {"type": "drop", "items": [0]}},
+    ):
+        response = server.handle_request(request)
+        assert not response["ok"] and response["error"]
+
+    server.handle_request({"op": "new"})
+
+    assert not server.handle_request({"op": "new"})["ok"]
+
+
+@pytest.mark.parametrize(
+    "request_",
+    [
+        {"op": "new", "params": {"map_width": "x"}},
+        {"op": "new", "params": {"map_width": 100000, "map_height": 100000}},
+        {"op": "new", "params": {"map_height": 5}},
+        {"op": "new", "params": {"room_min_size": True}},
+        {"op": "new", "params": {"turn_interval": "soon"}},
+        {"op": "new", "params": {"turn_interval": float("nan")}},
+        {"op": "new", "params": {"turn_interval": float("inf")}},
+        {"op": "new", "params": [80, 43]},
+        {"op": "new", "seed": {"value": 1}},
+        {"op": "state", "session": [1]},
+    ],
+)
+def test_invalid_params(server: GameServer, request_: dict) -> None:
+    response = server.handle_request(request_)
+
+    assert not response["ok"] and response["error"]
+    assert not server.sessions
+
+
+def test_map_size_limit() -> None:
+    server = GameServer(max_map_size=(100, 50))
+    params = {"map_width": 100, "map_height": 50}
+
+    assert server.handle_request({"op": "new", "params": params, "seed": 1})["ok"]
+
+    params["map_width"] = 101
+    assert not server.handle_request({"op": "new", "params": params})["ok"]
+
+
+@pytest.mark.parametrize("kind", ["bump", "move", "melee"])
+def test_directions_are_limited_to_adjacent_tiles(
+    server: GameServer, kind: str
+) -> None:
+    session_id = server.handle_request({"op": "new", "seed": 3})["session"]
+    session = server.sessions[session_id]
+    player = session.engine.player
+    location = player.x, player.y
+
+    for dx, dy in ((-10, -10), (2, 0), (0, -2)):
+        action = {"type": kind, "dx": dx, "dy": dy}
+        request = {"op": "act", "session": session_id, "action": action}
+        response = server.handle_request(request)
+
+        assert not response["ok"] and "direction" in response["error"]
+
+    assert (player.x, player.y) == location
+    assert session.turns == 0
+
+
+@pytest.mark.parametrize(
+    "action",
+    [
+        {"type": "bump", "dx": float("inf"), "dy": 0},
+        {"type": "bump", "dx": float("nan"), "dy": 0},
+        {"type": "move", "dx": 1.0, "dy": 0},
+        {"type": "move", "dx": "1", "dy": 0},
+        {"type": "melee", "dx": True, "dy": 0},
+        {"type": "drop", "items": [float("inf")]},
+        {"type": "drop", "items": [-1]},
+        {"type": "drop", "items": "0"},
+        {"type": "pickup", "items": [-1]},
+        {"type": "consume", "item": -1},
+        {"type": "consume", "item": 0.0},
+        {"type": "consume_targeted", "item": 0, "x": float("inf"), "y": 0},
+        {"type": "consume_targeted", "item": 0, "x": -1, "y": 0},
+    ],
+)
+def test_action_fields_are_validated(server: GameServer, action: dict) -> None:
+    session_id = server.handle_request({"op": "new", "seed": 3})["session"]
+    session = server.sessions[session_id]
+    player = session.engine.player
+
+    # Items to refer to, both in the inventory and on the ground
+    assert player.inventory is not None
+    potion = CONSUMABLE_ITEMS["healing_potion"]
+    player.inventory.items.append(Item.fromentity(other=potion))
+    session.engine.game_map.add_entity(
+        Item.fromentity(other=potion), x=player.x, y=player.y, check_blocking=False
+    )
+
+    request = {"op": "act", "session": session_id, "action": action}
+    response = server.handle_request(request)
+
+    assert not response["ok"] and response["error"]
+    assert len(player.inventory.items) == 1
+    assert session.turns == 0
+
+
+def test_unexpected_errors_are_reported(
+    server: GameServer, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    session_id = server.handle_request({"op": "new", "seed": 3})["session"]
+    session = server.sessions[session_id]
+
+    def fail(data: dict) -> bool:
+        raise RuntimeError("Something went wrong")
+
+    monkeypatch.setattr(session, "perform", fail)
+    request = {"op": "act", "session": session_id, "action": {"type": "wait"}, "id": 7}
+    response = server.handle_request(request)
+
+    assert not response["ok"] and "Something went wrong" in response["error"]
+    assert response["id"] == 7
+    assert session_id in server.sessions
+
+
+def test_serve_over_tcp(server: GameServer) -> None:
+    async def run() -> list[dict]:
+        tcp_server = await asyncio.start_server(server.handle_client, "127.0.0.1", 0)
+        port = tcp_server.sockets[0].getsockname()[1]
+
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+
+        writer.write(b'{"op": "new", "seed": 1}\n')
+        writer.write(b"not json\n")
+        writer.write(b'{"op": "act", "session": 1, "action": {"type": "bump", ')
+        writer.write(b'"dx": Infinity, "dy": 0}}\n')
+        writer.write(b'{"op": "state", "session": 1}\n')
+        await writer.drain()
+
+        responses = [json.loads(await reader.readline()) for _ in range(4)]
+
+        writer.close()
+        await writer.wait_closed()
+        tcp_server.close()
+        await tcp_server.wait_closed()
+
+        return responses
+
+    created, invalid, overflow, state = asyncio.run(run())
+
+    assert created["ok"] and created["session"] in server.sessions
+    assert not invalid["ok"]
+
+    # Bad requests are answered without closing the connection
+    assert not overflow["ok"]
+    assert state["ok"]
+
+
+@pytest.mark.skipif(not hasattr(socket, "AF_UNIX"), reason="Needs Unix sockets")
+def test_serve_over_unix_socket(server: GameServer, tmp_path: Path) -> None:
+    path = str(tmp_path / "server.sock")
+
+    # A server that crashed leaves its socket behind
+    stale = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    stale.bind(path)
+    stale.close()
+
+    async def run() -> dict:
+        task = asyncio.create_task(server.serve(path=path))
+
+        while True:
+            try:
+                reader, writer = await asyncio.open_unix_connection(path)
+                break
+            except ConnectionRefusedError:
+                await asyncio.sleep(0.01)
+
+        writer.write(b'{"op": "new", "seed": 1}\n')
+        await writer.drain()
+        response = json.loads(await reader.readline())
+
+        writer.close()
+        await writer.wait_closed()
+
+        task.cancel()
+
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+        return response
+
+    assert asyncio.run(run())["ok"]
+    assert not (tmp_path / "server.sock").exists()
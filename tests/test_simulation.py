@@ -0,0 +1,90 @@
+import random
+from pathlib import Path
+
+import pytest
+from yarl.actions import BumpAction
+from yarl.engine import Engine
+from yarl.game import Game
+from yarl.sim import RESULT_DTYPE, Simulation, run_batch, save_csv
+
+
+def random_walk_policy(engine: Engine) -> BumpAction:
+    dx, dy = random.choice([(-1, 0), (1, 0), (0, -1), (0, 1)])
+    return BumpAction(engine=engine, entity=engine.player, dx=dx, dy=dy)
+
+
+@pytest.fixture
+def game() -> Game:
+    return Game(map_width=80, map_height=43)
+
+
+def get_state(simulation: Simulation) -> tuple:
+    engine = simulation.engine
+    player = engine.player
+
+    return (
+        simulation.turns,
+        (player.x, player.y),
+        player.fighter.hp,
+        player.level.current_xp,
+        sorted((entity.x, entity.y) for entity in engine.game_map.active_entities),
+        [message.plain_text for message in engine.message_log.messages],
+    )
+
+
+def test_simulation_run(game: Game) -> None:
+    simulation = Simulation(game=game, policy=random_walk_policy, seed=7)
+
+    turns = simulation.run(max_turns=200)
+
+    assert 0 < turns <= 200
+    assert simulation.turns == turns
+    assert simulation.is_over is (turns < 200)
+
+
+def test_simulation_is_deterministic(game: Game) -> None:
+    first = Simulation(game=game, policy=random_walk_policy, seed=11)
+    first.run(max_turns=100)
+
+    second = Simulation(game=game, policy=random_walk_policy, seed=11)
+    second.run(max_turns=100)
+
+    assert get_state(first) == get_state(second)
+
+
+def test_engine_step_impossible_action(game: Game) -> None:
+    simulation = Simulation(game=game, seed=3)
+    engine = simulation.engine
+    player = engine.player
+
+    # Rooms are surrounded by walls, so walking in one direction hits one
+    for _ in range(game.map_width):
+        action = BumpAction(engine=engine, entity=player, dx=1, dy=0)
+
+        if not engine.step(action=action):
+            break
+    else:
+        pytest.fail("The player never hit a wall.")
+
+    messages = [message.plain_text for message in engine.message_log.messages]
+
+    assert "That way is blocked." in messages
+
+
+def test_run_batch(tmp_path: Path) -> None:
+    results = run_batch(games=2, seed=3, max_turns=100, processes=1)
+
+    assert results.dtype == RESULT_DTYPE
+    assert results["seed"].tolist() == [3, 4]
+    assert (results["turns"] <= 100).all()
+    assert (results["floors"] >= 1).all()
+
+    again = run_batch(games=2, seed=3, max_turns=100, processes=1)
+    assert results.tolist() == again.tolist()
+
+    path = tmp_path / "results.csv"
+    save_csv(results, str(path))
+
+    lines = path.read_text().splitlines()
+    assert lines[0].split(",") == list(RESULT_DTYPE.names)
+    assert len(lines) == 3
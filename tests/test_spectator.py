@@ -0,0 +1,163 @@
+import socket
+import time
+from pathlib import Path
+
+import numpy as np
+import pytest
+from tcod.console import Console
+from yarl.server import (
+    FrameDecoder,
+    SpectatorPublisher,
+    cells_to_console,
+    console_to_cells,
+    encode_delta,
+    encode_keyframe,
+)
+
+
+def random_console(
+    rng: np.random.Generator, width: int = 20, height: int = 10
+) -> Console:
+    console = Console(width, height, order="F")
+    tiles = console.rgba
+    tiles["ch"] = rng.integers(32, 127, size=tiles.shape)
+    tiles["fg"][..., :3] = rng.integers(0, 256, size=(*tiles.shape, 3))
+    tiles["bg"][..., :3] = rng.integers(0, 256, size=(*tiles.shape, 3))
+
+    return console
+
+
+def receive_until(
+    sock: socket.socket, decoder: FrameDecoder, expected: np.ndarray
+) -> int:
+    # Returns the number of frames received until one matches the expected one
+    received = 0
+    deadline = time.monotonic() + 10
+
+    while time.monotonic() < deadline:
+        for cells in decoder.feed(sock.recv(1 << 16)):
+            received += 1
+
+            if np.array_equal(cells, expected):
+                return received
+
+    raise AssertionError("Expected frame was not received.")
+
+
+def test_encode_and_decode() -> None:
+    rng = np.random.default_rng(0)
+    keyframe = console_to_cells(random_console(rng))
+
+    frame = keyframe.copy()
+    frame[0, 0] = frame[3, 4] = frame[9, 19] = frame[0, 1]
+    unchanged = keyframe.copy()
+
+    stream = (
+        encode_keyframe(cells=keyframe, number=0)
+        + encode_delta(cells=frame, keyframe=keyframe, number=1)
+        + encode_delta(cells=unchanged, keyframe=keyframe, number=2)
+    )
+
+    decoder = FrameDecoder()
+
+    # Messages can be split anywhere
+    frames = [cells for byte in stream for cells in decoder.feed(bytes([byte]))]
+
+    assert len(frames) == 3 and decoder.number == 2
+    assert np.array_equal(frames[0], keyframe)
+    assert np.array_equal(frames[1], frame)
+    assert np.array_equal(frames[2], keyframe)
+
+    # A delta only holds the cells that changed
+    assert len(encode_delta(cells=frame, keyframe=keyframe, number=1)) < 100
+
+    assert np.array_equal(console_to_cells(cells_to_console(frame)), frame)
+
+
+def test_decoder_skips_deltas_before_keyframe() -> None:
+    cells = console_to_cells(random_console(np.random.default_rng(1)))
+    decoder = FrameDecoder()
+
+    assert decoder.feed(encode_delta(cells=cells, keyframe=cells, number=0)) == []
+    assert len(decoder.feed(encode_keyframe(cells=cells, number=1))) == 1
+
+
+@pytest.fixture
+def publisher() -> SpectatorPublisher:
+    publisher = SpectatorPublisher(keyframe_interval=5)
+    publisher.start()
+    yield publisher
+    publisher.close()
+
+
+def test_publisher_streams_frames(publisher: SpectatorPublisher) -> None:
+    rng = np.random.default_rng(2)
+    console = random_console(rng)
+
+    clients = [socket.create_connection(publisher.address) for _ in range(2)]
+    decoders = [FrameDecoder() for _ in clients]
+
+    while publisher.subscribers < 2:
+        time.sleep(0.01)
+
+    for i in range(12):
+        console.rgba["ch"][i, 0] = ord("@")
+        publisher.publish(console)
+        expected = console_to_cells(console)
+
+        for client, decoder in zip(clients, decoders):
+            receive_until(client, decoder, expected)
+
+    # Frames are sent as deltas between keyframes
+    assert publisher.frames_encoded == 12
+    assert publisher.bytes_sent < 2 * 12 * len(encode_keyframe(expected, number=0))
+
+    for client in clients:
+        client.close()
+
+
+def test_publisher_bounds_slow_subscribers() -> None:
+    rng = np.random.default_rng(3)
+    consoles = [random_console(rng, width=100, height=50) for _ in range(4)]
+
+    with SpectatorPublisher(max_buffer_size=200_000, compression_level=0) as publisher:
+        client = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        client.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, 4096)
+        client.connect(publisher.address)
+
+        while not publisher.subscribers:
+            time.sleep(0.01)
+
+        # The client does not read while the frames are published
+        for i in range(300):
+            publisher.publish(consoles[i % len(consoles)])
+            time.sleep(0.001)
+
+        assert publisher.resyncs > 0
+
+        # It still receives a readable stream that ends with the latest frame
+        expected = console_to_cells(consoles[299 % len(consoles)])
+        receive_until(client, FrameDecoder(), expected)
+
+        client.close()
+
+
+@pytest.mark.skipif(not hasattr(socket, "AF_UNIX"), reason="Needs Unix sockets")
+def test_publisher_removes_unix_socket(tmp_path: Path) -> None:
+    path = str(tmp_path / "spectate.sock")
+
+    # A publisher that crashed leaves its socket behind
+    stale = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    stale.bind(path)
+    stale.close()
+
+    with SpectatorPublisher(path=path) as publisher:
+        client = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        client.connect(path)
+
+        while not publisher.subscribers:
+            time.sleep(0.01)
+
+        client.close()
+
+    assert not (tmp_path / "spectate.sock").exists()
@@ -0,0 +1,152 @@
+import pytest
+from yarl.timing import FixedTimestep, FramePacer, FrameStats
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock() -> FakeClock:
+    return FakeClock()
+
+
+def test_fixed_timestep_update(clock: FakeClock) -> None:
+    timestep = FixedTimestep(interval=0.5, max_catch_up_ticks=4, clock=clock)
+
+    clock.now = 0.4
+    assert timestep.update() == 0
+    assert timestep.time_until_next_tick() == pytest.approx(0.1)
+
+    clock.now = 0.6
+    assert timestep.update() == 1
+    assert timestep.lag == pytest.approx(0.1)
+
+    # A stalled frame makes several ticks due at once
+    clock.now = 1.7
+    assert timestep.update() == 2
+    assert timestep.lag == pytest.approx(0.7)
+    assert timestep.max_lag == pytest.approx(0.7)
+
+    assert timestep.ticks == 3
+    assert timestep.dropped_ticks == 0
+    assert timestep.time_until_next_tick() == pytest.approx(0.3)
+
+
+def test_fixed_timestep_catch_up_cap(clock: FakeClock) -> None:
+    timestep = FixedTimestep(interval=0.5, max_catch_up_ticks=4, clock=clock)
+
+    clock.now = 3.2
+    assert timestep.update() == 4
+    assert timestep.dropped_ticks == 2
+    assert timestep.time_until_next_tick() == pytest.approx(0.3)
+
+
+def test_fixed_timestep_reset(clock: FakeClock) -> None:
+    timestep = FixedTimestep(interval=0.5, clock=clock)
+
+    clock.now = 0.4
+    timestep.reset()
+
+    clock.now = 0.8
+    assert timestep.update() == 0
+    assert timestep.time_until_next_tick() == pytest.approx(0.1)
+
+
+@pytest.mark.parametrize(["interval", "max_catch_up_ticks"], [[0, 4], [-1, 4], [1, 0]])
+def test_fixed_timestep_invalid(interval: float, max_catch_up_ticks: int) -> None:
+    with pytest.raises(ValueError):
+        FixedTimestep(interval=interval, max_catch_up_ticks=max_catch_up_ticks)
+
+
+def test_frame_pacer_caps_frame_rate(clock: FakeClock) -> None:
+    pacer = FramePacer(max_fps=10, clock=clock)
+
+    assert pacer.time_until_next_frame() == 0
+
+    pacer.begin_frame()
+    clock.now = 0.02
+    pacer.end_frame()
+
+    assert pacer.time_until_next_frame() == pytest.approx(0.08)
+
+    # Frames stay on schedule when they start on time
+    clock.now = 0.1
+    assert pacer.time_until_next_frame() == 0
+    pacer.begin_frame()
+    pacer.end_frame()
+
+    assert pacer.time_until_next_frame() == pytest.approx(0.1)
+
+    # A late frame only catches up by one frame
+    clock.now = 0.55
+    pacer.begin_frame()
+    pacer.end_frame()
+    assert pacer.time_until_next_frame() == 0
+
+    pacer.begin_frame()
+    pacer.end_frame()
+    assert pacer.time_until_next_frame() == pytest.approx(0.1)
+
+
+def test_frame_pacer_records_every_iteration(clock: FakeClock) -> None:
+    pacer = FramePacer(max_fps=None, clock=clock)
+
+    pacer.begin_frame()
+    clock.now = 0.01
+    pacer.end_frame()
+    pacer.end_iteration()
+
+    # Iterations in which nothing is rendered are frames too
+    for _ in range(2):
+        clock.now += 0.02
+        pacer.end_iteration()
+
+    pacer.begin_frame()
+    clock.now += 0.01
+    pacer.end_frame()
+    clock.now += 0.01
+    pacer.end_iteration()
+
+    stats = pacer.stats
+
+    assert (stats.frames, stats.rendered) == (4, 2)
+    assert list(stats.frame_times) == pytest.approx([0.02, 0.02, 0.02])
+    assert list(stats.render_times) == pytest.approx([0.01, 0.01])
+    assert stats.fps == pytest.approx(50)
+
+
+def test_frame_pacer_switching_cap(clock: FakeClock) -> None:
+    pacer = FramePacer(max_fps=10, clock=clock)
+    pacer.begin_frame()
+    pacer.end_frame()
+
+    pacer.max_fps = None
+    assert pacer.time_until_next_frame() == 0
+
+    with pytest.raises(ValueError):
+        pacer.max_fps = 0
+
+
+def test_frame_stats() -> None:
+    stats = FrameStats(max_samples=100)
+
+    assert stats.todict() == {"frames": 0, "rendered": 0, "fps": 0.0}
+
+    stats.add(frame_time=None, render_time=0.001)
+
+    for i in range(200):
+        stats.add(frame_time=0.02, render_time=0.002 if i % 2 else None)
+
+    summary = stats.todict()
+
+    assert summary["frames"] == 201
+    assert summary["rendered"] == 101
+    assert summary["fps"] == pytest.approx(50)
+    assert summary["frame_p99_ms"] == pytest.approx(20)
+    assert summary["render_p50_ms"] == pytest.approx(2)
+    assert stats.summary().startswith("50.0 FPS")